@@ -26,6 +26,11 @@ TomlSource
     Reads from TOML files.
 YamlSource
     Reads from YAML files.
+DirectorySource
+    Reads from a directory of INI, TOML and YAML files, merged into one.
+SnapshotSource
+    Reads values compiled into a snapshot file by
+    :func:`~batconf.sources.snapshot.write_snapshot`.
 
 Type annotations
 ----------------
@@ -40,6 +45,8 @@ from .sources.env import EnvConfig as EnvSource
 from .sources.ini import IniSource
 from .sources.toml import TomlSource
 from .sources.yaml import YamlSource
+from .sources.directory import DirectorySource
+from .sources.snapshot import SnapshotSource
 
 __all__ = [
     # Core
@@ -54,4 +61,6 @@ __all__ = [
     'IniSource',
     'TomlSource',
     'YamlSource',
+    'DirectorySource',
+    'SnapshotSource',
 ]
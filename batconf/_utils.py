@@ -0,0 +1,55 @@
+"""
+Internal helpers, shared by the configuration and its sources.
+
+It is not part of the public API.
+"""
+
+from typing import Any, TypeVar, overload
+
+from functools import cached_property
+from threading import Lock
+
+
+_T = TypeVar('_T')
+
+
+class single_flight_property(cached_property[_T]):
+    """A cached_property which only one thread computes at a time.
+
+    Threads which get the attribute while it is being computed wait for
+    that value, rather than computing it again, ex: parsing a config file
+    once, when many threads look up values from a cold source. Once the
+    value is cached, the descriptor is no longer called, so lookups take no
+    lock. Errors are not cached; each waiting thread tries again.
+
+    The lock is held only while computing the value, and is per instance,
+    so different instances compute their values concurrently. It is kept
+    in the instance ``__dict__``, as ``<name>_lock``, until the value is
+    cached, so loaded instances can be copied and pickled.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        super().__set_name__(owner, name)
+        self._lock_name = f'{name}_lock'
+
+    @overload
+    def __get__(
+        self, instance: None, owner: type | None = None
+    ) -> 'single_flight_property[_T]': ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> _T: ...
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        cache = instance.__dict__
+        # dict.setdefault is atomic, so every thread gets the same lock
+        with cache.setdefault(self._lock_name, Lock()):
+            if self.attrname not in cache:
+                value = self.func(instance)
+                # a value set while computing, ex: by a reload, is kept
+                cache.setdefault(self.attrname, value)
+        # later lookups find the cached value, and do not need the lock
+        cache.pop(self._lock_name, None)
+        return cache[self.attrname]
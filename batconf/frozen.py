@@ -0,0 +1,121 @@
+"""Immutable snapshots of a configuration tree.
+
+:meth:`~batconf.manager.Configuration.freeze` resolves every value once and
+returns a :class:`FrozenConfiguration`. Each schema dataclass gets its own
+``__slots__`` subclass, built once by :func:`frozen_class`, so reading a
+value is a plain slot access, with no ``__getattr__`` fallback and no source
+lookups.
+"""
+
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Mapping
+
+from .schema import SchemaPlan, compile_schema
+from .types import ConfigP
+
+
+class FrozenConfiguration:
+    """Read-only snapshot of a :class:`~batconf.manager.Configuration`.
+
+    Supports the same attribute and subscript access as ``Configuration``.
+    Values are fixed when the snapshot is taken; options without a value are
+    left unset, and raise ``AttributeError`` like they do on
+    ``Configuration``. Snapshots can not be modified, so they are safe to
+    share between threads without locking.
+
+    Use :meth:`Configuration.freeze() <batconf.manager.Configuration.freeze>`
+    to create a snapshot.
+
+    Examples
+    --------
+    >>> frozen = cfg.freeze()
+    >>> frozen.database.host
+    'localhost'
+    >>> frozen['database']['host']
+    'localhost'
+    """
+
+    __slots__ = ()
+
+    _plan: SchemaPlan
+
+    if TYPE_CHECKING:
+        # Values are slots of the generated subclass, there is no fallback
+        def __getattr__(self, name: str) -> Any: ...
+
+    def __getitem__(self, name: str) -> Any:
+        return getattr(self, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is read-only')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is read-only')
+
+    def __repr__(self) -> str:
+        values = ', '.join(
+            f'{name}={getattr(self, name)!r}'
+            for name in self._plan.names
+            if hasattr(self, name)
+        )
+        return f'{self.__class__.__name__}({values})'
+
+
+_classes: dict[Any, type[FrozenConfiguration]] = {}
+_classes_lock = Lock()
+
+
+def frozen_class(config_class: ConfigP | Any) -> type[FrozenConfiguration]:
+    """Return the shared :class:`FrozenConfiguration` subclass for a schema.
+
+    The class has one slot for each field of ``config_class``, and is created
+    on first use, then cached for the lifetime of the process.
+    """
+    if (cls := _classes.get(config_class)) is not None:
+        return cls
+
+    with _classes_lock:
+        if (cls := _classes.get(config_class)) is None:
+            plan = compile_schema(config_class)
+            name = config_class.__name__  # type: ignore[union-attr]
+            cls = _classes[config_class] = type(
+                f'Frozen{name}',
+                (FrozenConfiguration,),
+                {'__slots__': plan.names, '_plan': plan},
+            )
+    return cls
+
+
+def freeze(
+    config_class: ConfigP | Any,
+    values: Mapping[str, str],
+) -> FrozenConfiguration:
+    """Build a snapshot of a schema tree from a mapping of resolved values.
+
+    Parameters
+    ----------
+    config_class : ConfigP
+        Dataclass whose fields define the configuration schema.
+    values : Mapping[str, str]
+        Resolved values, keyed by dotted path relative to ``config_class``,
+        as returned by :meth:`Configuration.resolve_all()
+        <batconf.manager.Configuration.resolve_all>`.
+
+    Returns
+    -------
+    FrozenConfiguration
+        The root of the snapshot tree.
+    """
+    root = frozen_class(config_class)()
+    stack: list[tuple[str, FrozenConfiguration]] = [('', root)]
+    while stack:
+        prefix, node = stack.pop()
+        plan = node._plan
+        for name in plan.options:
+            if (value := values.get(f'{prefix}{name}')) is not None:
+                object.__setattr__(node, name, value)
+        for name, child_class in plan.children.items():
+            child = frozen_class(child_class)()
+            object.__setattr__(node, name, child)
+            stack.append((f'{prefix}{name}.', child))
+    return root
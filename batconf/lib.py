@@ -1,7 +1,11 @@
 from typing import Callable, Protocol
-from functools import cached_property
+from dataclasses import replace
+from threading import Lock
+from time import perf_counter_ns
 
+from ._utils import single_flight_property
 from .manager import Configuration
+from .preload import PreloadTimings
 from .source import SourceList
 from .types import SourceInterfaceP, SourceListP
 
@@ -15,6 +19,11 @@ class ConfigSingleton:
     instance in multiple modules shares a single configuration object across
     the application.
 
+    :meth:`reload` replaces the Configuration with a new one, from
+    ``get_config_fn``. Each attribute access reads the current
+    Configuration; keep a reference to a sub-configuration, ex:
+    ``client_cfg = CFG.client``, for a consistent view across a reload.
+
     Parameters
     ----------
     get_config_fn : Callable[[], Configuration]
@@ -37,13 +46,120 @@ class ConfigSingleton:
 
     def __init__(self, get_config_fn: Callable) -> None:
         self._get_cfg = get_config_fn
+        self._reload_lock = Lock()
+        # reloads started, and the number of the last one published
+        self._reloads = 0
+        self._published = 0
+        self._generation = 0
 
-    @cached_property
+    @single_flight_property
     def _cfg(self) -> Configuration:
         return self._get_cfg()
 
+    @property
+    def generation(self) -> int:
+        """Number of reloads published, 0 for the first Configuration."""
+        return self._generation
+
+    def changed_since(self, generation: int) -> bool:
+        """True if a reload was published after ``generation``.
+
+        A cheap check, ex: for request handlers which keep values read from
+        the configuration, and refresh them when it changes.
+
+        Examples
+        --------
+        >>> generation = CFG.generation
+        >>> client = MyClient.from_config(CFG.client)
+        >>> if CFG.changed_since(generation):
+        ...     generation = CFG.generation
+        ...     client = MyClient.from_config(CFG.client)
+        """
+        return self._generation != generation
+
+    def reload(
+        self,
+        validate: Callable[[Configuration], object] | None = None,
+        preload: bool = True,
+    ) -> int:
+        """Build a new Configuration, and swap it in for the current one.
+
+        The new Configuration is built by ``get_config_fn``, preloaded, see
+        :meth:`Configuration.preload()
+        <batconf.manager.Configuration.preload>`, and validated, off to the
+        side. It is then published by replacing a single reference, so
+        readers see the old Configuration or the new one, and never wait.
+        Errors are raised, and the current Configuration is kept.
+
+        Concurrent reloads are serialized. A call which waited for a reload
+        that started after it was called returns without building again.
+        Sources inserted with :func:`insert_source` are not kept.
+
+        Parameters
+        ----------
+        validate : Callable[[Configuration], object] or None, default=None
+            Called with the new Configuration before it is published; raise
+            to reject it, ex: ``Configuration.materialize`` requires a value
+            for every option without a default.
+        preload : bool, default=True
+            Preload the new Configuration; when False, its sources are read
+            on first use, after it is published.
+
+        Returns
+        -------
+        int
+            Generation of the published Configuration.
+
+        Examples
+        --------
+        >>> CFG.reload(validate=Configuration.materialize)
+        1
+        """
+        requested = self._reloads
+        with self._reload_lock:
+            if self._published > requested:
+                # published by a reload which started after this call
+                return self._generation
+            self._reloads += 1
+            reload = self._reloads
+
+            cfg = self._get_cfg()
+            if preload:
+                cfg.preload()
+            if validate is not None:
+                validate(cfg)
+
+            # readers which see the new generation see the new Configuration
+            self.__dict__['_cfg'] = cfg
+            self._published = reload
+            self._generation += 1
+            return self._generation
+
+    def preload(self, freeze_gc: bool = False) -> PreloadTimings:
+        """Build the Configuration now, and preload it.
+
+        See :meth:`Configuration.preload()
+        <batconf.manager.Configuration.preload>`; the time to build the
+        Configuration is reported as ``build_ns``.
+        """
+        start = perf_counter_ns()
+        built = '_cfg' not in self.__dict__
+        cfg = self._cfg
+        build_ns = perf_counter_ns() - start if built else 0
+        return replace(cfg.preload(freeze_gc), build_ns=build_ns)
+
+    def __getstate__(self) -> dict:
+        # locks can not be copied or pickled
+        state = self.__dict__.copy()
+        del state['_reload_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._reload_lock = Lock()
+
     def _reset(self) -> None:
-        self._cfg = self._get_cfg()
+        self.reload(preload=False)
 
     def __getattr__(self, name: str):
         return getattr(self._cfg, name)
@@ -1,14 +1,21 @@
-from typing import (
-    Any,
-    Iterable,
-)
+from threading import Lock
+from typing import Any, Iterator
 
-from .source import SourceList
-from .types import ConfigP, FieldP, SourceListP
+from .frozen import FrozenConfiguration, freeze
+from .preload import PreloadTimings, preload
+from .schema import compile_schema, instantiate
+from .source import SourceList, compile_keys, get_many
+from .types import ConfigP, SourceListP
 
 
 ConfigRet = 'Configuration | str'
 
+# (SourceList generation, {key: resolved value or None})
+_CacheT = tuple[int, dict[str, str | None]]
+
+# (SourceList generation, {keys with no value})
+_MissesT = tuple[int, set[str]]
+
 
 class Configuration:
     """Resolves configuration values from an ordered :class:`SourceList`.
@@ -16,6 +23,8 @@ class Configuration:
     Values are looked up by walking the ``config_class`` dataclass schema to
     determine the dotted path, then querying each source in the
     :class:`SourceList` in priority order until a value is found.
+    Sub-configurations, for nested schema dataclasses, are built on first
+    access, so branches of a large schema which are never read cost nothing.
 
     Configuration hierarchy (highest to lowest priority):
 
@@ -33,6 +42,19 @@ class Configuration:
     path : str or None, default=None
         Dotted namespace path for this configuration node. Defaults to the
         module of ``config_class`` when not provided.
+    cache : bool, default=False
+        Cache resolved values, and misses, on each configuration node.
+        The cache is discarded whenever the :attr:`SourceList.generation`
+        changes, e.g. when :func:`~batconf.lib.insert_source` is called;
+        for other source lists without a ``generation``, it is never
+        discarded.
+        Changes made to a source in place (such as ``os.environ``) are not
+        seen until :meth:`SourceList.invalidate` is called.
+    accessors : bool, default=False
+        Use a subclass generated for each schema dataclass, with a property
+        for every field. Reading a field calls its property directly, instead
+        of falling back to ``__getattr__``. Values are still looked up from
+        the sources on every read.
 
     Examples
     --------
@@ -49,43 +71,85 @@ class Configuration:
         source_list: SourceListP,
         config_class: ConfigP | Any,
         path: str | None = None,
+        cache: bool = False,
+        accessors: bool = False,
     ):
+        self._setup(source_list, config_class, path, cache, accessors)
+
+    def _setup(
+        self,
+        source_list: SourceListP,
+        config_class: ConfigP | Any,
+        path: str | None,
+        cache: bool,
+        accessors: bool = False,
+    ) -> None:
+        if accessors:
+            self.__class__ = _accessor_class(config_class)
+
+        # passed on to the sub-configurations, see _sub_config
+        self._accessors = accessors
         self._config_sources = source_list
         self._config_class = config_class
         self.__path = path
+        self._cache: _CacheT | None = (-1, {}) if cache else None
+        self._plan = compile_schema(config_class)
 
-        self._sub_configs: dict[str, Configuration] = {
-            f.name: Configuration(
-                source_list=source_list,
-                config_class=f.type,
-                path=f'{self._path}.{f.name}',
-            )
-            for f in _fields(self._config_class)
-            if isinstance(f.type, ConfigP)
-        }
+        # Built on first access, by _sub_config
+        self._sub_configs: dict[str, Configuration] = {}
+
+        # Shared with every Configuration of this schema, do not modify.
+        self._default_values: dict[str, str] = self._plan.defaults
 
-        self._default_values: dict[str, str] = {
-            f.name: f.default
-            for f in _fields(self._config_class)
-            if isinstance(f.default, str)
-        }
+        # Keys known to have no value, see get
+        self._misses: _MissesT = (-1, set())
+
+        # Precompute each source's native key for this node's options only,
+        # so a large schema costs nothing until its nodes are used
+        if self._plan.options:
+            prefix = f'{self._path}.'
+            compile_keys(
+                source_list, (f'{prefix}{name}' for name in self._plan.options)
+            )
 
     def __getattr__(self, name: str) -> Any:
         if cfg := self._sub_configs.get(name, None):
             return cfg
+        if name in self._plan.children:
+            return self._sub_config(name)
         return self._get_config_opt(name)
 
     def __getitem__(self, name: str) -> Any:
         return self.__getattr__(name)
 
+    def _sub_config(self, name: str) -> 'Configuration':
+        if cfg := self._sub_configs.get(name, None):
+            return cfg
+
+        cfg = Configuration.__new__(Configuration)
+        cfg._setup(
+            source_list=self._config_sources,
+            config_class=self._plan.children[name],
+            path=f'{self._path}.{name}',
+            cache=self._cache is not None,
+            accessors=self._accessors,
+        )
+        # setdefault: if threads race to build a node, they all get the same
+        return self._sub_configs.setdefault(name, cfg)
+
     def _get_config_opt(self, key: str) -> str:
-        if value := self._config_sources.get(key, path=self._path):
-            return value
+        if self._cache is None:
+            value = self._resolve(key)
+        else:
+            value = self._resolve_cached(key)
 
-        if value := self._default_values.get(key, None):
+        if value is not None:
             return value
 
-        raise AttributeError(
+        raise self._not_found(key)
+
+    def _not_found(self, key: str) -> AttributeError:
+        return AttributeError(
             'required configuration value not found.\n'
             f' please provide {key}'
             ' as a commandline argument\n'
@@ -95,6 +159,227 @@ class Configuration:
             ' to your Environment'
         )
 
+    def _resolve(self, key: str) -> str | None:
+        if value := self._config_sources.get(key, path=self._path):
+            return value
+
+        return self._default_values.get(key, None) or None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of an option, or ``default`` when it has none.
+
+        Unlike attribute access, a missing value does not raise, and keys
+        known to be missing are remembered, so probing optional keys is cheap.
+        Known misses are forgotten whenever the :attr:`SourceList.generation`
+        changes. A value added to a source in place (such as ``os.environ``)
+        after a miss is not seen until :meth:`SourceList.invalidate` is called.
+
+        Parameters
+        ----------
+        key : str
+            Option name, or a dotted path relative to this node,
+            ex: ``'client.key1'``.
+        default : Any, default=None
+            Returned when the option has no value.
+
+        Returns
+        -------
+        Any
+            The option's value, a sub-configuration when ``key`` names one,
+            otherwise ``default``.
+
+        Examples
+        --------
+        >>> cfg.get('submodule.client.key1')
+        'value1'
+        >>> cfg.get('feature_flag', 'off')
+        'off'
+        """
+        node = self
+        path, _, name = key.rpartition('.')
+        if path:
+            for child in path.split('.'):
+                if child not in node._plan.children:
+                    return default
+                node = node._sub_config(child)
+
+        if name in node._plan.children:
+            return node._sub_config(name)
+
+        value = node._get_or_miss(name)
+        return default if value is None else value
+
+    def _get_or_miss(self, key: str) -> str | None:
+        if self._cache is not None:
+            return self._resolve_cached(key)
+
+        generation = _generation(self._config_sources)
+        misses_generation, misses = self._misses
+        if misses_generation != generation:
+            misses = set()
+            self._misses = (generation, misses)
+        elif key in misses:
+            return None
+
+        if (value := self._resolve(key)) is None:
+            misses.add(key)
+        return value
+
+    def _resolve_cached(self, key: str) -> str | None:
+        generation = _generation(self._config_sources)
+        cache_generation, cache = self._cache  # type: ignore[misc]
+        if cache_generation != generation:
+            # Swap in a new dict, so a lookup still in flight against the
+            # previous generation can not write a stale value into it.
+            cache = {}
+            self._cache = (generation, cache)
+
+        try:
+            return cache[key]
+        except KeyError:
+            value = cache[key] = self._resolve(key)
+            return value
+
+    def resolve_all(self) -> dict[str, str]:
+        """Resolve every option in the schema tree below this node.
+
+        Each source is queried once for the whole batch of options, using
+        :meth:`SourceList.get_many`, instead of walking the tree one key at a
+        time. Schema defaults are used for options no source has a value for.
+        With ``cache=True``, the results prime the cache of every node.
+
+        Returns
+        -------
+        dict[str, str]
+            Resolved values keyed by dotted path relative to this node,
+            ex: ``{'client.key1': 'value'}``. Options with no value are
+            omitted.
+
+        Examples
+        --------
+        >>> cfg.resolve_all()
+        {'submodule.client.key1': 'value1', 'submodule.client.key2': ...}
+        """
+        generation = -1
+        if self._cache is not None:
+            # read before the lookup, so a concurrent change is not missed
+            generation = _generation(self._config_sources)
+
+        prefix = f'{self._path}.'
+        found = get_many(
+            self._config_sources,
+            (f'{prefix}{path}' for path in self._plan.paths),
+        )
+
+        resolved: dict[str, str] = {}
+        for node in _walk(self):
+            node_prefix = f'{node._path}.'
+            values = {
+                name: (
+                    found.get(f'{node_prefix}{name}')
+                    or node._default_values.get(name, None)
+                    or None
+                )
+                for name in node._plan.options
+            }
+            if node._cache is not None:
+                node._prime_cache(generation, values)
+
+            relative_prefix = node_prefix[len(prefix):]
+            resolved.update(
+                (f'{relative_prefix}{name}', value)
+                for name, value in values.items()
+                if value is not None
+            )
+        return resolved
+
+    def freeze(self) -> FrozenConfiguration:
+        """Resolve every value below this node into an immutable snapshot.
+
+        The snapshot supports the same attribute and subscript access as the
+        Configuration, but reads are plain slot lookups, with no source
+        queries. It does not see later changes to the sources; call
+        ``freeze`` again to take a new snapshot.
+
+        Returns
+        -------
+        FrozenConfiguration
+            Read-only tree of resolved values, safe to share between threads.
+
+        Examples
+        --------
+        >>> frozen = cfg.freeze()
+        >>> frozen.submodule.client.key1
+        'value1'
+        """
+        return freeze(self._config_class, self.resolve_all())
+
+    def materialize(self) -> Any:
+        """Resolve every value below this node into ``config_class`` objects.
+
+        Builds real instances of the schema dataclasses, nested schemas
+        included, from a single :meth:`resolve_all` pass. Options with no
+        resolved value get the dataclass field's own default.
+
+        Returns
+        -------
+        Any
+            An instance of this node's ``config_class``.
+
+        Raises
+        ------
+        TypeError
+            When a required option, with no default, has no value.
+
+        Examples
+        --------
+        >>> client_config = cfg.submodule.client.materialize()
+        >>> client_config
+        ClientConfig(key1='value1', key2='value2')
+        """
+        return instantiate(self._config_class, self.resolve_all())
+
+    def preload(self, freeze_gc: bool = False) -> PreloadTimings:
+        """Do the work of first use now, ex: before forking workers.
+
+        Loads the data of every source which loads lazily, such as file
+        sources, builds every sub-configuration, and resolves every option,
+        priming the caches with ``cache=True``. Workers forked afterwards
+        inherit a fully loaded configuration, rather than each parsing the
+        config files again.
+
+        Parameters
+        ----------
+        freeze_gc : bool, default=False
+            Call :func:`gc.freeze` afterwards, so the garbage collector of
+            forked workers does not write to the pages of objects they
+            share with the parent. Every object in the process is frozen,
+            not only the configuration.
+
+        Returns
+        -------
+        PreloadTimings
+            What was loaded, and how long each step took.
+
+        Examples
+        --------
+        >>> timings = cfg.preload(freeze_gc=True)
+        >>> timings.values, timings.total_ns
+        (42, 1523000)
+        """
+        return preload(self, freeze_gc)
+
+    def _prime_cache(
+        self,
+        generation: int,
+        values: dict[str, str | None],
+    ) -> None:
+        cache_generation, cache = self._cache  # type: ignore[misc]
+        if cache_generation == generation:
+            cache.update(values)
+        else:
+            self._cache = (generation, dict(values))
+
     @property
     def _path(self) -> str:
         return self.__path if self.__path else self._module
@@ -117,10 +402,99 @@ class Configuration:
         )
 
 
-# Replacement for dataclasses.fields, typed for ConfigP
-def _fields(dataclass: ConfigP) -> Iterable[FieldP]:
-    for _, v in dataclass.__dataclass_fields__.items():
-        yield v
+# === Generated accessor classes === #
+
+
+def _option_property(key: str, default: str | None) -> property:
+    def get_option(self: Configuration) -> str:
+        if self._cache is not None:
+            return self._get_config_opt(key)
+        if value := self._config_sources.get(key, path=self._path):
+            return value
+        if default:
+            return default
+        raise self._not_found(key)
+
+    return property(get_option)
+
+
+def _accessor_getattr(self: Configuration, name: str) -> Any:
+    # Python calls __getattr__ when a property raises AttributeError; the
+    # option property has already looked the value up, so do not again
+    if name in self._accessor_options:  # type: ignore[attr-defined]
+        raise self._not_found(name)
+    return Configuration.__getattr__(self, name)
+
+
+def _child_property(name: str) -> property:
+    def get_child(self: Configuration) -> Configuration:
+        try:
+            return self._sub_configs[name]
+        except KeyError:
+            return self._sub_config(name)
+
+    return property(get_child)
+
+
+_accessor_classes: dict[Any, type[Configuration]] = {}
+_accessor_classes_lock = Lock()
+
+
+def _accessor_class(config_class: ConfigP | Any) -> type[Configuration]:
+    """Return the Configuration subclass generated for a schema dataclass.
+
+    The subclass has a property for each field of ``config_class``, so
+    reads skip the generic ``__getattr__`` lookup. Fields which share a name
+    with a Configuration attribute are left to the generic lookup, as they
+    are on ``Configuration``. Classes are created on first use, then cached
+    for the lifetime of the process.
+    """
+    if (cls := _accessor_classes.get(config_class)) is not None:
+        return cls
+
+    with _accessor_classes_lock:
+        if (cls := _accessor_classes.get(config_class)) is None:
+            plan = compile_schema(config_class)
+            namespace: dict[str, Any] = {
+                name: _option_property(name, plan.defaults.get(name))
+                for name in plan.options
+            }
+            namespace.update(
+                (name, _child_property(name)) for name in plan.children
+            )
+            for name in list(namespace):
+                if hasattr(Configuration, name):
+                    del namespace[name]
+            namespace['_accessor_options'] = frozenset(
+                name for name in plan.options if name in namespace
+            )
+            namespace['__getattr__'] = _accessor_getattr
+
+            class_name = config_class.__name__  # type: ignore[union-attr]
+            cls = _accessor_classes[config_class] = type(
+                f'{class_name}Configuration',
+                (Configuration,),
+                namespace,
+            )
+    return cls
+
+
+def _generation(source_list: SourceListP) -> int:
+    # a SourceListP with no generation counter is treated as never changing
+    return getattr(source_list, 'generation', 0)
+
+
+def _walk(configuration: Configuration) -> Iterator[Configuration]:
+    """Yield every node of a configuration tree, depth-first.
+
+    Lazy sub-configurations are built as they are reached. The tree is walked
+    iteratively, so very deep schemas do not hit the recursion limit.
+    """
+    stack = [configuration]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack += (node._sub_config(n) for n in reversed(node._plan.children))
 
 
 def _configuration_repr(
@@ -130,20 +504,19 @@ def _configuration_repr(
     attrs = []
     children = []
 
-    for field in _fields(configuration._config_class):
-        if isinstance(field.type, ConfigP):
-            children.append(
-                ''.join(('    |' * level, f'- {field.name} {field.type}:'))
-            )
+    plan = configuration._plan
+    for name in plan.names:
+        if (child := plan.children.get(name)) is not None:
+            children.append(''.join(('    |' * level, f'- {name} {child}:')))
             children += _configuration_repr(
-                getattr(configuration, field.name),
+                getattr(configuration, name),
                 level + 1,
             )
         else:
             strings = (
                 '    |' * level,
-                f'- {field.name}: ',
-                f'"{getattr(configuration, field.name, "MISSING_VALUE")}"',
+                f'- {name}: ',
+                f'"{getattr(configuration, name, "MISSING_VALUE")}"',
             )
             attrs.append(''.join(strings))
 
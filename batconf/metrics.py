@@ -0,0 +1,241 @@
+"""Lookup metrics for a :class:`~batconf.source.SourceList`.
+
+Instrumentation is opt-in, see :meth:`SourceList.enable_metrics()
+<batconf.source.SourceList.enable_metrics>`. While it is disabled the
+``SourceList`` runs its normal ``get`` method, with no overhead.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from itertools import count
+from threading import Lock
+from time import perf_counter_ns
+from typing import Sequence
+from weakref import WeakKeyDictionary
+
+from .types import SourceInterfaceP
+
+
+# Upper bounds of the latency histogram buckets, in seconds.
+BUCKETS: tuple[float, ...] = (
+    0.000_001,
+    0.000_005,
+    0.000_01,
+    0.000_05,
+    0.000_1,
+    0.000_5,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+)
+_BUCKET_BOUNDS_NS = tuple(int(bound * 1e9) for bound in BUCKETS)
+
+
+@dataclass(frozen=True)
+class LookupStats:
+    """Lookup counts and latencies for one path, from one source.
+
+    Attributes
+    ----------
+    source : str
+        Label of the source, its class name, suffixed with ``#2``, ``#3``...
+        when several sources share a class.
+    path : str
+        Fully qualified dotted path which was looked up.
+    hits : int
+        Lookups for which the source returned a value.
+    misses : int
+        Lookups for which the source had no value.
+    buckets : tuple[int, ...]
+        Number of timed lookups in each latency bucket, see :data:`BUCKETS`.
+        The last count is for lookups slower than every bound.
+    timed : int
+        Number of lookups which were timed.
+    total_ns : int
+        Total duration of the timed lookups, in nanoseconds.
+    """
+
+    source: str
+    path: str
+    hits: int
+    misses: int
+    buckets: tuple[int, ...]
+    timed: int
+    total_ns: int
+
+
+class LookupMetrics:
+    """Records per-source, per-path lookup counts and latencies.
+
+    Every lookup is counted as a hit or a miss. With ``sample=N`` only one
+    in every N lookups is timed, to keep the cost of instrumentation low.
+
+    Parameters
+    ----------
+    sample : int, default=1
+        Time one lookup in every ``sample`` lookups.
+    """
+
+    def __init__(self, sample: int = 1) -> None:
+        if sample < 1:
+            raise ValueError(f'Invalid sample: {sample}, must be at least 1')
+        self.sample = sample
+        self._lookups = count()
+        self._lock = Lock()
+        self._labels: WeakKeyDictionary[SourceInterfaceP, str] = (
+            WeakKeyDictionary()
+        )
+        # the labels of collected sources are not given to new sources
+        self._used_labels: set[str] = set()
+        # (source label, path): [hits, misses, timed, total_ns, *buckets]
+        self._counts: dict[tuple[str, str], list[int]] = {}
+
+    def get(
+        self,
+        sources: Sequence[SourceInterfaceP],
+        key: str,
+        path: str | None = None,
+    ) -> str | None:
+        """Instrumented equivalent of :meth:`SourceList.get`."""
+        timed = next(self._lookups) % self.sample == 0
+        dotted_path = f'{path}.{key}' if path else key
+        for source in sources:
+            if timed:
+                start = perf_counter_ns()
+                value = source.get(key, path)
+                elapsed_ns = perf_counter_ns() - start
+                self._record(source, dotted_path, value, elapsed_ns)
+            else:
+                value = source.get(key, path)
+                self._record(source, dotted_path, value, None)
+            if value:
+                return value
+        return None
+
+    def _record(
+        self,
+        source: SourceInterfaceP,
+        path: str,
+        value: str | None,
+        elapsed_ns: int | None,
+    ) -> None:
+        with self._lock:
+            label = self._labels.get(source) or self._label(source)
+            counts = self._counts.get((label, path))
+            if counts is None:
+                counts = self._counts[label, path] = [0] * (5 + len(BUCKETS))
+            counts[0 if value else 1] += 1
+            if elapsed_ns is not None:
+                counts[2] += 1
+                counts[3] += elapsed_ns
+                counts[4 + bisect_left(_BUCKET_BOUNDS_NS, elapsed_ns)] += 1
+
+    def _label(self, source: SourceInterfaceP) -> str:
+        label = name = source.__class__.__name__
+        for n in count(2):
+            if label not in self._used_labels:
+                break
+            label = f'{name}#{n}'
+        self._labels[source] = label
+        self._used_labels.add(label)
+        return label
+
+    def stats(self) -> list[LookupStats]:
+        """Return a snapshot of the recorded metrics.
+
+        Returns
+        -------
+        list[LookupStats]
+            One entry for each source and path which has been looked up.
+
+        Examples
+        --------
+        >>> metrics = source_list.enable_metrics()
+        >>> cfg.submodule.client.key1
+        'value1'
+        >>> metrics.stats()
+        [LookupStats(source='EnvConfig', path='bat.submodule.client.key1', ...
+        """
+        with self._lock:
+            items = [(k, list(counts)) for k, counts in self._counts.items()]
+        return [
+            LookupStats(
+                source=source,
+                path=path,
+                hits=counts[0],
+                misses=counts[1],
+                timed=counts[2],
+                total_ns=counts[3],
+                buckets=tuple(counts[4:]),
+            )
+            for (source, path), counts in items
+        ]
+
+    def reset(self) -> None:
+        """Discard every recorded metric."""
+        with self._lock:
+            self._counts.clear()
+
+
+def render_prometheus(
+    metrics: LookupMetrics,
+    prefix: str = 'batconf',
+) -> str:
+    """Render lookup metrics in the Prometheus text exposition format.
+
+    Parameters
+    ----------
+    metrics : LookupMetrics
+        Metrics recorded by a :class:`~batconf.source.SourceList`.
+    prefix : str, default='batconf'
+        Prefix for the metric names.
+
+    Returns
+    -------
+    str
+        A ``{prefix}_lookups_total`` counter, labelled by source, path and
+        result, and a ``{prefix}_lookup_duration_seconds`` histogram,
+        labelled by source and path.
+    """
+    stats = metrics.stats()
+    lookups = f'{prefix}_lookups_total'
+    duration = f'{prefix}_lookup_duration_seconds'
+
+    lines = [
+        f'# HELP {lookups} Configuration lookups, by source and result.',
+        f'# TYPE {lookups} counter',
+    ]
+    for s in stats:
+        labels = _format_labels(source=s.source, path=s.path)
+        lines.append(f'{lookups}{{{labels},result="hit"}} {s.hits}')
+        lines.append(f'{lookups}{{{labels},result="miss"}} {s.misses}')
+
+    lines += [
+        f'# HELP {duration} Duration of sampled configuration lookups.',
+        f'# TYPE {duration} histogram',
+    ]
+    for s in stats:
+        labels = _format_labels(source=s.source, path=s.path)
+        cumulative = 0
+        for bound, bucket in zip((*map(repr, BUCKETS), '+Inf'), s.buckets):
+            cumulative += bucket
+            lines.append(
+                f'{duration}_bucket{{{labels},le="{bound}"}} {cumulative}'
+            )
+        lines.append(f'{duration}_sum{{{labels}}} {s.total_ns / 1e9!r}')
+        lines.append(f'{duration}_count{{{labels}}} {s.timed}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def _format_labels(**labels: str) -> str:
+    return ','.join(
+        f'{name}="{_escape(value)}"' for name, value in labels.items()
+    )
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    )
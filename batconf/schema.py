@@ -0,0 +1,173 @@
+"""Compiled configuration schemas.
+
+Introspecting a config dataclass is done once per type by
+:func:`compile_schema`, and the resulting :class:`SchemaPlan` is shared by
+every :class:`~batconf.manager.Configuration` and
+:class:`~batconf.sources.dataclass.DataclassConfig` built from that type.
+"""
+
+from functools import cached_property
+from threading import Lock
+from typing import Any, Mapping
+
+from dataclasses import MISSING
+
+from .types import ConfigP
+
+
+class SchemaPlan:
+    """The introspected layout of a config dataclass.
+
+    Use :func:`compile_schema` to get the shared plan for a type, rather than
+    creating instances directly.
+
+    Parameters
+    ----------
+    config_class : ConfigP
+        Dataclass whose fields define the configuration schema.
+
+    Attributes
+    ----------
+    names : tuple[str, ...]
+        Every field name, in declaration order.
+    children : dict[str, ConfigP]
+        Fields whose type is itself a config dataclass, mapped to that type.
+    options : tuple[str, ...]
+        Fields which hold configuration values, every field not in
+        ``children``.
+    defaults : dict[str, str]
+        String default values declared on the schema.
+    field_defaults : dict[str, Any]
+        The declared default of every option, ``None`` when it has none.
+    """
+
+    def __init__(self, config_class: ConfigP | Any) -> None:
+        self.config_class = config_class
+
+        fields = tuple(config_class.__dataclass_fields__.values())
+        self.names: tuple[str, ...] = tuple(f.name for f in fields)
+        self.children: dict[str, ConfigP] = {
+            f.name: f.type
+            for f in fields
+            if isinstance(f.type, ConfigP)
+        }
+        self.options: tuple[str, ...] = tuple(
+            name for name in self.names if name not in self.children
+        )
+        self.defaults: dict[str, str] = {
+            f.name: f.default
+            for f in fields
+            if isinstance(f.default, str)
+        }
+        self.field_defaults: dict[str, Any] = {
+            f.name: None if f.default is MISSING else f.default
+            for f in fields
+            if f.name not in self.children
+        }
+
+    @cached_property
+    def paths(self) -> tuple[str, ...]:
+        """Dotted path of every option in the schema tree.
+
+        Paths are relative to this schema, ex: ``'client.key1'``; prefix them
+        with a Configuration's path to get the full path of each option.
+        The tree is walked iteratively, so deep schemas are supported.
+        """
+        paths: list[str] = []
+        stack: list[tuple[str, SchemaPlan]] = [('', self)]
+        while stack:
+            prefix, plan = stack.pop()
+            paths += (f'{prefix}{name}' for name in plan.options)
+            stack += (
+                (f'{prefix}{name}.', compile_schema(child))
+                for name, child in reversed(plan.children.items())
+            )
+        return tuple(paths)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.config_class!r})'
+
+
+_plans: dict[Any, SchemaPlan] = {}
+_plans_lock = Lock()
+
+
+def compile_schema(config_class: ConfigP | Any) -> SchemaPlan:
+    """Return the shared :class:`SchemaPlan` for ``config_class``.
+
+    The plan is computed on first use, then cached for the lifetime of the
+    process.
+
+    Parameters
+    ----------
+    config_class : ConfigP
+        Dataclass whose fields define the configuration schema.
+
+    Returns
+    -------
+    SchemaPlan
+        The compiled plan, shared by every caller using the same type.
+
+    Examples
+    --------
+    >>> compile_schema(ProjectConfigSchema).children
+    {'submodule': <class 'SubmoduleConfigSchema'>, ...}
+    """
+    if (plan := _plans.get(config_class)) is not None:
+        return plan
+
+    with _plans_lock:
+        if (plan := _plans.get(config_class)) is None:
+            plan = _plans[config_class] = SchemaPlan(config_class)
+    return plan
+
+
+def instantiate(config_class: ConfigP | Any, values: Mapping[str, str]) -> Any:
+    """Build an instance of a schema dataclass tree from resolved values.
+
+    Nested schema dataclasses are built first, then passed to their parent's
+    constructor, so ``slots=True`` and ``frozen=True`` dataclasses work too.
+    Options missing from ``values`` are left to the dataclass, which uses the
+    field's default or ``default_factory``.
+    Values are passed as-is, they are not converted to the field type.
+
+    Parameters
+    ----------
+    config_class : ConfigP
+        Dataclass whose fields define the configuration schema.
+    values : Mapping[str, str]
+        Resolved values, keyed by dotted path relative to ``config_class``.
+
+    Returns
+    -------
+    Any
+        An instance of ``config_class``.
+
+    Raises
+    ------
+    TypeError
+        When a required option, with no default, has no value.
+    """
+    # pre-order, so every node comes before its children
+    nodes: list[tuple[str, SchemaPlan]] = []
+    stack: list[tuple[str, SchemaPlan]] = [('', compile_schema(config_class))]
+    while stack:
+        prefix, plan = stack.pop()
+        nodes.append((prefix, plan))
+        stack += (
+            (f'{prefix}{name}.', compile_schema(child))
+            for name, child in plan.children.items()
+        )
+
+    built: dict[str, Any] = {}
+    for prefix, plan in reversed(nodes):
+        kwargs = {
+            name: values[path]
+            for name in plan.options
+            if (path := f'{prefix}{name}') in values
+        }
+        kwargs.update(
+            (name, built.pop(f'{prefix}{name}.')) for name in plan.children
+        )
+        built[prefix] = plan.config_class(**kwargs)  # type: ignore[operator]
+    return built['']
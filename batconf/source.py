@@ -1,15 +1,56 @@
 from abc import ABCMeta, abstractmethod
+from functools import partial
 
-from typing import Sequence
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Generic,
+    Iterable,
+    Sequence,
+    TypeVar,
+)
 
+from .metrics import LookupMetrics
 from .types import SourceInterfaceP, SourceListP
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 
 class SourceInterface(SourceInterfaceP, metaclass=ABCMeta):
     @abstractmethod
     def get(self, key: str, path: str | None = None) -> str | None:
         pass
 
+    def get_many(self, paths: Iterable[str]) -> dict[str, str]:
+        """Look up a batch of dotted paths, one ``get`` call per path.
+
+        Sub-classes which can answer a batch more efficiently override this.
+        See :class:`~batconf.types.BatchSourceP`.
+        """
+        return _get_each(self, paths)
+
+
+class SourceLoadError(Exception):
+    """Raised by :meth:`SourceList.warm` when sources failed to load.
+
+    Attributes
+    ----------
+    errors : list[tuple[SourceInterfaceP, BaseException]]
+        Each source which failed, in priority order, and its error; a
+        ``TimeoutError`` for sources still loading when the timeout expired.
+    """
+
+    def __init__(
+        self,
+        errors: list[tuple[SourceInterfaceP, BaseException]],
+    ) -> None:
+        self.errors = errors
+        failed = '\n'.join(
+            f'  {source!r}: {error!r}' for source, error in errors
+        )
+        super().__init__(f'{len(errors)} sources failed to load:\n{failed}')
+
 
 class SourceList:
     """An ordered list of configuration sources.
@@ -18,6 +59,10 @@ class SourceList:
     ``None`` entries in the constructor sequence are silently filtered out,
     making it easy to conditionally include sources.
 
+    The list keeps a :attr:`generation` counter which is incremented
+    whenever its sources change, so consumers which cache resolved values
+    (see ``Configuration(cache=True)``) know when to discard them.
+
     Parameters
     ----------
     sources : Sequence[SourceInterfaceP | None]
@@ -31,6 +76,10 @@ class SourceList:
 
     def __init__(self, sources: Sequence[SourceInterfaceP | None]) -> None:
         self._sources: list[SourceInterfaceP] = list(filter(None, sources))
+        self._generation = 0
+        # ordered set of every path passed to compile
+        self._compiled_paths: dict[str, None] = {}
+        self._metrics: LookupMetrics | None = None
 
     def get(self, key: str, path: str | None = None) -> str | None:
         for source in self._sources:
@@ -38,12 +87,181 @@ class SourceList:
                 return value
         return None
 
+    def get_many(self, paths: Iterable[str]) -> dict[str, str]:
+        """Look up a batch of dotted paths, with one call per source.
+
+        Each source is asked only for the paths which no higher priority
+        source has a value for.
+
+        Parameters
+        ----------
+        paths : Iterable[str]
+            Fully qualified dotted paths, ex: ``'project.client.key1'``.
+
+        Returns
+        -------
+        dict[str, str]
+            The value found for each path. Paths with no value are omitted.
+        """
+        missing = list(dict.fromkeys(paths))
+        found: dict[str, str] = {}
+        for source in self._sources:
+            if not missing:
+                break
+            found.update(
+                (path, value)
+                for path, value in get_many(source, missing).items()
+                if value
+            )
+            missing = [path for path in missing if path not in found]
+        return found
+
     def insert_source(
         self,
         source: SourceInterfaceP,
         index: int = 0,
     ) -> None:
         self._sources.insert(index, source)
+        compile_keys(source, list(self._compiled_paths))
+        self.invalidate()
+
+    def compile(self, paths: Iterable[str]) -> None:
+        """Ask each source to precompute its native key for each path.
+
+        Sources which support it, see
+        :class:`~batconf.types.CompilableSourceP`, translate each dotted path
+        to the key they look values up with once, so later lookups of those
+        paths are a single dict probe. The paths are remembered, and compiled
+        into sources inserted later on.
+        Each :class:`~batconf.manager.Configuration` node compiles the paths
+        of its own options when it is built.
+
+        Parameters
+        ----------
+        paths : Iterable[str]
+            Fully qualified dotted paths, ex: ``'project.client.key1'``.
+        """
+        new_paths = [p for p in paths if p not in self._compiled_paths]
+        if not new_paths:
+            return
+
+        self._compiled_paths.update(dict.fromkeys(new_paths))
+        for source in self._sources:
+            compile_keys(source, new_paths)
+
+    def warm(
+        self,
+        executor: 'Executor | None' = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Load the data of every source which loads lazily, concurrently.
+
+        File sources parse their file on first use; warming them at start-up
+        loads them all at once, in a thread pool, rather than one at a time
+        during the first lookups. Sources without a ``load`` method, see
+        :class:`~batconf.types.LoadableSourceP`, are skipped.
+
+        Parameters
+        ----------
+        executor : Executor or None, default=a thread per source
+            Executor to run the loads on, it is not shut down.
+        timeout : float or None, default=None
+            Seconds to wait for the sources to load. Sources still loading
+            then are reported as failed, and go on loading in the background.
+
+        Raises
+        ------
+        SourceLoadError
+            With the error of every source which failed to load, after every
+            source has finished, or the timeout expired.
+
+        Examples
+        --------
+        >>> source_list.warm(timeout=10.0)
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait
+
+        sources = [s for s in self._sources if hasattr(s, 'load')]
+        if not sources:
+            return
+
+        pool = None
+        if executor is None:
+            executor = pool = ThreadPoolExecutor(
+                len(sources), thread_name_prefix='batconf-warm'
+            )
+        try:
+            futures = [executor.submit(load_source, s) for s in sources]
+            _, pending = wait(futures, timeout)
+        finally:
+            if pool is not None:
+                # do not wait for loads which timed out
+                pool.shutdown(wait=False)
+
+        errors: list[tuple[SourceInterfaceP, BaseException]] = []
+        for source, future in zip(sources, futures):
+            if future in pending:
+                errors.append(
+                    (source, TimeoutError(f'Not loaded in {timeout}s'))
+                )
+            elif (error := future.exception()) is not None:
+                errors.append((source, error))
+        if errors:
+            raise SourceLoadError(errors)
+
+    def enable_metrics(self, sample: int = 1) -> LookupMetrics:
+        """Record hit/miss counts and latencies for each source and path.
+
+        Replaces :meth:`get` on this instance with an instrumented version,
+        until :meth:`disable_metrics` is called. While metrics are disabled
+        there is no overhead. Only ``get`` lookups are recorded, not batch
+        lookups made with :meth:`get_many`.
+
+        Parameters
+        ----------
+        sample : int, default=1
+            Time one lookup in every ``sample`` lookups. Hits and misses are
+            counted for every lookup.
+
+        Returns
+        -------
+        LookupMetrics
+            The recorder, see :meth:`LookupMetrics.stats` and
+            :func:`~batconf.metrics.render_prometheus`.
+
+        Examples
+        --------
+        >>> metrics = source_list.enable_metrics(sample=100)
+        >>> print(render_prometheus(metrics))
+        """
+        metrics = self._metrics = LookupMetrics(sample=sample)
+        # shadows the get method, so the uninstrumented path is unchanged
+        setattr(self, 'get', partial(metrics.get, self._sources))
+        return metrics
+
+    def disable_metrics(self) -> None:
+        """Stop recording metrics, and restore the normal :meth:`get`."""
+        self.__dict__.pop('get', None)
+        self._metrics = None
+
+    @property
+    def metrics(self) -> LookupMetrics | None:
+        """The active :class:`~batconf.metrics.LookupMetrics`, if enabled."""
+        return self._metrics
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented each time the sources, or their data, change."""
+        return self._generation
+
+    def invalidate(self) -> None:
+        """Signal that source data has changed.
+
+        Bumps :attr:`generation`, discarding any values cached from the
+        previous generation. Call this after modifying a source in place,
+        e.g. after changing ``os.environ`` or reloading a config file.
+        """
+        self._generation += 1
 
     def __str__(self) -> str:
         srs = (f'{src},' for src in self._sources)
@@ -52,3 +270,128 @@ class SourceList:
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}(sources={self._sources})'
+
+
+_NativeKeyT = TypeVar('_NativeKeyT')
+
+
+class KeyTable(Generic[_NativeKeyT]):
+    """Translation table from batconf keys to a source's native lookup keys.
+
+    Sources use a ``KeyTable`` to translate the ``(key, path)`` arguments of
+    ``get``, or a dotted path passed to ``get_many``, into the key they look
+    values up with; ex: an environment variable name. Compiled paths are
+    translated once, others are translated on every lookup.
+
+    Parameters
+    ----------
+    translate : Callable[[str, str | None], NativeKeyT]
+        Computes the native key from the ``key`` and ``path`` arguments of
+        ``get``.
+
+    Examples
+    --------
+    >>> env_names = KeyTable(translate=EnvSource().env_name)
+    >>> env_names.compile(['project.client.key1'])
+    >>> env_names.get('key1', 'project.client')
+    'PROJECT_CLIENT_KEY1'
+    """
+
+    def __init__(
+        self,
+        translate: Callable[[str, str | None], _NativeKeyT],
+    ) -> None:
+        self._translate = translate
+        self._by_key: dict[tuple[str, str | None], _NativeKeyT] = {}
+        self._by_path: dict[str, _NativeKeyT] = {}
+
+    def compile(self, paths: Iterable[str]) -> None:
+        """Translate each dotted path, and store the result."""
+        for dotted_path in paths:
+            key = split_path(dotted_path)
+            native_key = self._translate(*key)
+            self._by_key[key] = native_key
+            self._by_path[dotted_path] = native_key
+
+    def get(self, key: str, path: str | None = None) -> _NativeKeyT:
+        """Native key for the ``key`` and ``path`` arguments of ``get``."""
+        if (native_key := self._by_key.get((key, path))) is None:
+            native_key = self._translate(key, path)
+        return native_key
+
+    def get_path(self, dotted_path: str) -> _NativeKeyT:
+        """Native key for a dotted path, as passed to ``get_many``."""
+        if (native_key := self._by_path.get(dotted_path)) is None:
+            native_key = self._translate(*split_path(dotted_path))
+        return native_key
+
+
+def split_path(dotted_path: str) -> tuple[str, str | None]:
+    """Split a dotted path into the ``key`` and ``path`` arguments of ``get``.
+
+    Examples
+    --------
+    >>> split_path('project.client.key1')
+    ('key1', 'project.client')
+    >>> split_path('key1')
+    ('key1', None)
+    """
+    path, _, key = dotted_path.rpartition('.')
+    return key, path or None
+
+
+def join_path(key: str, path: str | None = None) -> str:
+    """Join the ``key`` and ``path`` arguments of ``get`` into a dotted path.
+
+    Examples
+    --------
+    >>> join_path('key1', 'project.client')
+    'project.client.key1'
+    >>> join_path('key1')
+    'key1'
+    """
+    return f'{path}.{key}' if path else key
+
+
+def get_many(
+    source: SourceInterfaceP,
+    paths: Iterable[str],
+) -> dict[str, str]:
+    """Look up a batch of dotted paths from any configuration source.
+
+    Uses the source's own ``get_many`` when it has one, otherwise falls back
+    to calling ``get`` for each path.
+    See :class:`~batconf.types.BatchSourceP`.
+    """
+    if (batch_get := getattr(source, 'get_many', None)) is not None:
+        return batch_get(paths)
+    return _get_each(source, paths)
+
+
+def _get_each(
+    source: SourceInterfaceP,
+    paths: Iterable[str],
+) -> dict[str, str]:
+    return {
+        path: value
+        for path in paths
+        if (value := source.get(*split_path(path))) is not None
+    }
+
+
+def compile_keys(source: SourceInterfaceP, paths: Iterable[str]) -> None:
+    """Precompute a source's native lookup keys, if the source supports it.
+
+    See :class:`~batconf.types.CompilableSourceP`.
+    """
+    if (compile_paths := getattr(source, 'compile', None)) is not None:
+        compile_paths(paths)
+
+
+def load_source(source: SourceInterfaceP) -> None:
+    """Load a source's data now, if the source loads it lazily.
+
+    See :class:`~batconf.types.LoadableSourceP`.
+    """
+    if (load := getattr(source, 'load', None)) is not None:
+        load()
@@ -1,7 +1,8 @@
-from batconf.source import SourceInterface
+from batconf.source import KeyTable, SourceInterface, join_path
 from batconf.sources._compat import deprecated_module
 
 from argparse import Namespace
+from typing import Iterable
 
 
 class NamespaceConfig(SourceInterface):
@@ -25,6 +26,7 @@ class NamespaceConfig(SourceInterface):
 
     def __init__(self, namespace: Namespace) -> None:
         self._data = namespace
+        self._attr_names = KeyTable(translate=join_path)
 
     def get(
         self,
@@ -33,8 +35,19 @@ class NamespaceConfig(SourceInterface):
         module: str | None = None,
     ) -> str | None:
         path = deprecated_module(path, module)
-        attr = '.'.join((path, key)) if path else key
-        return getattr(self._data, attr, None)
+        return getattr(self._data, self._attr_names.get(key, path), None)
+
+    def get_many(self, paths: Iterable[str]) -> dict[str, str]:
+        # Namespace attributes are the fully qualified dotted paths
+        data = self._data
+        return {
+            path: value
+            for path in paths
+            if (value := getattr(data, path, None)) is not None
+        }
+
+    def compile(self, paths: Iterable[str]) -> None:
+        self._attr_names.compile(paths)
 
     def __str__(self):
         return f'Namespace Source: {repr(self)}'
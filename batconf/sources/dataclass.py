@@ -1,14 +1,12 @@
 from typing import (
-    Iterable,
     Any,
-    cast,
+    Iterable,
     TypeAlias,
 )
 
-from dataclasses import _MISSING_TYPE
-
-from ..source import SourceInterface
-from ..types import ConfigP, FieldP
+from ..schema import compile_schema
+from ..source import SourceInterface, split_path
+from ..types import ConfigP
 from ._compat import deprecated_module
 
 
@@ -24,13 +22,12 @@ class DataclassConfig(SourceInterface):
         self._root = path if path else ConfigClass.__module__
         self._data: _DATA_DICT_TYPE = {}
 
-        for field in _fields(ConfigClass):
-            if isinstance(field.type, ConfigP):
-                self._data[field.name] = DataclassConfig(field.type)
-            elif type(field.default) is _MISSING_TYPE:
-                self._data[field.name] = None
+        plan = compile_schema(ConfigClass)
+        for name in plan.names:
+            if (child := plan.children.get(name)) is not None:
+                self._data[name] = DataclassConfig(child)
             else:
-                self._data[field.name] = cast(str, field.default)
+                self._data[name] = plan.field_defaults[name]
 
     def get(
         self,
@@ -39,6 +36,25 @@ class DataclassConfig(SourceInterface):
         module: str | None = None,
     ) -> str | None:
         path = deprecated_module(path, module)
+        return _walk(self._data, self._parts(key, path))
+
+    def get_many(self, paths: Iterable[str]) -> dict[str, str]:
+        """Look up a batch of dotted paths.
+
+        The parent of each path is walked once, and shared by its keys.
+        """
+        found: dict[str, str] = {}
+        parents: dict[tuple[str, ...], Any] = {}
+        for dotted_path in paths:
+            *parent, name = self._parts(*split_path(dotted_path))
+            if (parent_key := tuple(parent)) not in parents:
+                parents[parent_key] = _walk(self._data, parent)
+            conf = parents[parent_key]
+            if conf is not None and (value := conf.get(name)) is not None:
+                found[dotted_path] = value
+        return found
+
+    def _parts(self, key: str, path: str | None) -> list[str]:
         if path:
             parts = path.split('.') + key.split('.')
             # remove the root module
@@ -47,20 +63,17 @@ class DataclassConfig(SourceInterface):
                     parts.pop(0)
         else:
             parts = key.split('.')
-
-        # TODO: Needs a thorough review
-        # The difficulty in typing this indicates some potential issues
-        # like unexpected return values.
-        conf: _DATA_DICT_TYPE | str | None = self._data
-        for k in parts:
-            if (conf := conf.get(k)) is None:  # type: ignore
-                return conf
-        return conf  # type: ignore
+        return parts
 
 
-def _fields(dataclass: ConfigP) -> Iterable[FieldP]:
-    for _, v in dataclass.__dataclass_fields__.items():
-        yield v
+def _walk(conf: Any, parts: Iterable[str]) -> Any:
+    # TODO: Needs a thorough review
+    # The difficulty in typing this indicates some potential issues
+    # like unexpected return values.
+    for k in parts:
+        if (conf := conf.get(k)) is None:
+            return conf
+    return conf
 
 
 _VALUES: TypeAlias = DataclassConfig | str | None
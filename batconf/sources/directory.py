@@ -0,0 +1,221 @@
+"""Configuration source for a ``conf.d`` directory of config file fragments.
+
+Fragments are INI, TOML and YAML files, merged into one source, so a
+lookup is a single probe rather than one per file::
+
+    /etc/app/conf.d/
+        00-defaults.toml
+        10-database.yaml
+        50-team-overrides.ini
+"""
+
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Iterable
+
+from .._utils import single_flight_property
+from ..source import KeyTable, join_path
+from .file import FlatIndex
+from .ini import IniSource
+from .toml import TomlSource
+from .types import ConfigFileFormats, MissingFileOption
+from .yaml import YamlSource
+
+
+log = getLogger(__name__)
+
+# File source for each fragment file extension
+fragment_sources: dict[str, type[IniSource | TomlSource | YamlSource]] = {
+    '.ini': IniSource,
+    '.toml': TomlSource,
+    '.yaml': YamlSource,
+    '.yml': YamlSource,
+}
+
+
+class DirectorySource:
+    """Configuration source merged from the config files in a directory.
+
+    Every ``*.ini``, ``*.toml``, ``*.yaml`` and ``*.yml`` file in the
+    directory is parsed by the matching file source. Their values are
+    merged in the lexical order of the file names, later files taking
+    precedence, into one index. A value replaces a mapping at the same
+    path, and the reverse, as a deep merge of the files would.
+
+    Option names in INI files are lowercase, as ConfigParser reads them.
+
+    Parameters
+    ----------
+    directory : str
+        Path to the directory of config files.
+    file_format : {'environments', 'sections', 'flat'}, default='sections'
+        Layout of every file in the directory.
+    config_env : str or None, default=read from each file
+        Active configuration environment, for ``'environments'`` files.
+    missing_file_option : {'warn', 'ignore', 'error'}, default='warn'
+        Behaviour when the directory is missing.
+    max_workers : int or None, default=None
+        Maximum number of threads parsing files, see
+        :class:`concurrent.futures.ThreadPoolExecutor`. By default, files
+        are parsed concurrently only on a free-threaded build of Python;
+        parsing holds the GIL, so threads only add overhead otherwise.
+        ``1`` always parses the files serially.
+
+    Examples
+    --------
+    >>> src = DirectorySource('/etc/ourapp/conf.d')
+    >>> src.get('database.host')
+    'db.example.com'
+    >>> src.origin('database.host')
+    PosixPath('/etc/ourapp/conf.d/10-database.yaml')
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        file_format: ConfigFileFormats = 'sections',
+        config_env: str | None = None,
+        missing_file_option: MissingFileOption = 'warn',
+        max_workers: int | None = None,
+    ):
+        self._directory = Path(directory)
+        self._file_format = file_format
+        self._config_env = config_env
+        self._missing_file_option = missing_file_option
+        self._max_workers = max_workers
+        self._keys = KeyTable(translate=join_path)
+
+    def get(self, key: str, path: str | None = None) -> Any:
+        return self._index.values.get(self._keys.get(key, path))
+
+    def get_many(self, paths: Iterable[str]) -> dict[str, Any]:
+        found = {}
+        values, get_key = self._index.values, self._keys.get_path
+        for path in paths:
+            if (value := values.get(get_key(path))) is not None:
+                found[path] = value
+        return found
+
+    def compile(self, paths: Iterable[str]) -> None:
+        self._keys.compile(paths)
+
+    def paths(self, prefix: str | None = None) -> list[str]:
+        """Dotted path of every value, optionally only those under prefix."""
+        return self._index.paths(prefix)
+
+    def origin(self, path: str) -> Path | None:
+        """The file which supplied the value at the dotted path."""
+        return self._origins.get(self._keys.get_path(path))
+
+    def load(self) -> None:
+        """Parse and merge the config files now, not on the first lookup."""
+        _ = self._merged
+
+    @property
+    def fragments(self) -> list[Path]:
+        """Config files in the directory, in the order they are merged."""
+        try:
+            files = sorted(self._directory.iterdir())
+        except FileNotFoundError:
+            if self._missing_file_option == 'error':
+                raise
+            if self._missing_file_option == 'warn':
+                log.warning(f'Config directory not found: {self._directory}')
+            return []
+        return [
+            f
+            for f in files
+            if f.suffix in fragment_sources
+            and not f.name.startswith('.')
+            and f.is_file()
+        ]
+
+    @single_flight_property
+    def _merged(self) -> tuple[FlatIndex, dict[str, Path]]:
+        fragments = self.fragments
+        max_workers = self._max_workers
+        if max_workers is None and _gil_enabled():
+            max_workers = 1
+        if len(fragments) > 1 and max_workers != 1:
+            with ThreadPoolExecutor(max_workers) as executor:
+                indexes = list(executor.map(self._load, fragments))
+        else:
+            indexes = [self._load(fragment) for fragment in fragments]
+
+        values, origins = merge_indexes(zip(fragments, indexes))
+        return FlatIndex.from_paths(values), origins
+
+    @property
+    def _index(self) -> FlatIndex:
+        return self._merged[0]
+
+    @property
+    def _origins(self) -> dict[str, Path]:
+        return self._merged[1]
+
+    def _load(self, fragment: Path) -> FlatIndex:
+        source = fragment_sources[fragment.suffix](
+            file_path=str(fragment),
+            file_format=self._file_format,
+            config_env=self._config_env,
+            missing_file_option='error',
+        )
+        return source._index
+
+    def __str__(self) -> str:
+        return f'Config Directory: {repr(self)}'
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'directory={self._directory}, '
+            f'file_format={self._file_format}, '
+            f'config_env={self._config_env}, '
+            f'missing_file_option={self._missing_file_option}'
+            ')'
+        )
+
+
+def _gil_enabled() -> bool:
+    # sys._is_gil_enabled is new in Python 3.13
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+def merge_indexes(
+    indexes: Iterable[tuple[Path, FlatIndex]],
+) -> tuple[dict[str, Any], dict[str, Path]]:
+    """Deep-merge the values of file indexes, later indexes take precedence.
+
+    Returns
+    -------
+    tuple[dict[str, Any], dict[str, Path]]
+        The merged values, and the file which supplied each, by dotted path.
+    """
+    values: dict[str, Any] = {}
+    origins: dict[str, Path] = {}
+    branches: set[str] = set()
+    for fragment, index in indexes:
+        for path, value in index.values.items():
+            if path in branches:
+                # a value replaces a mapping
+                prefix = f'{path}.'
+                for p in [p for p in values if p.startswith(prefix)]:
+                    del values[p], origins[p]
+                branches -= {b for b in branches if b.startswith(prefix)}
+                branches.discard(path)
+
+            parent = path.rpartition('.')[0]
+            while parent and parent not in branches:
+                # a mapping replaces a value
+                if parent in values:
+                    del values[parent], origins[parent]
+                branches.add(parent)
+                parent = parent.rpartition('.')[0]
+
+            values[path] = value
+            origins[path] = fragment
+    return values, origins
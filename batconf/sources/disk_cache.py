@@ -0,0 +1,182 @@
+"""Persistent on-disk cache of parsed configuration files.
+
+Parsing a large file, ex: YAML with the pure-Python loader, can dominate
+the start-up time of short-lived processes. The disk cache stores parsed
+files in :mod:`marshal` format, which loads much faster, keyed by the hash
+of the file contents. It is opt-in, see :meth:`ParsedFileCache.
+enable_disk_cache() <batconf.sources.file.ParsedFileCache.enable_disk_cache>`.
+
+A cache must never break loading configuration; files which can not be
+cached, and cache files which can not be read or written, fall back to
+the parser.
+"""
+
+import marshal
+
+from hashlib import sha256
+from logging import getLogger
+from os import environ, replace, utime
+from pathlib import Path
+from typing import Any, Callable
+
+from .file import FileLoaderP, cache_codecs
+
+
+log = getLogger(__name__)
+
+# Increment when the format of cached data changes
+CACHE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+_SUFFIX = '.marshal'
+
+
+def default_cache_dir() -> Path:
+    """``$XDG_CACHE_HOME/batconf``, or ``~/.cache/batconf``."""
+    cache_home = environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'batconf'
+
+
+class DiskCache:
+    """Parsed configuration files, stored on disk.
+
+    Cache files are keyed by the contents of the configuration file, the
+    loader which parsed it, and the batconf and cache format versions. They
+    are written atomically, so concurrent processes never read a partial
+    file. When the cache grows beyond ``max_bytes`` the least recently used
+    files are removed.
+
+    Parameters
+    ----------
+    directory : Path or str or None, default=``$XDG_CACHE_HOME/batconf``
+        Directory for cache files, created when it is first written to.
+    max_bytes : int, default=16 MiB
+        Maximum total size of the cache files.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.directory = Path(directory or default_cache_dir())
+        self.max_bytes = max_bytes
+        self._version = f'{CACHE_VERSION}:{_batconf_version()}'
+
+    def load(self, loader_fn: FileLoaderP, file_path: Path) -> Any:
+        """Return the parsed file, from the disk cache when it is current.
+
+        Calls ``loader_fn`` on a cache miss, and stores its result.
+        """
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        cache_path = self._cache_path(loader_fn, content)
+        # loader objects, ex: _SelectiveReader, are registered by type
+        dump, restore = cache_codecs.get(loader_fn) or cache_codecs.get(
+            type(loader_fn), (_identity, _identity)
+        )
+
+        try:
+            parsed = restore(marshal.loads(cache_path.read_bytes()))
+        except FileNotFoundError:
+            pass
+        except Exception as err:
+            # a cache file which can not be read or restored is a miss
+            log.debug(f'Ignoring unreadable cache file {cache_path}: {err}')
+        else:
+            _touch(cache_path)
+            return parsed
+
+        parsed = loader_fn(file_path)
+        self._store(cache_path, dump, parsed)
+        return parsed
+
+    def clear(self) -> None:
+        """Remove every cache file."""
+        for cache_file in self.directory.glob(f'*{_SUFFIX}'):
+            cache_file.unlink(missing_ok=True)
+
+    def _cache_path(self, loader_fn: FileLoaderP, content: bytes) -> Path:
+        # Loader objects, ex: for one environment, differ by their repr
+        name = getattr(loader_fn, '__qualname__', None) or repr(loader_fn)
+        loader = f'{loader_fn.__module__}.{name}'
+        key = sha256(f'{self._version}:{loader}:'.encode())
+        key.update(content)
+        return self.directory / f'{key.hexdigest()}{_SUFFIX}'
+
+    def _store(
+        self,
+        cache_path: Path,
+        dump: Callable[[Any], Any],
+        parsed: Any,
+    ) -> None:
+        try:
+            data = marshal.dumps(dump(parsed))
+        except ValueError as err:
+            log.debug(f'Parsed data can not be cached: {err}')
+            return
+
+        from tempfile import NamedTemporaryFile
+
+        tmp_name = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(
+                dir=self.directory, suffix='.tmp', delete=False
+            ) as tmp:
+                tmp_name = tmp.name
+                tmp.write(data)
+            # readers see the old file, or the complete new one
+            replace(tmp_name, cache_path)
+        except OSError as err:
+            log.debug(f'Failed to write cache file {cache_path}: {err}')
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+            return
+
+        self._cleanup()
+
+    def _cleanup(self) -> None:
+        """Remove the least recently used files, until under max_bytes."""
+        files = []
+        for cache_file in self.directory.glob(f'*{_SUFFIX}'):
+            try:
+                st = cache_file.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime_ns, st.st_size, cache_file))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, cache_file in sorted(files, key=lambda f: f[0]):
+            if total <= self.max_bytes:
+                break
+            cache_file.unlink(missing_ok=True)
+            total -= size
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}(directory={self.directory}, '
+            f'max_bytes={self.max_bytes})'
+        )
+
+
+def _identity(data: Any) -> Any:
+    return data
+
+
+def _touch(cache_path: Path) -> None:
+    # Cache files are evicted by modification time, oldest first
+    try:
+        utime(cache_path)
+    except OSError:
+        pass
+
+
+def _batconf_version() -> str:
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        return version('batconf')
+    except PackageNotFoundError:
+        return 'unknown'
@@ -1,6 +1,8 @@
 import os
 
-from ..source import SourceInterface
+from typing import Iterable
+
+from ..source import KeyTable, SourceInterface
 from ._compat import deprecated_module
 
 
@@ -23,7 +25,7 @@ class EnvConfig(SourceInterface):
     """
 
     def __init__(self) -> None:
-        pass
+        self._env_names = KeyTable(translate=self.env_name)
 
     def get(
         self,
@@ -32,7 +34,18 @@ class EnvConfig(SourceInterface):
         module: str | None = None,
     ) -> str | None:
         path = deprecated_module(path, module)
-        return os.getenv(self.env_name(key, path))
+        return os.getenv(self._env_names.get(key, path))
+
+    def get_many(self, paths: Iterable[str]) -> dict[str, str]:
+        found = {}
+        for path in paths:
+            name = self._env_names.get_path(path)
+            if (value := os.environ.get(name)) is not None:
+                found[path] = value
+        return found
+
+    def compile(self, paths: Iterable[str]) -> None:
+        self._env_names.compile(paths)
 
     def env_name(self, key: str, module: str | None = None) -> str:
         if module:
@@ -1,9 +1,23 @@
-from typing import Protocol, Any
+from typing import (
+    Protocol,
+    Any,
+    Callable,
+    Mapping,
+    TYPE_CHECKING,
+)
 from logging import getLogger
 
+from collections import OrderedDict
+from copy import copy
+from os import stat
 from pathlib import Path
+from threading import Lock
 
 from .types import ConfigFileFormats, MissingFileOption
+from .watch import file_signature
+
+if TYPE_CHECKING:
+    from .disk_cache import DiskCache
 
 # backwards-compatible internal alias
 _MissingFileOption = MissingFileOption
@@ -36,7 +50,7 @@ def load_file_warn_when_missing(
     empty_fallback: Any,
 ) -> Any:
     try:
-        config = loader_fn(file_path)
+        config = parsed_files.load(loader_fn, file_path)
     except FileNotFoundError:
         log.warning(f'Config file not found: {file_path}')
         return empty_fallback
@@ -50,7 +64,7 @@ def load_file_ignore_when_missing(
     empty_fallback: Any,
 ) -> Any:
     try:
-        config = loader_fn(file_path)
+        config = parsed_files.load(loader_fn, file_path)
     except FileNotFoundError:
         return empty_fallback
 
@@ -62,7 +76,7 @@ def load_file_error_when_missing(
     file_path: Path,
     empty_fallback: Any = ...,
 ):
-    return loader_fn(file_path)
+    return parsed_files.load(loader_fn, file_path)
 
 
 missing_file_handlers: dict[str, MissingFileHandlerP] = {
@@ -72,6 +86,118 @@ missing_file_handlers: dict[str, MissingFileHandlerP] = {
 }
 
 
+# === Parsed file cache === #
+
+
+class ParsedFileCache:
+    """Process-wide cache of parsed configuration files.
+
+    File sources which read the same file, with the same loader, share one
+    parsed object. Entries are keyed by the resolved path, the loader, and
+    the modification time, size and inode of the file, so a file is parsed
+    again when it changes on disk, or is replaced. The least recently used
+    entries are evicted once there are more than ``maxsize``.
+
+    Parsed objects are shared, and must be treated as read-only.
+
+    Parameters
+    ----------
+    maxsize : int, default=32
+        Maximum number of parsed files to keep.
+    """
+
+    disk_cache: 'DiskCache | None' = None
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self.maxsize = maxsize
+        self._lock = Lock()
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+
+    def load(self, loader_fn: FileLoaderP, file_path: Path) -> Any:
+        """Return the parsed file, calling ``loader_fn`` on a cache miss.
+
+        Files which cannot be stat'd are passed to ``loader_fn`` uncached,
+        so it raises the usual errors, ex: FileNotFoundError.
+        """
+        try:
+            st = stat(file_path)
+        except OSError:
+            return loader_fn(file_path)
+
+        path = Path(file_path).resolve()
+        key = (path, loader_fn, st.st_mtime_ns, st.st_size, st.st_ino)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        # Parse outside the lock, so other files load concurrently
+        if self.disk_cache is None:
+            parsed = loader_fn(file_path)
+        else:
+            parsed = self.disk_cache.load(loader_fn, file_path)
+        with self._lock:
+            self._entries[key] = parsed
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return parsed
+
+    def clear(self) -> None:
+        """Discard every parsed file."""
+        with self._lock:
+            self._entries.clear()
+
+    def enable_disk_cache(
+        self,
+        directory: Path | str | None = None,
+        max_bytes: int | None = None,
+    ) -> 'DiskCache':
+        """Persist parsed files on disk, to skip parsing in new processes.
+
+        Parameters
+        ----------
+        directory : Path or str or None, default=``$XDG_CACHE_HOME/batconf``
+            Directory for cache files.
+        max_bytes : int or None, default=16 MiB
+            Maximum total size of the cache files.
+
+        Returns
+        -------
+        DiskCache
+            The enabled cache, see :mod:`batconf.sources.disk_cache`.
+
+        Examples
+        --------
+        >>> from batconf.sources.file import parsed_files
+        >>> parsed_files.enable_disk_cache()
+        DiskCache(directory=/home/user/.cache/batconf, max_bytes=16777216)
+        """
+        from .disk_cache import DiskCache, DEFAULT_MAX_BYTES
+
+        self.disk_cache = DiskCache(
+            directory=directory,
+            max_bytes=DEFAULT_MAX_BYTES if max_bytes is None else max_bytes,
+        )
+        return self.disk_cache
+
+    def disable_disk_cache(self) -> None:
+        """Stop using the disk cache; existing cache files are kept."""
+        self.disk_cache = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+parsed_files = ParsedFileCache()
+
+# (dump, restore) functions, which convert the data returned by a loader to
+# and from builtin types the disk cache can store, ex: for ConfigParser.
+# Keyed by loader function, or by the type of loader objects
+CacheCodecT = tuple[Callable[[Any], Any], Callable[[Any], Any]]
+cache_codecs: dict[FileLoaderP | type, CacheCodecT] = {}
+
+
 class FileConfigReprP(Protocol):
     _config_file_path: Path | str | None
     _config_env: str | None
@@ -88,3 +214,159 @@ def file_config_repr(self: FileConfigReprP) -> str:
         f'file_format={self._file_format}'
         ')'
     )
+
+
+# === Loading and reloading === #
+
+# cached properties which hold the data of a file source, in the order
+# they are computed; readers only use _index, so it is replaced last
+_FILE_DATA_ATTRS = ('_file_signature', '_raw_data', '_data', '_index')
+
+
+def record_file_signature(self: Any) -> None:
+    """Record the signature of the config file, before it is read.
+
+    Called by the ``_raw_data`` property of file sources; a signature
+    recorded by a reload, while the file was being read, is kept.
+    """
+    self.__dict__.setdefault(
+        '_file_signature', file_signature(self._config_file_path)
+    )
+
+
+def load_file_source(self: Any) -> None:
+    """Read and index the config file now, rather than on the first lookup.
+
+    Does nothing if the data is already loaded.
+    """
+    _ = self._index
+
+
+def reload_file_source(self: Any) -> bool:
+    """Read the config file again, and swap in its data if it changed.
+
+    The file is only read if its modification time, size or inode changed
+    since it was last read. The new data is loaded on a copy of the source,
+    then published by replacing references, so concurrent lookups see the
+    old data or the new data, and never wait. The environment is not
+    changed; it is re-read from the file only if it was never resolved.
+    Errors, ex: from parsing an invalid file, are raised, and the old
+    data is kept.
+
+    Returns
+    -------
+    bool
+        True if the data changed.
+    """
+    loaded = self.__dict__
+    if (
+        '_index' in loaded
+        and '_file_signature' in loaded
+        and loaded['_file_signature'] == file_signature(self._config_file_path)
+    ):
+        return False
+
+    fresh = copy(self)
+    for attr in _FILE_DATA_ATTRS:
+        fresh.__dict__.pop(attr, None)
+        # the copy loads on its own, not after a load in progress on self
+        fresh.__dict__.pop(f'{attr}_lock', None)
+    _ = fresh._index
+
+    for attr in _FILE_DATA_ATTRS:
+        setattr(self, attr, fresh.__dict__[attr])
+    return True
+
+
+# === Flattened file data === #
+
+
+class FlatIndex:
+    """Flattened view of nested configuration data, keyed by dotted path.
+
+    File sources build an index once, when their data is loaded, so looking
+    up a value is a single dict lookup, whatever its depth.
+
+    Parameters
+    ----------
+    data : Mapping[str, Any]
+        Nested mappings of configuration values, ex: parsed YAML.
+
+    Attributes
+    ----------
+    values : dict[str, Any]
+        Every leaf value, keyed by its dotted path, in document order.
+    branches : set[str]
+        Dotted path of every nested mapping.
+    errors : dict[str, Exception]
+        Values which could not be read, keyed by dotted path, ex: INI
+        options which fail to interpolate. Sources raise the error when the
+        value is looked up.
+
+    Examples
+    --------
+    >>> index = FlatIndex({'project': {'client': {'key1': 'value1'}}})
+    >>> index.values
+    {'project.client.key1': 'value1'}
+    """
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        self.values: dict[str, Any] = {}
+        self.branches: set[str] = set()
+        self.errors: dict[str, Exception] = {}
+
+        # walked iteratively, so deeply nested data is supported
+        stack = [('', iter(data.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
+                path = f'{prefix}{key}'
+                if isinstance(value, Mapping):
+                    self.branches.add(path)
+                    stack.append((f'{path}.', iter(value.items())))
+                    break
+                self.values[path] = value
+            else:
+                stack.pop()
+
+    @classmethod
+    def from_paths(
+        cls,
+        values: dict[str, Any],
+        errors: dict[str, Exception] | None = None,
+    ) -> 'FlatIndex':
+        """Index values which are already keyed by dotted path.
+
+        Used for formats with no nested data, ex: the sections of INI files.
+        """
+        index = cls({})
+        index.values = values
+        index.errors = errors or {}
+        for path in values:
+            parent = path.rpartition('.')[0]
+            while parent and parent not in index.branches:
+                index.branches.add(parent)
+                parent = parent.rpartition('.')[0]
+        return index
+
+    def has_parent(self, path: str) -> bool:
+        """True if ``path`` is top-level, or its parent is a nested mapping.
+
+        Used to tell a missing option apart from a path which passes through
+        a value, or through a missing mapping.
+        """
+        parent, _, _ = path.rpartition('.')
+        return not parent or parent in self.branches
+
+    def paths(self, prefix: str | None = None) -> list[str]:
+        """Dotted path of every value, optionally only those under ``prefix``.
+
+        Examples
+        --------
+        >>> index.paths('project')
+        ['project.client.key1']
+        """
+        if not prefix:
+            return list(self.values)
+        start = f'{prefix}.'
+        return [path for path in self.values if path.startswith(start)]
@@ -1,11 +1,21 @@
 from functools import cached_property
-from typing import Literal, Protocol, Callable
+from typing import Iterable, Literal, Protocol, Callable, TextIO
 from logging import getLogger
 
-from configparser import ConfigParser
+from configparser import (
+    BasicInterpolation,
+    ConfigParser,
+    ExtendedInterpolation,
+    Interpolation,
+    InterpolationError,
+)
+from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 from enum import Enum, auto
 
+from .._utils import single_flight_property
+from ..source import KeyTable, join_path
 from .types import FileSourceP
 from .file import (
     ConfigFileFormats,
@@ -13,6 +23,11 @@ from .file import (
     FileLoaderP,
     missing_file_handlers as _missing_file_handlers,
     file_config_repr,
+    load_file_source,
+    record_file_signature,
+    reload_file_source,
+    FlatIndex,
+    cache_codecs as _cache_codecs,
 )
 from ._compat import make_deprecated_getattr
 
@@ -26,6 +41,11 @@ class _DEFAULTS(Enum):
 
 _EnvOpts = str | Literal[_DEFAULTS.environment] | None
 
+IniReaderOption = Literal['configparser', 'selective']
+_INI_READERS = ('configparser', 'selective')
+
+InterpolationOption = Literal['none', 'basic', 'extended']
+
 
 class ConfigParserP(Protocol):
     def get(
@@ -36,74 +56,124 @@ class ConfigParserP(Protocol):
     ) -> str | None: ...
 
 
-# === IniConfig Get Methods === #
+# === IniConfig Index === #
+# The options of the selected environment are flattened into a FlatIndex,
+# keyed by dotted path, when the file is loaded. Interpolation is applied
+# once, as the index is built; options which fail to interpolate are kept
+# as errors of the index, and raised when they are looked up.
 
+_interpolations: dict[str, Interpolation | None] = {
+    'none': None,
+    'basic': BasicInterpolation(),  # the loaders' ConfigParser default
+    'extended': ExtendedInterpolation(),
+}
 
-class _ConfigParserSource(Protocol):
-    _config_env: _EnvOpts
-    _data: ConfigParser
+# the value of an option, or the error from interpolating it
+_IndexValue = str | InterpolationError
 
 
-def _get_envs(
-    self: _ConfigParserSource,
-    key: str,
-    path: str | None = None,
-) -> str | None:
-    if path:
-        key = f'{path}.{key}'
+def _section_items(
+    parser: ConfigParser,
+    section: str,
+    interpolation: InterpolationOption = 'basic',
+) -> Iterable[tuple[str, _IndexValue]]:
+    """Options of the section, including DEFAULT, with interpolation.
 
+    Options which fail to interpolate have the InterpolationError as their
+    value.
+    """
+    items = parser.items(section, raw=True)
+    if (interp := _interpolations[interpolation]) is None:
+        return items
+    values = dict(items)
+    return [
+        (option, _interpolate(interp, parser, section, option, values))
+        for option, _ in items
+    ]
+
+
+def _interpolate(
+    interp: Interpolation,
+    parser: ConfigParser,
+    section: str,
+    option: str,
+    values: dict[str, str],
+) -> _IndexValue:
     try:
-        section, key = key.rsplit(sep='.', maxsplit=1)
-    except ValueError:
-        # Type checking should be fixed in the next MyPy release
-        section = self._config_env  # type: ignore[assignment]
-    else:
-        section = f'{self._config_env}.{section}'
-
-    return self._data.get(
-        option=key,
-        section=section,
-        fallback=None,
-    )
-
-
-def _get_sections(
-    self: _ConfigParserSource,
-    key: str,
-    path: str | None = None,
-) -> str | None:
-    if path:
-        key = f'{path}.{key}'
+        return interp.before_get(
+            parser, section, option, values[option], values
+        )
+    except InterpolationError as err:
+        return err
+
+
+def _envs_index(
+    parser: ConfigParser,
+    config_env: str,
+    interpolation: InterpolationOption = 'basic',
+) -> dict[str, _IndexValue]:
+    prefix = f'{config_env}.'
+    values = {}
+    for section in parser.sections():
+        if section == config_env:
+            path = ''
+        elif section.startswith(prefix):
+            path = f'{section.removeprefix(prefix)}.'
+        else:
+            continue
+        for option, value in _section_items(parser, section, interpolation):
+            values[f'{path}{option}'] = value
+    return values
+
+
+def _sections_index(
+    parser: ConfigParser,
+    config_env: str | None,
+    interpolation: InterpolationOption = 'basic',
+) -> dict[str, _IndexValue]:
+    return {
+        f'{section}.{option}': value
+        for section in (parser.default_section, *parser.sections())
+        for option, value in _section_items(parser, section, interpolation)
+    }
+
+
+def _flat_index(
+    parser: ConfigParser,
+    config_env: str | None,
+    interpolation: InterpolationOption = 'basic',
+) -> dict[str, _IndexValue]:
+    return dict(_section_items(parser, 'root', interpolation))
+
+
+_index_methods: dict[str, Callable[..., dict[str, _IndexValue]]] = {
+    'environments': _envs_index,
+    'sections': _sections_index,
+    'flat': _flat_index,
+}
 
-    try:
-        section, key = key.rsplit(sep='.', maxsplit=1)
-    except ValueError:
-        section = ''
 
-    return self._data.get(section=section, option=key, fallback=None)
+# === IniConfig Key Methods === #
+# Translate the key and path arguments of get into an index path
 
 
-def _get_flat(
-    self: _ConfigParserSource,
-    key: str,
-    path: str | None = None,
-) -> str | None:
-    return self._data.get(section='root', option=key, fallback=None)
+def _option_path(key: str, path: str | None = None) -> str:
+    # ConfigParser option names are case-insensitive, section names are not
+    section, _, option = join_path(key, path).rpartition('.')
+    if section:
+        return f'{section}.{option.lower()}'
+    return option.lower()
 
 
-def _get_empty(
-    self: _ConfigParserSource,
-    key: str,
-    path: str | None = None,
-) -> str | None:
-    return None
+def _flat_option(key: str, path: str | None = None) -> str:
+    # Flat files have a single section, dotted keys are taken literally
+    return key.lower()
 
 
-_getter_methods = {
-    'environments': _get_envs,
-    'sections': _get_sections,
-    'flat': _get_flat,
-    'empty': _get_empty,
+_key_methods: dict[str, Callable[..., str]] = {
+    'environments': _option_path,
+    'sections': _option_path,
+    'flat': _flat_option,
 }
 
 
@@ -127,6 +197,19 @@ class IniSource(FileSourceP):
         ``batconf.default_env`` in the INI file is used.
     missing_file_option : {'warn', 'ignore', 'error'}, default='warn'
         Behaviour when the specified file is missing.
+    ini_reader : {'configparser', 'selective'}, default='configparser'
+        ``'configparser'`` parses the whole file. ``'selective'`` splits
+        the file into sections in a single pass, and parses only the
+        ``batconf`` section and the sections of the selected environment;
+        errors in the sections of other environments are not reported.
+        ``'flat'`` files are always read with ConfigParser.
+    interpolation : {'none', 'basic', 'extended'}, default='basic'
+        ``'none'`` uses raw values. ``'basic'`` and ``'extended'`` resolve
+        ``%(option)s`` and ``${section:option}`` references, with
+        ConfigParser's BasicInterpolation and ExtendedInterpolation, once
+        when the file is loaded. An option which fails to interpolate raises
+        its InterpolationError when it is looked up. With the selective
+        reader, references to the sections which it skips are errors.
 
     Examples
     --------
@@ -139,14 +222,45 @@ class IniSource(FileSourceP):
         file_format: ConfigFileFormats = 'environments',
         config_env: str | None = None,
         missing_file_option: _MissingFileOption = 'warn',
+        ini_reader: IniReaderOption = 'configparser',
+        interpolation: InterpolationOption = 'basic',
     ):
+        if ini_reader not in _INI_READERS:
+            raise ValueError(f'Invalid ini_reader: {ini_reader}')
+        if interpolation not in _interpolations:
+            raise ValueError(f'Invalid interpolation: {interpolation}')
+        self._ini_reader = ini_reader
+        self._interpolation = interpolation
         self._missing_file_option = missing_file_option
         self._file_format = file_format  # validated by setter
         self._config_file_path = Path(file_path)
         self._config_env = config_env  # type: ignore[assignment]
+        self._keys = KeyTable(translate=_key_methods[file_format])
 
     def get(self, key: str, path: str | None = None) -> str | None:
-        return self._get_impl(self, key=key, path=path)
+        index, index_path = self._index, self._keys.get(key, path)
+        value = index.values.get(index_path)
+        if value is None and index_path in index.errors:
+            raise index.errors[index_path].with_traceback(None)
+        return value
+
+    def get_many(self, paths: Iterable[str]) -> dict[str, str]:
+        found = {}
+        index, get_key = self._index, self._keys.get_path
+        values, errors = index.values, index.errors
+        for path in paths:
+            if (value := values.get(key := get_key(path))) is not None:
+                found[path] = value
+            elif key in errors:
+                raise errors[key].with_traceback(None)
+        return found
+
+    def compile(self, paths: Iterable[str]) -> None:
+        self._keys.compile(paths)
+
+    def paths(self, prefix: str | None = None) -> list[str]:
+        """Dotted path of every value, optionally only those under prefix."""
+        return self._index.paths(prefix)
 
     @property
     def _file_format(self) -> str:
@@ -162,18 +276,15 @@ class IniSource(FileSourceP):
     def _loader(self):
         return _file_type_loaders[self._file_format]
 
-    @property
-    def _get_impl(self):
-        if self._data is EmptyConfigParser:
-            return _getter_methods['empty']
-        return _getter_methods[self._file_format]
-
-    @cached_property
+    @single_flight_property
     def _raw_data(self):
+        record_file_signature(self)
         return _load_ini(
             file_path=self._config_file_path,
             file_format=self._file_format,
             when_missing=self._missing_file_option,
+            ini_reader=self._ini_reader,
+            config_env=self.__config_env,
         )
 
     @cached_property
@@ -188,6 +299,22 @@ class IniSource(FileSourceP):
                 )
         return self._raw_data
 
+    @cached_property
+    def _index(self) -> FlatIndex:
+        if self._data is EmptyConfigParser:
+            return FlatIndex({})
+        values = _index_methods[self._file_format](
+            self._data, self._config_env, self._interpolation
+        )
+        errors: dict[str, Exception] = {
+            path: value
+            for path, value in values.items()
+            if isinstance(value, InterpolationError)
+        }
+        for path in errors:
+            del values[path]
+        return FlatIndex.from_paths(values, errors)
+
     # TODO: Fix type-hints when the next version of MyPy is released
     @property
     def _config_env(self):  # -> str | None:
@@ -211,6 +338,10 @@ class IniSource(FileSourceP):
 
     __repr__ = file_config_repr
 
+    load = load_file_source
+
+    reload = reload_file_source
+
 
 # === IniConfig (deprecated) === #
 
@@ -265,8 +396,15 @@ def _load_ini(
     file_path: Path,
     file_format: ConfigFileFormats,
     when_missing: _MissingFileOption = 'warn',
+    ini_reader: IniReaderOption = 'configparser',
+    config_env: str | None = None,
 ) -> ConfigParser | EmptyConfigParser:
     loader_fn = _file_type_loaders[file_format]
+    if ini_reader == 'selective' and file_format != 'flat':
+        loader_fn = _SelectiveReader(
+            config_env=config_env,
+            all_sections=file_format == 'sections',
+        )
     return _missing_file_handlers[when_missing](
         loader_fn=loader_fn,
         file_path=file_path,
@@ -290,6 +428,91 @@ def _load_ini_file_flat(file_path: Path) -> ConfigParser:
     return config
 
 
+class _FullReadRequired(Exception):
+    """The file can not be split into sections without parsing it."""
+
+
+@dataclass(frozen=True)
+class _SelectiveReader:
+    """Read the batconf section, and the sections of one environment.
+
+    The file is split into sections in a single pass, then only the
+    selected sections are parsed by ConfigParser, so values, interpolation
+    and errors match a full read.  Returns a ConfigParser which contains
+    only the selected sections.
+
+    Parameters
+    ----------
+    config_env : str or None, default=read from file
+        Environment to read; ``batconf.default_env`` when None.
+    all_sections : bool, default=False
+        Read every section, for ``'sections'`` files.
+    """
+
+    config_env: str | None = None
+    all_sections: bool = False
+
+    def __call__(self, file_path: Path) -> ConfigParser:
+        config = ConfigParser()
+        try:
+            with open(file_path) as ini_file:
+                sections = _split_sections(ini_file)
+        except _FullReadRequired:
+            config = _load_ini_file(file_path)
+        else:
+            # batconf is read first, it may name the environment
+            head = ('', config.default_section, 'batconf')
+            config.read_string(
+                ''.join(chain(*(sections.pop(name, []) for name in head))),
+                source=str(file_path),
+            )
+            selected = self._selection(config)
+            config.read_string(
+                ''.join(
+                    chain(
+                        *(
+                            lines
+                            for section, lines in sections.items()
+                            if selected(section)
+                        )
+                    )
+                ),
+                source=str(file_path),
+            )
+
+        selected = self._selection(config)
+        for section in config.sections():
+            if section != 'batconf' and not selected(section):
+                config.remove_section(section)
+        return config
+
+    def _selection(self, config: ConfigParser) -> Callable[[str], bool]:
+        if self.all_sections:
+            return lambda section: True
+        env = self.config_env or config.get(
+            'batconf', 'default_env', fallback=None
+        )
+        prefix = f'{env}.'
+        return lambda section: section == env or section.startswith(prefix)
+
+
+def _split_sections(ini_file: TextIO) -> dict[str, list[str]]:
+    """Lines of the file by section name, lines before the first section
+    under ''. Repeated sections are kept, so ConfigParser reports them.
+    """
+    current: list[str] = []
+    sections = {'': current}
+    for line in ini_file:
+        if line.startswith('['):
+            if header := ConfigParser.SECTCRE.match(line.strip()):
+                current = sections.setdefault(header['header'], [])
+        elif line[:1].isspace() and line.lstrip().startswith('['):
+            # A section header, or the continuation of a multi-line value
+            raise _FullReadRequired(line)
+        current.append(line if line.endswith('\n') else f'{line}\n')
+    return sections
+
+
 _file_type_loaders: dict[str, FileLoaderP] = {
     'environments': _load_ini_file,
     'sections': _load_ini_file,
@@ -297,6 +520,33 @@ _file_type_loaders: dict[str, FileLoaderP] = {
 }
 
 
+def _dump_ini(config: ConfigParser) -> dict[str, dict[str, str]]:
+    # Raw values, so interpolation is applied when the cached file is read.
+    # DEFAULT options are copied into each section, which is equivalent
+    return {
+        config.default_section: dict(config.defaults()),
+        **{
+            section: dict(config.items(section, raw=True))
+            for section in config.sections()
+        },
+    }
+
+
+def _restore_ini(data: dict[str, dict[str, str]]) -> ConfigParser:
+    # Filled without interpolation, which would reject raw values such as
+    # '100%' as they are set, then given the loaders' default interpolation
+    config = ConfigParser(interpolation=None)
+    config.read_dict(data)
+    config._interpolation = BasicInterpolation()  # type: ignore
+    return config
+
+
+# Convert parsed files to and from builtin types, for the disk cache
+_cache_codecs[_load_ini_file] = (_dump_ini, _restore_ini)
+_cache_codecs[_load_ini_file_flat] = (_dump_ini, _restore_ini)
+_cache_codecs[_SelectiveReader] = (_dump_ini, _restore_ini)
+
+
 _file_loader_map = {
     (ini_format, when_missing): (loader_fn, handler_fn)
     for ini_format, loader_fn in _file_type_loaders.items()
@@ -0,0 +1,224 @@
+"""Share resolved configuration values between pre-forked worker processes.
+
+The parent process resolves its configuration once, and publishes the
+values to a :mod:`multiprocessing.shared_memory` segment; each worker
+attaches to the segment, instead of parsing the config files again::
+
+    >>> shm = publish(cfg)  # in the parent, before forking
+    >>> source = SharedMemorySource(shm.name)  # in each worker
+    >>> cfg = Configuration(SourceList([source]), AppConfigSchema)
+
+The segment is read-only, and laid out as a header, a hash table of
+offsets, and a blob of UTF-8 keys and values::
+
+    header   magic, version, slot count
+    slots    (key offset, key length, value offset, value length) ...
+    blob     keys and values
+
+Keys are placed by their CRC-32, which unlike :func:`hash` is the same in
+every process, with linear probing. Attaching maps the segment without
+reading it, and a lookup reads only the slots it probes, and the value it
+finds.
+"""
+
+import marshal
+
+from multiprocessing.shared_memory import SharedMemory
+from struct import Struct
+from zlib import crc32
+from typing import Any, Iterable, Mapping, TYPE_CHECKING, cast
+
+from ..source import join_path
+
+if TYPE_CHECKING:
+    from ..manager import Configuration
+
+
+_MAGIC = b'BATCONF\x00'
+
+# Increment when the layout of the segment changes
+LAYOUT_VERSION = 1
+
+# magic, version, slot count
+_HEADER = Struct('<8sII')
+# key offset, key length, value offset, value length
+_ENTRY = Struct('<IIII')
+
+# value tags, the first byte of each value
+_STR = ord('s')
+_MARSHAL = ord('m')
+
+
+def publish(
+    configuration: 'Configuration',
+    name: str | None = None,
+) -> SharedMemory:
+    """Resolve every value of a Configuration into a shared memory segment.
+
+    Values are resolved with :meth:`Configuration.resolve_all`, schema
+    defaults included, and keyed by their fully qualified dotted path.
+    The caller owns the segment: keep it open while workers use it, then
+    call ``close()`` and ``unlink()`` on it once they have exited.
+
+    Parameters
+    ----------
+    configuration : Configuration
+        Configuration to publish.
+    name : str or None, default=a unique name
+        Name of the shared memory segment.
+
+    Returns
+    -------
+    SharedMemory
+        The segment, pass its ``name`` to :class:`SharedMemorySource`.
+
+    Raises
+    ------
+    ValueError
+        When a value is not a string, and can not be marshalled.
+    """
+    prefix = f'{configuration._path}.'
+    data = encode(
+        {f'{prefix}{p}': v for p, v in configuration.resolve_all().items()}
+    )
+    shm = SharedMemory(name=name, create=True, size=len(data))
+    cast(memoryview, shm.buf)[: len(data)] = data
+    return shm
+
+
+def encode(values: Mapping[str, Any]) -> bytes:
+    """Lay out values by dotted path, as read by SharedMemorySource."""
+    # a power of two, at most half full, so probe sequences are short
+    n_slots = 1
+    while n_slots < 2 * len(values):
+        n_slots *= 2
+
+    slots: list[bytes | None] = [None] * n_slots
+    blob = bytearray()
+    offset = _HEADER.size + _ENTRY.size * n_slots
+    for path, value in values.items():
+        key = path.encode()
+        encoded = _encode_value(value)
+        slot = crc32(key) & (n_slots - 1)
+        while slots[slot] is not None:
+            slot = (slot + 1) & (n_slots - 1)
+
+        key_offset = offset + len(blob)
+        blob += key
+        slots[slot] = _ENTRY.pack(
+            key_offset, len(key), offset + len(blob), len(encoded)
+        )
+        blob += encoded
+
+    header = _HEADER.pack(_MAGIC, LAYOUT_VERSION, n_slots)
+    empty = bytes(_ENTRY.size)
+    return b''.join([header, *(s or empty for s in slots), blob])
+
+
+def _encode_value(value: Any) -> bytes:
+    if isinstance(value, str):
+        return bytes([_STR]) + value.encode()
+    return bytes([_MARSHAL]) + marshal.dumps(value)
+
+
+def _attach(name: str) -> SharedMemory:
+    try:
+        # Python >= 3.13, so a worker exiting does not unlink the segment
+        return SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        # Earlier versions track it with the resource tracker the worker
+        # inherited from the publisher, which unlinks it when they all exit
+        return SharedMemory(name=name)
+
+
+class SharedMemorySource:
+    """Configuration source which reads a segment written by :func:`publish`.
+
+    Values are read from the shared segment on every lookup, so workers
+    hold no copy of the configuration data. Use ``Configuration(cache=True)``
+    to keep the values a worker reads often.
+
+    On Python < 3.13, an unrelated process which attaches to the segment
+    unlinks it when it exits, see :mod:`multiprocessing.resource_tracker`;
+    attach from processes started by the publisher, ex: forked workers.
+
+    Parameters
+    ----------
+    name : str
+        Name of the shared memory segment.
+
+    Raises
+    ------
+    FileNotFoundError
+        When there is no segment with that name.
+    ValueError
+        When the segment was not written by :func:`publish`, or was written
+        by another version of batconf.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._shm = _attach(name)
+        self._buf = cast(memoryview, self._shm.buf)
+        magic, version, n_slots = (
+            _HEADER.unpack_from(self._buf)
+            if len(self._buf) >= _HEADER.size
+            else (b'', 0, 0)
+        )
+        if magic != _MAGIC or version != LAYOUT_VERSION:
+            self.close()
+            raise ValueError(
+                f'Shared memory segment {name} is not a batconf config,'
+                f' layout version {LAYOUT_VERSION}'
+            )
+        self._mask = n_slots - 1
+
+    def get(self, key: str, path: str | None = None) -> Any:
+        return self._lookup(join_path(key, path).encode())
+
+    def get_many(self, paths: Iterable[str]) -> dict[str, Any]:
+        found = {}
+        for path in paths:
+            if (value := self._lookup(path.encode())) is not None:
+                found[path] = value
+        return found
+
+    def _lookup(self, key: bytes) -> Any:
+        buf, mask = self._buf, self._mask
+        slot = crc32(key) & mask
+        while True:
+            key_offset, key_len, value_offset, value_len = _ENTRY.unpack_from(
+                buf, _HEADER.size + _ENTRY.size * slot
+            )
+            if not key_offset:
+                return None
+            if key_len == len(key):
+                # release slices promptly, the segment can not close while
+                # they exist
+                key_end = key_offset + key_len
+                with buf[key_offset:key_end] as slot_key:
+                    if slot_key == key:
+                        break
+            slot = (slot + 1) & mask
+
+        tag, value_end = buf[value_offset], value_offset + value_len
+        with buf[value_offset + 1:value_end] as value:
+            if tag == _STR:
+                return str(value, 'utf-8')
+            return marshal.loads(value)
+
+    def close(self) -> None:
+        """Detach from the segment, later lookups find no values."""
+        # an empty table, so lookups find nothing
+        self._buf = memoryview(encode({}))
+        self._mask = 0
+        self._shm.close()
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __str__(self) -> str:
+        return f'Shared Memory: {repr(self)}'
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(name={self.name})'
@@ -0,0 +1,280 @@
+"""Compiled snapshots of resolved configuration values.
+
+Short-lived processes spend most of their start-up parsing config files.
+:func:`write_snapshot` resolves every option of a schema from a
+:class:`~batconf.source.SourceList` once, and writes the values to a
+single :mod:`marshal` file; :class:`SnapshotSource` loads them back with
+one read::
+
+    >>> write_snapshot('app.snapshot', source_list, AppConfigSchema)
+    >>> snapshot = SnapshotSource('app.snapshot', AppConfigSchema)
+    >>> cfg = Configuration(
+    ...     SourceList([EnvSource(), snapshot]), AppConfigSchema
+    ... )
+
+A snapshot records the schema it was written for, and the modification
+time, size and inode of every config file it was read from, so a stale
+snapshot is rejected rather than used.
+"""
+
+import marshal
+import os
+
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Iterable
+
+from ..source import SourceList, join_path
+from ..schema import compile_schema
+from ..types import ConfigP
+from .directory import DirectorySource
+from .env import EnvConfig
+from .watch import FileSignatureT, file_signature
+
+
+# Increment when the format of snapshot files changes
+SNAPSHOT_VERSION = 1
+
+# (version, schema fingerprint, file signatures, env variables, values)
+_SnapshotT = tuple[
+    int,
+    str,
+    dict[str, FileSignatureT],
+    dict[str, str | None],
+    dict[str, Any],
+]
+
+
+def schema_fingerprint(
+    config_class: ConfigP | Any,
+    path: str | None = None,
+) -> str:
+    """Hash of the schema's name, root path and the path of every option.
+
+    Parameters
+    ----------
+    config_class : ConfigP
+        Dataclass whose fields define the configuration schema.
+    path : str or None, default=the module of ``config_class``
+        Dotted namespace path of the schema, as passed to Configuration.
+    """
+    qualname = config_class.__qualname__  # type: ignore[union-attr]
+    name = f'{config_class.__module__}.{qualname}'
+    root = _root(config_class, path)
+    key = sha256(f'{SNAPSHOT_VERSION}:{name}:{root}:'.encode())
+    key.update('\n'.join(compile_schema(config_class).paths).encode())
+    return key.hexdigest()
+
+
+def write_snapshot(
+    file_path: Path | str,
+    source_list: SourceList,
+    config_class: ConfigP | Any,
+    path: str | None = None,
+) -> None:
+    """Resolve every option of a schema, and write the values to a snapshot.
+
+    Values are looked up from every source in ``source_list``, in a single
+    :meth:`SourceList.get_many` batch; schema defaults are not stored, the
+    Configuration applies them. The config files of file sources, and of
+    :class:`~batconf.sources.directory.DirectorySource`, are recorded,
+    along with the variables read by each
+    :class:`~batconf.sources.env.EnvConfig` in the list, so changes to them
+    make the snapshot stale. Values from other sources, such as command
+    line arguments, are stored as they are; leave those sources out of
+    ``source_list`` and put them ahead of the SnapshotSource instead.
+
+    File sources are reloaded, see :meth:`IniSource.reload()
+    <batconf.sources.ini.IniSource.reload>`, after their files are
+    recorded, so values loaded before a file changed are not stored with
+    its new signature. The file is written atomically, so concurrent
+    processes never read a partial snapshot.
+
+    Parameters
+    ----------
+    file_path : Path or str
+        Path of the snapshot file.
+    source_list : SourceList
+        Sources to resolve values from.
+    config_class : ConfigP
+        Dataclass whose fields define the configuration schema.
+    path : str or None, default=the module of ``config_class``
+        Dotted namespace path of the schema, as passed to Configuration.
+
+    Raises
+    ------
+    ValueError
+        When a value can not be marshalled, ex: a TOML datetime.
+    """
+    prefix = f'{_root(config_class, path)}.'
+    paths = [f'{prefix}{p}' for p in compile_schema(config_class).paths]
+
+    files: dict[str, FileSignatureT] = {}
+    env: dict[str, str | None] = {}
+    for source in source_list._sources:
+        # stat, then read the files again, so the values are never older
+        # than the signatures; a file changed while loading is stale
+        if source_files := _files(source):
+            files.update((str(f), file_signature(f)) for f in source_files)
+            _reload(source)
+        if isinstance(source, EnvConfig):
+            env.update(
+                (name, os.environ.get(name))
+                for name in map(source._env_names.get_path, paths)
+            )
+
+    snapshot: _SnapshotT = (
+        SNAPSHOT_VERSION,
+        schema_fingerprint(config_class, path),
+        files,
+        env,
+        source_list.get_many(paths),
+    )
+    data = marshal.dumps(snapshot)
+
+    from tempfile import NamedTemporaryFile
+
+    file_path = Path(file_path)
+    tmp = NamedTemporaryFile(dir=file_path.parent, suffix='.tmp', delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+        # readers see the old file, or the complete new one
+        os.replace(tmp.name, file_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
+def load_snapshot(
+    file_path: Path | str,
+    config_class: ConfigP | Any,
+    path: str | None = None,
+) -> dict[str, Any]:
+    """Read the values of a snapshot, if it is current.
+
+    Parameters
+    ----------
+    file_path : Path or str
+        Path of the snapshot file.
+    config_class : ConfigP
+        Dataclass whose fields define the configuration schema.
+    path : str or None, default=the module of ``config_class``
+        Dotted namespace path of the schema, as passed to Configuration.
+
+    Returns
+    -------
+    dict[str, Any]
+        Values, keyed by fully qualified dotted path.
+
+    Raises
+    ------
+    FileNotFoundError
+        When the snapshot file does not exist.
+    ValueError
+        When the snapshot is unreadable, was written by another version of
+        batconf or for another schema, or a config file or environment
+        variable it was read from has changed.
+    """
+    with open(file_path, 'rb') as f:
+        content = f.read()
+
+    try:
+        snapshot = marshal.loads(content)
+        version, fingerprint, files, env, values = snapshot
+    except (EOFError, ValueError, TypeError) as err:
+        raise ValueError(f'Unreadable snapshot {file_path}: {err}') from err
+
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(
+            f'Snapshot {file_path} has version {version},'
+            f' expected {SNAPSHOT_VERSION}'
+        )
+    if fingerprint != schema_fingerprint(config_class, path):
+        raise ValueError(
+            f'Snapshot {file_path} was written for another schema'
+        )
+    for name, signature in files.items():
+        if file_signature(name) != signature:
+            raise ValueError(f'Stale snapshot {file_path}: {name} changed')
+    for name, value in env.items():
+        if os.environ.get(name) != value:
+            raise ValueError(f'Stale snapshot {file_path}: ${name} changed')
+    return values
+
+
+class SnapshotSource:
+    """Configuration source which reads a snapshot written by write_snapshot.
+
+    The snapshot is read, and validated, when the source is created, so
+    callers can fall back to parsing their config files when it is stale::
+
+        try:
+            sources = [SnapshotSource('app.snapshot', AppConfigSchema)]
+        except (FileNotFoundError, ValueError):
+            sources = [IniSource('config.ini')]
+            write_snapshot(
+                'app.snapshot', SourceList(sources), AppConfigSchema
+            )
+
+    Parameters
+    ----------
+    file_path : Path or str
+        Path of the snapshot file.
+    config_class : ConfigP
+        Dataclass whose fields define the configuration schema.
+    path : str or None, default=the module of ``config_class``
+        Dotted namespace path of the schema, as passed to Configuration.
+
+    Raises
+    ------
+    FileNotFoundError
+        When the snapshot file does not exist.
+    ValueError
+        When the snapshot is not current, see :func:`load_snapshot`.
+    """
+
+    def __init__(
+        self,
+        file_path: Path | str,
+        config_class: ConfigP | Any,
+        path: str | None = None,
+    ) -> None:
+        self._file_path = Path(file_path)
+        # keyed by dotted path, so there are no native keys to compile
+        self._values = load_snapshot(file_path, config_class, path)
+
+    def get(self, key: str, path: str | None = None) -> Any:
+        return self._values.get(join_path(key, path))
+
+    def get_many(self, paths: Iterable[str]) -> dict[str, Any]:
+        values = self._values
+        return {path: values[path] for path in paths if path in values}
+
+    def __str__(self) -> str:
+        return f'Config Snapshot: {repr(self)}'
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(file_path={self._file_path})'
+
+
+def _root(config_class: ConfigP | Any, path: str | None) -> str:
+    # the default path of a Configuration
+    return path or config_class.__module__
+
+
+def _files(source: Any) -> list[Path]:
+    if (file_path := getattr(source, '_config_file_path', None)) is not None:
+        return [file_path]
+    if isinstance(source, DirectorySource):
+        # the directory changes when fragments are added or removed
+        return [source._directory, *source.fragments]
+    return []
+
+
+def _reload(source: Any) -> None:
+    if isinstance(source, DirectorySource):
+        # merged again from the fragments, on the next lookup
+        source.__dict__.pop('_merged', None)
+    elif hasattr(source, 'reload'):
+        source.reload()
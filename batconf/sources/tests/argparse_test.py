@@ -26,6 +26,25 @@ class TestNamespaceConfig(TestCase):
         with t.subTest('path and key paths'):
             t.assertEqual(cs.get('to.key', path='bat.module.path'), 'value')
 
+    def test_get_many(t):
+        cli_args = Namespace(key='value')
+        setattr(cli_args, 'bat.module.key', 'module value')
+
+        cs = NamespaceConfig(cli_args)
+
+        t.assertEqual(
+            {'key': 'value', 'bat.module.key': 'module value'},
+            cs.get_many(['key', 'bat.module.key', 'bat.missing']),
+        )
+
+    def test_compile(t):
+        cs = NamespaceConfig(Namespace())
+        cs.compile(['bat.module.key', 'key'])
+        t.assertEqual(
+            {('key', 'bat.module'): 'bat.module.key', ('key', None): 'key'},
+            cs._attr_names._by_key,
+        )
+
     def test___str__(t) -> None:
         cs = NamespaceConfig(Namespace())
         t.assertEqual(f'Namespace Source: {repr(cs)}', str(cs))
@@ -1,32 +1,41 @@
 from unittest import TestCase
+from unittest.mock import patch
 from dataclasses import dataclass
+from typing import cast
 
+from ...source import _get_each
 from ..dataclass import DataclassConfig
 
 
-class TestDataclassConfig(TestCase):
-    def test_get(t) -> None:
-        @dataclass
-        class SubConfig:
-            key: str = 'sub_v_1'
+@dataclass
+class SubConfig:
+    key: str = 'sub_v_1'
+
+
+SubConfig.__module__ = 'bat.TestModule.SubModule'
+
+
+@dataclass
+class ConfigClass:
+    remote_host: dict
+    SubModule: SubConfig
+    key: str = 'v_1'
+
 
-        SubConfig.__module__ = 'bat.TestModule.SubModule'
+ConfigClass.__module__ = 'bat.TestModule'
 
-        @dataclass
-        class ConfigClass:
-            remote_host: dict
-            SubModule: SubConfig
-            key: str = 'v_1'
 
-        ConfigClass.__module__ = 'bat.TestModule'
+@dataclass
+class GlobalConfig:
+    TestModule: ConfigClass
+    config_file: str = './GlobalConfig.yaml'
 
-        @dataclass
-        class GlobalConfig:
-            TestModule: ConfigClass
-            config_file: str = './GlobalConfig.yaml'
 
-        GlobalConfig.__module__ = 'bat'
+GlobalConfig.__module__ = 'bat'
 
+
+class TestDataclassConfig(TestCase):
+    def test_get(t) -> None:
         conf = DataclassConfig(GlobalConfig)
 
         with t.subTest('single key'):
@@ -71,3 +80,35 @@ class TestDataclassConfig(TestCase):
         with t.subTest('get sub-config returns a DataclassConfig object'):
             # TODO: This may be a bug, and needs to be investigated further
             t.assertIsInstance(conf.get('TestModule'), DataclassConfig)
+
+    def test_get_many(t) -> None:
+        conf = DataclassConfig(GlobalConfig)
+        paths = [
+            'bat.config_file',
+            'bat.TestModule.key',
+            'bat.TestModule.SubModule.key',
+            'bat.TestModule.SubModule.missing',
+            'bat.TestModule.remote_host',
+            'bat.TestModule.missing.key',
+            'bat.missing',
+        ]
+
+        with t.subTest('matches get'):
+            t.assertEqual(
+                {
+                    'bat.config_file': './GlobalConfig.yaml',
+                    'bat.TestModule.key': 'v_1',
+                    'bat.TestModule.SubModule.key': 'sub_v_1',
+                },
+                conf.get_many(paths),
+            )
+            t.assertEqual(_get_each(conf, paths), conf.get_many(paths))
+
+        with t.subTest('shared parents are walked once'):
+            test_module = cast(DataclassConfig, conf._data['TestModule'])
+            with patch.object(
+                test_module, 'get', wraps=test_module.get
+            ) as get:
+                conf.get_many(paths)
+            # key, SubModule, remote_host, missing
+            t.assertEqual(4, get.call_count)
@@ -0,0 +1,248 @@
+from unittest import TestCase
+from unittest.mock import patch, Mock
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ..directory import (
+    DirectorySource,
+    merge_indexes,
+    FlatIndex,
+    _gil_enabled,
+)
+
+
+SRC = 'batconf.sources.directory'
+
+
+class DirectorySourceTests(TestCase):
+    def setUp(t):
+        tmp_dir = TemporaryDirectory()
+        t.addCleanup(tmp_dir.cleanup)
+        t.directory = Path(tmp_dir.name)
+
+        t.write('00-base.ini', '[db]\nhost = base\nport = 5432\n')
+        t.write('10-db.ini', '[db]\nhost = db\n[db.pool]\nsize = 4\n')
+        t.write('20-team.ini', '[db.pool]\nsize = 8\n')
+
+        t.src = DirectorySource(str(t.directory))
+
+    def write(t, name: str, text: str) -> Path:
+        file_path = t.directory / name
+        file_path.write_text(text)
+        return file_path
+
+    def test___init__(t):
+        t.assertEqual(t.directory, t.src._directory)
+        t.assertEqual('sections', t.src._file_format)
+        t.assertIsNone(t.src._config_env)
+        t.assertEqual('warn', t.src._missing_file_option)
+        t.assertIsNone(t.src._max_workers)
+
+    def test_get(t):
+        with t.subTest('later files take precedence'):
+            t.assertEqual('db', t.src.get('host', 'db'))
+            t.assertEqual('8', t.src.get('db.pool.size'))
+
+        with t.subTest('values from every file'):
+            t.assertEqual('5432', t.src.get('port', path='db'))
+
+        with t.subTest('missing'):
+            t.assertIsNone(t.src.get('db.missing'))
+            t.assertIsNone(t.src.get('db.pool'))
+
+    def test_get_many(t):
+        t.assertEqual(
+            {'db.host': 'db', 'db.pool.size': '8'},
+            t.src.get_many(['db.host', 'db.pool.size', 'db.missing']),
+        )
+
+    def test_compile(t):
+        t.src.compile(['db.host'])
+        t.assertEqual({'db.host': 'db.host'}, t.src._keys._by_path)
+
+    def test_paths(t):
+        t.assertEqual(['db.host', 'db.port', 'db.pool.size'], t.src.paths())
+        t.assertEqual(['db.pool.size'], t.src.paths('db.pool'))
+
+    def test_origin(t):
+        t.assertEqual(t.directory / '00-base.ini', t.src.origin('db.port'))
+        t.assertEqual(t.directory / '10-db.ini', t.src.origin('db.host'))
+        t.assertEqual(
+            t.directory / '20-team.ini', t.src.origin('db.pool.size')
+        )
+        t.assertIsNone(t.src.origin('db.missing'))
+
+    def test_load(t):
+        t.src.load()
+        t.assertIn('_merged', t.src.__dict__)
+        t.assertEqual('db', t.src.get('db.host'))
+
+    def test_fragments(t):
+        for name in ('.hidden.ini', 'notes.txt', '3.toml', '4.yaml', '5.yml'):
+            t.write(name, '')
+        (t.directory / '60-dir.ini').mkdir()
+
+        t.assertEqual(
+            [
+                '00-base.ini',
+                '10-db.ini',
+                '20-team.ini',
+                '3.toml',
+                '4.yaml',
+                '5.yml',
+            ],
+            [f.name for f in t.src.fragments],
+        )
+
+    def test_missing_directory(t):
+        directory = str(t.directory / 'missing')
+
+        with t.subTest('warn'):
+            src = DirectorySource(directory)
+            with t.assertLogs(SRC, level='WARNING') as log:
+                t.assertEqual([], src.fragments)
+            t.assertIn('Config directory not found', log.output[0])
+            t.assertIsNone(src.get('db.host'))
+
+        with t.subTest('ignore'):
+            src = DirectorySource(directory, missing_file_option='ignore')
+            with t.assertNoLogs(SRC):
+                t.assertEqual([], src.fragments)
+
+        with t.subTest('error'):
+            src = DirectorySource(directory, missing_file_option='error')
+            with t.assertRaises(FileNotFoundError):
+                src.get('db.host')
+
+    def test_environments(t):
+        directory = t.directory / 'envs'
+        directory.mkdir()
+        (directory / 'a.ini').write_text(
+            '[batconf]\ndefault_env = dev\n'
+            '[dev]\nkey = dev\n'
+            '[prod]\nkey = p\n'
+        )
+
+        with t.subTest('default environment of each file'):
+            src = DirectorySource(str(directory), file_format='environments')
+            t.assertEqual('dev', src.get('key'))
+
+        with t.subTest('selected environment'):
+            src = DirectorySource(
+                str(directory), file_format='environments', config_env='prod'
+            )
+            t.assertEqual('p', src.get('key'))
+
+    @patch(f'{SRC}.ThreadPoolExecutor', autospec=True)
+    def test__merged(t, ThreadPoolExecutor: Mock):
+        executor = ThreadPoolExecutor.return_value.__enter__.return_value
+        executor.map.side_effect = map
+
+        with t.subTest('files are parsed concurrently'):
+            src = DirectorySource(str(t.directory), max_workers=2)
+            t.assertEqual('db', src.get('db.host'))
+            ThreadPoolExecutor.assert_called_once_with(2)
+            executor.map.assert_called_once_with(src._load, src.fragments)
+
+        with t.subTest('a single worker parses files serially'):
+            ThreadPoolExecutor.reset_mock()
+            src = DirectorySource(str(t.directory), max_workers=1)
+            t.assertEqual('db', src.get('db.host'))
+            ThreadPoolExecutor.assert_not_called()
+
+        with t.subTest('by default, files are parsed serially with the GIL'):
+            ThreadPoolExecutor.reset_mock()
+            src = DirectorySource(str(t.directory))
+            with patch(f'{SRC}._gil_enabled', return_value=True):
+                t.assertEqual('db', src.get('db.host'))
+            ThreadPoolExecutor.assert_not_called()
+
+        with t.subTest('and concurrently on free-threaded builds'):
+            src = DirectorySource(str(t.directory))
+            with patch(f'{SRC}._gil_enabled', return_value=False):
+                t.assertEqual('db', src.get('db.host'))
+            ThreadPoolExecutor.assert_called_once_with(None)
+
+        with t.subTest('parse errors are raised'):
+            t.write('90-invalid.ini', 'not an option\n')
+            with t.assertRaises(Exception):
+                DirectorySource(str(t.directory)).get('db.host')
+
+    def test__load(t):
+        toml_source = Mock()
+        with patch.dict(f'{SRC}.fragment_sources', {'.toml': toml_source}):
+            src = DirectorySource(
+                str(t.directory), file_format='flat', config_env='dev'
+            )
+            ret = src._load(t.directory / 'a.toml')
+
+        toml_source.assert_called_once_with(
+            file_path=str(t.directory / 'a.toml'),
+            file_format='flat',
+            config_env='dev',
+            missing_file_option='error',
+        )
+        t.assertIs(toml_source.return_value._index, ret)
+
+    def test___str__(t):
+        t.assertEqual(f'Config Directory: {t.src!r}', str(t.src))
+
+    def test___repr__(t):
+        t.assertEqual(
+            f'DirectorySource(directory={t.directory}, '
+            'file_format=sections, config_env=None, missing_file_option=warn)',
+            repr(t.src),
+        )
+
+
+class MergeIndexesTests(TestCase):
+    def merge(t, *datas: dict) -> tuple[dict, dict]:
+        return merge_indexes(
+            (Path(f'{n}.yml'), FlatIndex(data))
+            for n, data in enumerate(datas)
+        )
+
+    def test_merge_indexes(t):
+        values, origins = t.merge(
+            {'a': {'b': 1, 'c': 2}},
+            {'a': {'c': 3}, 'd': 4},
+        )
+        t.assertEqual({'a.b': 1, 'a.c': 3, 'd': 4}, values)
+        t.assertEqual(
+            {'a.b': Path('0.yml'), 'a.c': Path('1.yml'), 'd': Path('1.yml')},
+            origins,
+        )
+
+    def test_value_replaces_mapping(t):
+        values, origins = t.merge(
+            {'a': {'b': {'c': 1, 'd': {'e': 2}}, 'f': 3}},
+            {'a': {'b': 'value'}},
+            {'a': {'b': {'g': 4}}},
+        )
+        t.assertEqual({'a.b.g': 4, 'a.f': 3}, values)
+        t.assertEqual(set(values), set(origins))
+
+    def test_mapping_replaces_value(t):
+        values, origins = t.merge(
+            {'a': 'value', 'b': 1},
+            {'a': {'b': {'c': 2}}},
+        )
+        t.assertEqual({'b': 1, 'a.b.c': 2}, values)
+        t.assertEqual(Path('1.yml'), origins['a.b.c'])
+
+
+class GilEnabledTests(TestCase):
+    def test__gil_enabled(t):
+        with t.subTest('Python 3.13+'):
+            for enabled in (True, False):
+                with patch(
+                    f'{SRC}.sys._is_gil_enabled',
+                    return_value=enabled,
+                    create=True,
+                ):
+                    t.assertIs(enabled, _gil_enabled())
+
+        with t.subTest('earlier versions always have the GIL'):
+            with patch(f'{SRC}.sys', spec=[]):
+                t.assertTrue(_gil_enabled())
@@ -0,0 +1,251 @@
+import marshal
+
+from unittest import TestCase
+from unittest.mock import patch, Mock
+
+from dataclasses import dataclass
+from os import utime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ..disk_cache import (
+    DiskCache,
+    CACHE_VERSION,
+    DEFAULT_MAX_BYTES,
+    default_cache_dir,
+    _batconf_version,
+)
+
+
+SRC = 'batconf.sources.disk_cache'
+
+
+def load_lines(file_path: Path) -> list[str]:
+    return file_path.read_text().splitlines()
+
+
+class DiskCacheTests(TestCase):
+    def setUp(t):
+        tmp_dir = TemporaryDirectory()
+        t.addCleanup(tmp_dir.cleanup)
+        t.tmp_dir = Path(tmp_dir.name)
+
+        t.file_path = t.tmp_dir / 'config.txt'
+        t.file_path.write_text('line 0\nline 1\n')
+
+        t.directory = t.tmp_dir / 'cache'
+        t.cache = DiskCache(directory=t.directory)
+        t.loader_fn = Mock(wraps=load_lines)
+        t.loader_fn.__module__ = __name__
+        t.loader_fn.__qualname__ = 'load_lines'
+
+    def test___init__(t):
+        with t.subTest('defaults'):
+            with patch.dict(f'{SRC}.environ', {'XDG_CACHE_HOME': 'xdg'}):
+                cache = DiskCache()
+            t.assertEqual(Path('xdg/batconf'), cache.directory)
+            t.assertEqual(DEFAULT_MAX_BYTES, cache.max_bytes)
+            t.assertEqual(
+                f'{CACHE_VERSION}:{_batconf_version()}', cache._version
+            )
+
+        with t.subTest('the directory is created on first write'):
+            t.assertFalse(t.directory.exists())
+
+    def test_load(t):
+        with t.subTest('cache miss: parses and stores the file'):
+            t.assertEqual(
+                ['line 0', 'line 1'], t.cache.load(t.loader_fn, t.file_path)
+            )
+            t.loader_fn.assert_called_once_with(t.file_path)
+            (cache_file,) = t.directory.iterdir()
+            t.assertEqual(
+                ['line 0', 'line 1'], marshal.loads(cache_file.read_bytes())
+            )
+
+        with t.subTest('cache hit: the file is not parsed'):
+            t.loader_fn.reset_mock()
+            t.assertEqual(
+                ['line 0', 'line 1'], t.cache.load(t.loader_fn, t.file_path)
+            )
+            t.loader_fn.assert_not_called()
+
+        with t.subTest('changed contents are parsed again'):
+            t.file_path.write_text('changed\n')
+            t.assertEqual(['changed'], t.cache.load(t.loader_fn, t.file_path))
+            t.loader_fn.assert_called_once_with(t.file_path)
+            t.assertEqual(2, len(list(t.directory.iterdir())))
+
+        with t.subTest('each loader has its own cache files'):
+            other_loader = Mock(return_value=['other'])
+            other_loader.__module__ = __name__
+            t.assertEqual(
+                ['other'], t.cache.load(other_loader, t.file_path)
+            )
+
+        with t.subTest('loader objects are told apart by their repr'):
+
+            @dataclass(frozen=True)
+            class Loader:
+                name: str
+
+                def __call__(self, file_path: Path) -> list[str]:
+                    return [self.name]
+
+            for name in ('dev', 'prod'):
+                t.assertEqual([name], t.cache.load(Loader(name), t.file_path))
+
+    def test_load_with_codec(t):
+        codecs = {t.loader_fn: (tuple, list)}
+        with patch.dict(f'{SRC}.cache_codecs', codecs):
+            t.cache.load(t.loader_fn, t.file_path)
+            (cache_file,) = t.directory.iterdir()
+            t.assertEqual(
+                ('line 0', 'line 1'), marshal.loads(cache_file.read_bytes())
+            )
+            ret = t.cache.load(t.loader_fn, t.file_path)
+
+        t.assertEqual(['line 0', 'line 1'], ret)
+        t.loader_fn.assert_called_once()
+
+        with t.subTest('codecs for loader objects are found by type'):
+
+            @dataclass(frozen=True)
+            class Loader:
+                def __call__(self, file_path: Path) -> list[str]:
+                    return ['loaded']
+
+            with patch.dict(f'{SRC}.cache_codecs', {Loader: (tuple, list)}):
+                t.assertEqual(['loaded'], t.cache.load(Loader(), t.file_path))
+                t.assertEqual(['loaded'], t.cache.load(Loader(), t.file_path))
+
+    def test_load_unreadable_cache_file(t):
+        t.cache.load(t.loader_fn, t.file_path)
+        (cache_file,) = t.directory.iterdir()
+        cache_file.write_bytes(b'not marshal data')
+
+        with t.assertLogs(SRC, level='DEBUG') as log:
+            ret = t.cache.load(t.loader_fn, t.file_path)
+
+        t.assertEqual(['line 0', 'line 1'], ret)
+        t.assertEqual(2, t.loader_fn.call_count)
+        t.assertIn('Ignoring unreadable cache file', log.output[0])
+        # replaced with the new parse
+        t.assertEqual(
+            ['line 0', 'line 1'], marshal.loads(cache_file.read_bytes())
+        )
+
+    def test_load_unrestorable_cache_file(t):
+        codecs = {t.loader_fn: (tuple, Mock(side_effect=ValueError('bad')))}
+        with patch.dict(f'{SRC}.cache_codecs', codecs):
+            t.cache.load(t.loader_fn, t.file_path)
+            with t.assertLogs(SRC, level='DEBUG') as log:
+                ret = t.cache.load(t.loader_fn, t.file_path)
+
+        with t.subTest('is a cache miss'):
+            t.assertEqual(['line 0', 'line 1'], ret)
+            t.assertEqual(2, t.loader_fn.call_count)
+            t.assertIn('Ignoring unreadable cache file', log.output[0])
+
+    def test_load_unmarshallable_data(t):
+        t.loader_fn.side_effect = lambda file_path: object()
+
+        with t.assertLogs(SRC, level='DEBUG') as log:
+            t.cache.load(t.loader_fn, t.file_path)
+
+        t.assertIn('Parsed data can not be cached', log.output[0])
+        t.assertFalse(t.directory.exists())
+
+    @patch(f'{SRC}.replace', autospec=True)
+    def test_load_write_failure(t, replace: Mock):
+        replace.side_effect = PermissionError
+
+        with t.assertLogs(SRC, level='DEBUG') as log:
+            ret = t.cache.load(t.loader_fn, t.file_path)
+
+        t.assertEqual(['line 0', 'line 1'], ret)
+        t.assertIn('Failed to write cache file', log.output[0])
+        with t.subTest('the temporary file is removed'):
+            t.assertEqual([], list(t.directory.iterdir()))
+
+        with t.subTest('the directory can not be created'):
+            t.directory.rmdir()
+            t.directory.write_text('not a directory')
+            t.assertEqual(
+                ['line 0', 'line 1'], t.cache.load(t.loader_fn, t.file_path)
+            )
+
+    def test__cleanup(t):
+        t.cache.max_bytes = 25
+        t.directory.mkdir()
+        for n, name in enumerate(['old', 'new', 'newest']):
+            path = t.directory / f'{name}.marshal'
+            path.write_bytes(b'0123456789')
+            utime(path, ns=(n, n))
+        (t.directory / 'other.file').write_bytes(b'0123456789')
+
+        t.cache._cleanup()
+
+        t.assertEqual(
+            ['new.marshal', 'newest.marshal', 'other.file'],
+            sorted(p.name for p in t.directory.iterdir()),
+        )
+
+        with t.subTest('files removed concurrently are skipped'):
+            removed = [t.directory / 'removed.marshal']
+            with patch.object(Path, 'glob', return_value=removed):
+                t.cache._cleanup()
+
+    def test_cache_hits_are_recently_used(t):
+        t.cache.load(t.loader_fn, t.file_path)
+        (cache_file,) = t.directory.iterdir()
+        utime(cache_file, ns=(0, 0))
+
+        t.cache.load(t.loader_fn, t.file_path)
+        t.assertGreater(cache_file.stat().st_mtime_ns, 0)
+
+        with t.subTest('touch failures are ignored'):
+            with patch(f'{SRC}.utime', side_effect=PermissionError):
+                t.cache.load(t.loader_fn, t.file_path)
+
+    def test_clear(t):
+        t.cache.load(t.loader_fn, t.file_path)
+        (t.directory / 'other.file').write_bytes(b'')
+        t.cache.clear()
+        t.assertEqual(
+            ['other.file'], [p.name for p in t.directory.iterdir()]
+        )
+
+    def test___repr__(t):
+        t.assertEqual(
+            f'DiskCache(directory={t.directory}, '
+            f'max_bytes={DEFAULT_MAX_BYTES})',
+            repr(t.cache),
+        )
+
+
+class DiskCacheFunctionsTests(TestCase):
+    def test_default_cache_dir(t):
+        with t.subTest('XDG_CACHE_HOME'):
+            with patch.dict(f'{SRC}.environ', {'XDG_CACHE_HOME': '/xdg'}):
+                t.assertEqual(Path('/xdg/batconf'), default_cache_dir())
+
+        with t.subTest('defaults to ~/.cache'):
+            with patch.dict(f'{SRC}.environ', {}, clear=True):
+                t.assertEqual(
+                    Path.home() / '.cache' / 'batconf', default_cache_dir()
+                )
+
+    def test__batconf_version(t):
+        with t.subTest('installed package version'):
+            with patch('importlib.metadata.version', return_value='1.2.3'):
+                t.assertEqual('1.2.3', _batconf_version())
+
+        with t.subTest('batconf is not installed'):
+            from importlib.metadata import PackageNotFoundError
+
+            with patch(
+                'importlib.metadata.version',
+                side_effect=PackageNotFoundError,
+            ):
+                t.assertEqual('unknown', _batconf_version())
@@ -33,6 +33,31 @@ class TestEnvConfig(TestCase):
                 conf.get('to.key', path='bat.module.path'), 'value2'
             )
 
+    @patch.dict(
+        f'{SRC}.os.environ',
+        {
+            'BAT_CONFIG_FILE': 'example.config.yaml',
+            'BAT_MODULE_KEY': 'value',
+        },
+    )
+    def test_get_many(t):
+        conf = EnvConfig()
+        t.assertEqual(
+            {
+                'config_file': 'example.config.yaml',
+                'bat.module.key': 'value',
+            },
+            conf.get_many(['config_file', 'bat.module.key', 'bat.missing']),
+        )
+
+    def test_compile(t):
+        conf = EnvConfig()
+        conf.compile(['bat.module.key'])
+        t.assertEqual(
+            {'bat.module.key': 'BAT_MODULE_KEY'},
+            conf._env_names._by_path,
+        )
+
     def test_env_name(t):
         conf = EnvConfig()
 
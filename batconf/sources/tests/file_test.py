@@ -1,6 +1,10 @@
 from unittest import TestCase
 from unittest.mock import patch, create_autospec, Mock, sentinel
 
+from functools import cached_property
+from threading import Event, Thread
+
+from ..._utils import single_flight_property
 from ..file import (
     # missing file handlers
     MissingFileHandlerP,
@@ -9,7 +13,14 @@ from ..file import (
     load_file_error_when_missing,
     missing_file_handlers,
     Path,
+    FlatIndex,
+    ParsedFileCache,
+    parsed_files,
+    load_file_source,
+    record_file_signature,
+    reload_file_source,
 )
+from ..disk_cache import DiskCache, DEFAULT_MAX_BYTES
 
 
 SRC = 'batconf.sources.file'
@@ -112,6 +123,213 @@ class FileLoaderFunctionTests(TestCase):
                 )
 
 
+class ParsedFileCacheTests(TestCase):
+    def setUp(t):
+        patcher = patch(f'{SRC}.stat', autospec=True)
+        t.stat = patcher.start()
+        t.addCleanup(patcher.stop)
+        t.stat.return_value = Mock(st_mtime_ns=1, st_size=10, st_ino=1)
+
+        t.cache = ParsedFileCache(maxsize=2)
+        t.loader_fn = Mock(side_effect=lambda file_path: object())
+        t.file_path = Path('example.config.file')
+
+    def test_load(t):
+        parsed = t.cache.load(t.loader_fn, t.file_path)
+
+        with t.subTest('parses the file once'):
+            t.assertIs(parsed, t.cache.load(t.loader_fn, t.file_path))
+            t.loader_fn.assert_called_once_with(t.file_path)
+
+        with t.subTest('equivalent paths share an entry'):
+            t.assertIs(
+                parsed,
+                t.cache.load(t.loader_fn, Path('./example.config.file')),
+            )
+
+        with t.subTest('each loader parses the file'):
+            other_loader = Mock(return_value=sentinel.other)
+            t.assertIs(
+                sentinel.other, t.cache.load(other_loader, t.file_path)
+            )
+
+        with t.subTest('changed files are parsed again'):
+            for changed in (
+                Mock(st_mtime_ns=2, st_size=10, st_ino=1),
+                Mock(st_mtime_ns=2, st_size=11, st_ino=1),
+                Mock(st_mtime_ns=2, st_size=11, st_ino=2),
+            ):
+                t.stat.return_value = changed
+                t.assertIsNot(parsed, t.cache.load(t.loader_fn, t.file_path))
+
+        with t.subTest('files which cannot be stat-ed are not cached'):
+            t.stat.side_effect = FileNotFoundError
+            t.loader_fn.reset_mock()
+            t.loader_fn.side_effect = FileNotFoundError
+            with t.assertRaises(FileNotFoundError):
+                t.cache.load(t.loader_fn, t.file_path)
+            t.loader_fn.assert_called_once_with(t.file_path)
+
+    def test_load_evicts_least_recently_used(t):
+        first = t.cache.load(t.loader_fn, Path('first'))
+        t.cache.load(t.loader_fn, Path('second'))
+        # first is now the most recently used
+        t.cache.load(t.loader_fn, Path('first'))
+        t.cache.load(t.loader_fn, Path('third'))
+
+        t.assertEqual(2, len(t.cache))
+        t.assertIs(first, t.cache.load(t.loader_fn, Path('first')))
+        t.assertEqual(3, t.loader_fn.call_count)
+
+    def test_clear(t):
+        parsed = t.cache.load(t.loader_fn, t.file_path)
+        t.cache.clear()
+        t.assertEqual(0, len(t.cache))
+        t.assertIsNot(parsed, t.cache.load(t.loader_fn, t.file_path))
+
+    def test_load_with_disk_cache(t):
+        t.cache.disk_cache = Mock(spec=['load'])
+        parsed = t.cache.load(t.loader_fn, t.file_path)
+
+        t.cache.disk_cache.load.assert_called_once_with(
+            t.loader_fn, t.file_path
+        )
+        t.assertIs(t.cache.disk_cache.load.return_value, parsed)
+        t.loader_fn.assert_not_called()
+
+    def test_enable_disk_cache(t):
+        with t.subTest('disabled by default'):
+            t.assertIsNone(t.cache.disk_cache)
+
+        with t.subTest('defaults'):
+            disk_cache = t.cache.enable_disk_cache()
+            t.assertIsInstance(disk_cache, DiskCache)
+            t.assertIs(disk_cache, t.cache.disk_cache)
+            t.assertEqual(DEFAULT_MAX_BYTES, disk_cache.max_bytes)
+
+        with t.subTest('arguments'):
+            disk_cache = t.cache.enable_disk_cache('cache_dir', max_bytes=10)
+            t.assertEqual(Path('cache_dir'), disk_cache.directory)
+            t.assertEqual(10, disk_cache.max_bytes)
+
+    def test_disable_disk_cache(t):
+        t.cache.enable_disk_cache()
+        t.cache.disable_disk_cache()
+        t.assertIsNone(t.cache.disk_cache)
+
+    def test_parsed_files(t):
+        t.assertIsInstance(parsed_files, ParsedFileCache)
+        t.assertEqual(32, parsed_files.maxsize)
+
+
+class FileSource:
+    """The cached data properties of the file sources"""
+
+    def __init__(self, load: Mock):
+        self._load = load
+        self._config_file_path = Path('config.file')
+
+    @single_flight_property
+    def _raw_data(self):
+        record_file_signature(self)
+        return self._load()
+
+    @cached_property
+    def _data(self):
+        return self._raw_data['env']
+
+    @cached_property
+    def _index(self):
+        return FlatIndex(self._data)
+
+    load = load_file_source
+
+    reload = reload_file_source
+
+
+class LoadFileSourceTests(TestCase):
+    def test_load_file_source(t):
+        load = Mock(return_value={'env': {'key': 'v0'}})
+        source = FileSource(load)
+
+        source.load()
+        t.assertEqual({'key': 'v0'}, source.__dict__['_index'].values)
+
+        with t.subTest('loaded data is kept'):
+            source.load()
+            load.assert_called_once_with()
+
+
+class ReloadFileSourceTests(TestCase):
+    def setUp(t):
+        patcher = patch(f'{SRC}.file_signature', autospec=True)
+        t.file_signature = patcher.start()
+        t.addCleanup(patcher.stop)
+        t.file_signature.return_value = (1, 10, 100)
+
+        t.load = Mock(return_value={'env': {'key': 'v0'}})
+        t.source = FileSource(t.load)
+
+    def test_reload_file_source(t):
+        index = t.source._index
+        t.file_signature.assert_called_once_with(Path('config.file'))
+
+        with t.subTest('unchanged files are not read again'):
+            # ex: the parsed file was evicted from the parsed file cache
+            t.load.return_value = {'env': {'key': 'v0'}}
+            t.assertFalse(t.source.reload())
+            t.assertIs(index, t.source._index)
+            t.load.assert_called_once_with()
+
+        with t.subTest('changed data is swapped in'):
+            t.file_signature.return_value = (2, 10, 100)
+            t.load.return_value = {'env': {'key': 'v1'}}
+            t.assertTrue(t.source.reload())
+            t.assertEqual({'key': 'v1'}, t.source._index.values)
+            t.assertEqual({'key': 'v1'}, t.source._data)
+            t.assertEqual((2, 10, 100), t.source._file_signature)
+
+        with t.subTest('errors are raised, and the old data is kept'):
+            t.file_signature.return_value = (3, 10, 100)
+            t.load.return_value = {'other env': {}}
+            with t.assertRaises(KeyError):
+                t.source.reload()
+            t.assertEqual({'key': 'v1'}, t.source._index.values)
+            t.assertEqual((2, 10, 100), t.source._file_signature)
+
+    def test_reload_before_load(t):
+        t.assertTrue(t.source.reload())
+        t.assertEqual({'key': 'v0'}, t.source._index.values)
+        t.load.assert_called_once_with()
+
+    def test_reload_during_cold_load(t):
+        started = Event()
+        release = Event()
+
+        def slow_load():
+            started.set()
+            release.wait(10)
+            return {'env': {'key': 'v0'}}
+
+        loads = iter([slow_load, lambda: {'env': {'key': 'v1'}}])
+        t.load.side_effect = lambda: next(loads)()
+        # a cold lookup, parsing the file
+        loader = Thread(target=lambda: t.source._raw_data)
+        loader.start()
+        started.wait(10)
+
+        with t.subTest('reload does not wait for the load in progress'):
+            t.assertTrue(t.source.reload())
+            t.assertTrue(loader.is_alive())
+
+        release.set()
+        loader.join()
+
+        with t.subTest('the reloaded data is kept'):
+            t.assertEqual({'key': 'v1'}, t.source._raw_data['env'])
+            t.assertEqual({'key': 'v1'}, t.source._index.values)
+
+
 class MissingFileHandlersTests(TestCase):
     def setUp(t):
         t.file_path = Path('example.config.file')
@@ -153,3 +371,84 @@ class MissingFileHandlersTests(TestCase):
                     empty_fallback=sentinel.EmptyConfig,
                 )
                 t.assertIs(missing_file_handlers[option].return_value, ret)
+
+
+class FlatIndexTests(TestCase):
+    def setUp(t):
+        t.index = FlatIndex(EXAMPLE_CONFIG_DICT)
+
+    def test_values(t):
+        with t.subTest('leaf values by dotted path, in document order'):
+            t.assertEqual(
+                {
+                    'default': 'example',
+                    'example.bat.key': 'value',
+                    'example.bat.remote_host.api_key': 'example_api_key',
+                    'example.bat.remote_host.url': (
+                        'https://api-example.host.io/'
+                    ),
+                    'alt.bat.module.key': 'alt_value',
+                },
+                t.index.values,
+            )
+
+        with t.subTest('deep data does not hit the recursion limit'):
+            data: dict = {'key': 'deep value'}
+            for _ in range(2000):
+                data = {'d': data}
+            index = FlatIndex(data)
+            t.assertEqual({f'{"d." * 2000}key': 'deep value'}, index.values)
+
+    def test_branches(t):
+        t.assertEqual(
+            {
+                'example',
+                'example.bat',
+                'example.bat.remote_host',
+                'alt',
+                'alt.bat',
+                'alt.bat.module',
+            },
+            t.index.branches,
+        )
+
+    def test_from_paths(t):
+        values = {'key': 'v0', 'sec.sub.key': 'v1', 'sec.key': 'v2'}
+        index = FlatIndex.from_paths(values)
+        t.assertIs(values, index.values)
+        t.assertEqual({'sec', 'sec.sub'}, index.branches)
+        t.assertEqual({}, index.errors)
+
+        with t.subTest('errors'):
+            errors = {'sec.bad': ValueError('bad')}
+            index = FlatIndex.from_paths(values, errors)
+            t.assertIs(errors, index.errors)
+
+    def test_has_parent(t):
+        with t.subTest('top-level paths'):
+            t.assertTrue(t.index.has_parent('missing'))
+
+        with t.subTest('parent is a mapping'):
+            t.assertTrue(t.index.has_parent('example.bat.missing'))
+
+        with t.subTest('parent is a value'):
+            t.assertFalse(t.index.has_parent('example.bat.key.sub'))
+
+        with t.subTest('parent is missing'):
+            t.assertFalse(t.index.has_parent('example.missing.key'))
+
+    def test_paths(t):
+        with t.subTest('every path'):
+            t.assertEqual(list(t.index.values), t.index.paths())
+
+        with t.subTest('paths under a prefix'):
+            t.assertEqual(
+                [
+                    'example.bat.remote_host.api_key',
+                    'example.bat.remote_host.url',
+                ],
+                t.index.paths('example.bat.remote_host'),
+            )
+
+        with t.subTest('prefixes match whole path components'):
+            t.assertEqual([], t.index.paths('example.bat.remote'))
@@ -1,7 +1,14 @@
 import warnings
 
 from unittest import TestCase
-from unittest.mock import Mock, patch, mock_open, create_autospec, PropertyMock
+from unittest.mock import Mock, patch, mock_open, create_autospec
+
+from configparser import (
+    DuplicateSectionError,
+    InterpolationMissingOptionError,
+    InterpolationSyntaxError,
+)
+from io import StringIO
 
 from ..ini import (
     # Under Test
@@ -11,13 +18,20 @@ from ..ini import (
     _load_ini_file,
     _load_ini_file_flat,
     _load_ini,
-    _getter_methods,
-    _get_envs,
-    _get_sections,
-    _get_flat,
-    _get_empty,
+    _envs_index,
+    _sections_index,
+    _flat_index,
+    _option_path,
+    _flat_option,
+    _key_methods,
+    _dump_ini,
+    _restore_ini,
+    _cache_codecs,
     _file_type_loaders,
     _missing_file_handlers,
+    _SelectiveReader,
+    _section_items,
+    _split_sections,
     ConfigParser,
     EmptyConfigParser,
     Path,
@@ -132,6 +146,8 @@ class IniSourceTests(TestCase):
         t.assertEqual(ins._file_format, 'environments')
         t.assertEqual(ins._missing_file_option, 'warn')
         t.assertEqual(ins._config_file_path, Path(t.config_file_str))
+        t.assertEqual(ins._ini_reader, 'configparser')
+        t.assertEqual(ins._interpolation, 'basic')
         t._load_ini.assert_not_called()  # lazy: file not read on construction
 
         # Accessing _config_env triggers lazy load
@@ -140,12 +156,22 @@ class IniSourceTests(TestCase):
             file_path=Path(t.config_file_str),
             file_format='environments',
             when_missing='warn',
+            ini_reader='configparser',
+            config_env=None,
         )
 
     def test___init__catches_invalid_file_format(t):
         with t.assertRaises(ValueError):
             _ = IniSource(file_path=t.config_file_str, file_format='invalid')
 
+    def test___init__catches_invalid_ini_reader(t):
+        with t.assertRaises(ValueError):
+            _ = IniSource(file_path=t.config_file_str, ini_reader='invalid')
+
+    def test___init__catches_invalid_interpolation(t):
+        with t.assertRaises(ValueError):
+            _ = IniSource(file_path=t.config_file_str, interpolation='x')
+
     def test__file_format(t):
         with t.subTest('valid formats stored'):
             for fmt in ('environments', 'sections', 'flat'):
@@ -196,6 +222,25 @@ class IniSourceTests(TestCase):
                 file_path=Path(t.config_file_str),
                 file_format='environments',
                 when_missing='warn',
+                ini_reader='configparser',
+                config_env=None,
+            )
+
+        with t.subTest('passes the ini_reader and config_env to _load_ini'):
+            t._load_ini.reset_mock()
+            ins = IniSource(
+                file_path=t.config_file_str,
+                config_env='production',
+                ini_reader='selective',
+                interpolation='basic',
+            )
+            _ = ins._data
+            t._load_ini.assert_called_once_with(
+                file_path=Path(t.config_file_str),
+                file_format='environments',
+                when_missing='warn',
+                ini_reader='selective',
+                config_env='production',
             )
 
         with t.subTest('caches result'):
@@ -244,52 +289,142 @@ class IniSourceTests(TestCase):
                     file_path=Path(t.config_file_str),
                     file_format='environments',
                     when_missing=option,
+                    ini_reader='configparser',
+                    config_env=None,
                 )
 
-    def test__get_impl(t):
-        with patch.object(
-                IniSource,
-                '_data',
-                new_callable=PropertyMock
-        ) as mock_data:
-            with t.subTest('EmptyConfigParser'):
-                mock_data.return_value = EmptyConfigParser
-                t.assertIs(t.ins._get_impl, _getter_methods['empty'])
-
-            with t.subTest('environments'):
-                mock_data.return_value = CONFIG_PARSER_ENVS
-                t.ins._file_format = 'environments'
-                t.assertIs(t.ins._get_impl, _getter_methods['environments'])
-
-            with t.subTest('sections'):
-                t.ins._file_format = 'sections'
-                t.assertIs(t.ins._get_impl, _getter_methods['sections'])
-
-            with t.subTest('flat'):
-                t.ins._file_format = 'flat'
-                t.assertIs(t.ins._get_impl, _getter_methods['flat'])
+    def test__index(t):
+        with t.subTest('environments: options of the selected environment'):
+            t.assertEqual(
+                _envs_index(CONFIG_PARSER_ENVS, 'development'),
+                t.ins._index.values,
+            )
+            t.assertIs(t.ins._index, t.ins._index)
+
+        with t.subTest('EmptyConfigParser'):
+            t._load_ini.return_value = EmptyConfigParser
+            ins = IniSource(file_path=t.config_file_str)
+            t.assertEqual({}, ins._index.values)
 
-    def test_get(t):
-        """get() delegates to _get_impl"""
-        mock_getter = Mock(return_value=Mock())
+        with t.subTest('file formats without environments'):
+            t._load_ini.return_value = CONFIG_PARSER_ENVS
+            ins = IniSource(t.config_file_str, file_format='sections')
+            t.assertEqual(
+                _sections_index(CONFIG_PARSER_ENVS, None),
+                ins._index.values,
+            )
+
+        with t.subTest('values are interpolated once, as configured'):
+            parser = ConfigParser()
+            parser.read_string('[development]\nurl = %(host)s\nhost = h\n')
+            t._load_ini.return_value = parser
+            ins = IniSource(
+                t.config_file_str,
+                config_env='development',
+                interpolation='none',
+            )
+            _ = ins._index
+            with patch.object(ConfigParser, 'get') as get:
+                t.assertEqual('%(host)s', ins.get('url'))
+                t.assertEqual('%(host)s', ins.get('url'))
+            get.assert_not_called()
+
+    def test__keys(t):
+        for file_format in ('environments', 'sections', 'flat'):
+            with t.subTest(file_format):
+                ins = IniSource(t.config_file_str, file_format=file_format)
+                t.assertEqual(
+                    _key_methods[file_format]('Key', 'section'),
+                    ins._keys.get('Key', 'section'),
+                )
+
+    def test_compile(t):
+        t.ins.compile(iter(['project.database.token']))
+        t.assertEqual(
+            {'project.database.token': 'project.database.token'},
+            t.ins._keys._by_path,
+        )
+        t._load_ini.assert_not_called()
 
-        with patch.dict(f'{SRC}._getter_methods', environments=mock_getter):
-            ret = t.ins.get(key='section.key')
-        mock_getter.assert_called_with(t.ins, key='section.key', path=None)
-        t.assertIs(ret, mock_getter.return_value)
+    def test_get(t):
+        with t.subTest('dotted key'):
+            t.assertEqual('Dummy Plug', t.ins.get(key='project.user'))
 
         with t.subTest('path parameter'):
-            with patch.dict(
-                    f'{SRC}._getter_methods',
-                    environments=mock_getter
-            ):
-                ret = t.ins.get(key='key', path='section.sub')
-            mock_getter.assert_called_with(
-                t.ins,
-                key='key',
-                path='section.sub'
+            t.assertEqual(
+                'localhost/mydb',
+                t.ins.get(key='host', path='project.database'),
+            )
+
+        with t.subTest('option names are case-insensitive'):
+            t.assertEqual('localhost/mydb', t.ins.get('project.database.HOST'))
+
+        with t.subTest('missing values'):
+            t.assertIsNone(t.ins.get('project.missing'))
+            t.assertIsNone(t.ins.get('missing.user'))
+
+        with t.subTest('missing file'):
+            t._load_ini.return_value = EmptyConfigParser
+            ins = IniSource(file_path=t.config_file_str)
+            t.assertIsNone(ins.get('project.user'))
+
+    def test_interpolation_errors(t):
+        """Options which fail to interpolate raise only when looked up"""
+        parser = ConfigParser()
+        parser.read_string('[development]\nok = v\nratio = 100%\n')
+        t._load_ini.return_value = parser
+        ins = IniSource(t.config_file_str, config_env='development')
+
+        t.assertEqual(['ratio'], list(ins._index.errors))
+        t.assertEqual('v', ins.get('ok'))
+        t.assertEqual({'ok': 'v'}, ins.get_many(['ok', 'missing']))
+        for _ in range(2):
+            with t.assertRaises(InterpolationSyntaxError):
+                ins.get('ratio')
+            with t.assertRaises(InterpolationSyntaxError):
+                ins.get_many(['ok', 'ratio'])
+
+    def test_get_many(t):
+        with t.subTest('environments'):
+            t.assertEqual(
+                {
+                    'project.database.token': '*token-str*',
+                    'environment': 'development',
+                },
+                t.ins.get_many(
+                    [
+                        'project.database.token',
+                        'environment',
+                        'project.missing',
+                    ]
+                ),
+            )
+
+        with t.subTest('paths are translated as for get'):
+            t.assertEqual(
+                {'project.User': 'Dummy Plug'},
+                t.ins.get_many(['project.User']),
+            )
+
+    def test_paths(t):
+        with t.subTest('every path in the environment'):
+            t.assertEqual(
+                [
+                    'environment',
+                    'project.user',
+                    'project.database.host',
+                    'project.database.token',
+                    'pandas.display.max_rows',
+                    'pandas.display.max_columns',
+                ],
+                t.ins.paths(),
+            )
+
+        with t.subTest('paths under a prefix'):
+            t.assertEqual(
+                ['project.database.host', 'project.database.token'],
+                t.ins.paths('project.database'),
             )
-            t.assertIs(ret, mock_getter.return_value)
 
     def test_get_legacy_path_parameter(t):
         ret = t.ins.get(key='token', path='project.database')
@@ -307,85 +442,116 @@ class IniSourceTests(TestCase):
         )
 
 
-class GetConfigFunctionsTests(TestCase):
+class IndexFunctionsTests(TestCase):
     def setUp(t):
-        t.ic = Mock(_IniConfig, autospec=True)
-        t.ic._config_env = 'testing'
-        t.key = 'key'
+        t.parser = ConfigParser()
+        t.parser.read_string(
+            '[DEFAULT]\n'
+            'shared = default value\n'
+            '[testing]\n'
+            'key = v0\n'
+            '[testing.section.sub]\n'
+            'key = v1\n'
+            '[testing_other]\n'
+            'key = v2\n'
+        )
 
-    def test__get_envs(t):
-        """Gets values from a ConfigParser
-        which uses batconf-style environment sections
+    def test__envs_index(t):
+        """Sections of the config_env, keyed by their path relative to it.
+        Options from the DEFAULT section are included, as they are by get.
         """
-        with t.subTest('single key'):
-            """Getting a single-key, 
-            looks for the key in the _config_env section
-            """
-            ret = _get_envs(self=t.ic, key=t.key)
-            t.ic._data.get.assert_called_with(
-                option=t.key,
-                section=f'{t.ic._config_env}',
-                fallback=None,
-            )
-            t.assertIs(ret, t.ic._data.get.return_value)
+        t.assertEqual(
+            {
+                'key': 'v0',
+                'shared': 'default value',
+                'section.sub.key': 'v1',
+                'section.sub.shared': 'default value',
+            },
+            _envs_index(t.parser, 'testing'),
+        )
 
-        with t.subTest('path.to.key string'):
-            """given a '.' delimited fully* qualified key,
-            split off the rt.most value for the key,
-            and prepend the _config_environment to the section
-            """
-            ret = _get_envs(self=t.ic, key='section.sub.key')
-            t.ic._data.get.assert_called_with(
-                option=t.key,
-                section=f'{t.ic._config_env}.section.sub',
-                fallback=None,
-            )
-            t.assertIs(ret, t.ic._data.get.return_value)
+    def test__sections_index(t):
+        t.assertEqual(
+            {
+                'DEFAULT.shared': 'default value',
+                'testing.key': 'v0',
+                'testing.shared': 'default value',
+                'testing.section.sub.key': 'v1',
+                'testing.section.sub.shared': 'default value',
+                'testing_other.key': 'v2',
+                'testing_other.shared': 'default value',
+            },
+            _sections_index(t.parser, None),
+        )
 
-        with t.subTest('legacy path parameter'):
-            ret = _get_envs(self=t.ic, key='key', path='section.sub')
-            t.ic._data.get.assert_called_with(
-                option=t.key,
-                section=f'{t.ic._config_env}.section.sub',
-                fallback=None,
+    def test__flat_index(t):
+        parser = ConfigParser()
+        parser.read_string(f'[root]\n{EXAMPLE_FLAT_STR}')
+        t.assertEqual(
+            {
+                'k1': 'v1',
+                'key with spaces': 'val with spaces',
+                'key.with.dots': 'val.with.dots',
+            },
+            _flat_index(parser, None),
+        )
+
+    def test__section_items(t):
+        parser = ConfigParser()
+        parser.read_string(
+            '[DEFAULT]\n'
+            'host = localhost\n'
+            '[common]\n'
+            'port = 80\n'
+            '[sec]\n'
+            'basic = %(host)s\n'
+            'extended = ${host}:${common:port}\n'
+        )
+        cases = {
+            'none': ('%(host)s', '${host}:${common:port}'),
+            'basic': ('localhost', '${host}:${common:port}'),
+            'extended': ('%(host)s', 'localhost:80'),
+        }
+        for interpolation, (basic, extended) in cases.items():
+            with t.subTest(interpolation):
+                t.assertEqual(
+                    {
+                        'host': 'localhost',
+                        'basic': basic,
+                        'extended': extended,
+                    },
+                    dict(_section_items(parser, 'sec', interpolation)),
+                )
+
+        with t.subTest('options which fail to interpolate have the error'):
+            parser.read_string('[bad]\nratio = 100%\nmissing = %(x)s\n')
+            items = dict(_section_items(parser, 'bad', 'basic'))
+            t.assertEqual('localhost', items['host'])
+            t.assertIsInstance(items['ratio'], InterpolationSyntaxError)
+            t.assertIsInstance(
+                items['missing'], InterpolationMissingOptionError
             )
-            t.assertIs(ret, t.ic._data.get.return_value)
 
-    def test__get_sections(t) -> None:
-        """Get values from a ConfigParser which has sections
-        but does not use batconf-style environment sections.
-        This is for the standard .ini file format.
-        """
+
+class KeyFunctionsTests(TestCase):
+    def test__option_path(t):
         with t.subTest('single key'):
-            # Section files require a section be specified
-            ret = _get_sections(self=t.ic, key=t.key)
-            t.ic._data.get.assert_called_with(
-                option=t.key,
-                section='',  # this should fail and fallback to None
-                fallback=None,
-            )
-            # but returning None is handled by the _data.get method
-            t.assertIs(ret, t.ic._data.get.return_value)
-
-        with t.subTest('section.key'):
-            ret = _get_sections(self=t.ic, key='section.key')
-            t.ic._data.get.assert_called_with(
-                option='key',
-                section='section',
-                fallback=None,
-            )
-            t.assertIs(ret, t.ic._data.get.return_value)
+            t.assertEqual('key', _option_path('key'))
+
+        with t.subTest('path.to.key string'):
+            t.assertEqual('section.sub.key', _option_path('section.sub.key'))
 
         with t.subTest('legacy path parameter'):
-            ret = _get_sections(self=t.ic, key='key', path='section.sub')
-            t.ic._data.get.assert_called_with(
-                option=t.key,
-                section='section.sub',
-                fallback=None,
+            t.assertEqual(
+                'section.sub.key',
+                _option_path('key', path='section.sub'),
             )
-            t.assertIs(ret, t.ic._data.get.return_value)
 
-    def test__get_flat(t):
+        with t.subTest('option names are lower-cased, like ConfigParser'):
+            t.assertEqual('Section.key', _option_path('Section.KEY'))
+            t.assertEqual('key', _option_path('KEY'))
+
+    def test__flat_option(t):
         """Flat files contain no sections
         * a default 'root' section is injected into the ConfigParser
         So only single-key lookups are valid...
@@ -397,30 +563,14 @@ class GetConfigFunctionsTests(TestCase):
             section.subsection.key=value3
         """
         with t.subTest('single key'):
-            ret = _get_flat(self=t.ic, key=t.key)
-            t.ic._data.get.assert_called_with(
-                option=t.key,
-                section='root',
-                fallback=None,
-            )
-            t.assertIs(ret, t.ic._data.get.return_value)
+            t.assertEqual('key', _flat_option('Key'))
 
         with t.subTest('dot.delimited.key'):
-            ret = _get_flat(self=t.ic, key='this.is.a.valid.key')
-            t.ic._data.get.assert_called_with(
-                # the key is not split, it is taken literally
-                option='this.is.a.valid.key',
-                section='root',  # Uses the injected root section value
-                fallback=None,
+            # the key is not split, it is taken literally
+            t.assertEqual(
+                'this.is.a.valid.key',
+                _flat_option('this.is.a.valid.key', path='ignored'),
             )
-            t.assertIs(ret, t.ic._data.get.return_value)
-
-    def test__get_empty(t) -> None:
-        """_get_empty always returns None"""
-        ret = _get_empty(self=t.ic, key=t.key)
-        # All values are None
-        t.assertIsNone(ret)
-        t.assertIsNone(_get_empty(self=t.ic, key='any.key'))
 
 
 class _load_ini_file_Tests(TestCase):
@@ -482,6 +632,49 @@ class _load_ini_file_flat_Tests(TestCase):
             _ = _load_ini_file_flat(file_path=t.file_path)
 
 
+class DiskCacheCodecTests(TestCase):
+    def setUp(t):
+        t.parser = ConfigParser()
+        t.parser.read_string(
+            '[DEFAULT]\n'
+            'host = localhost\n'
+            '[sec]\n'
+            'url = http://%(host)s/\n'
+        )
+
+    def test__dump_ini(t):
+        """Raw values, in builtin types which marshal supports"""
+        t.assertEqual(
+            {
+                'DEFAULT': {'host': 'localhost'},
+                'sec': {'host': 'localhost', 'url': 'http://%(host)s/'},
+            },
+            _dump_ini(t.parser),
+        )
+
+    def test__restore_ini(t):
+        parser = _restore_ini(_dump_ini(t.parser))
+        t.assertIsInstance(parser, ConfigParser)
+        t.assertEqual(
+            _sections_index(t.parser, None),
+            _sections_index(parser, None),
+        )
+        t.assertEqual('http://localhost/', parser.get('sec', 'url'))
+
+        with t.subTest('raw values which can not be interpolated'):
+            t.parser.read_string('[sec]\nratio = 100%\n')
+            parser = _restore_ini(_dump_ini(t.parser))
+            t.assertEqual('100%', parser.get('sec', 'ratio', raw=True))
+            t.assertEqual('http://localhost/', parser.get('sec', 'url'))
+
+    def test_codecs_are_registered(t):
+        for loader_fn in (_load_ini_file, _load_ini_file_flat):
+            with t.subTest(loader_fn.__name__):
+                t.assertEqual(
+                    (_dump_ini, _restore_ini), _cache_codecs[loader_fn]
+                )
+
+
 class _load_ini_Tests(TestCase):
     """Tests for the _load_ini function"""
 
@@ -513,6 +706,139 @@ class _load_ini_Tests(TestCase):
                         ret, _missing_file_handlers[when_missing].return_value
                     )
 
+    @patch.dict(f'{SRC}._missing_file_handlers', mock_missing_file_handlers)
+    def test__load_ini_selective(t):
+        file_path = Path('testconfig.ini')
+        handler = _missing_file_handlers['warn']
+        handler.return_value = CONFIG_PARSER_ENVS
+
+        for file_format, all_sections in (
+            ('environments', False),
+            ('sections', True),
+        ):
+            with t.subTest(file_format):
+                ret = _load_ini(
+                    file_path=file_path,
+                    file_format=file_format,
+                    ini_reader='selective',
+                    config_env='dev',
+                )
+                handler.assert_called_with(
+                    file_path=file_path,
+                    loader_fn=_SelectiveReader('dev', all_sections),
+                    empty_fallback=EmptyConfigParser,
+                )
+                t.assertIs(CONFIG_PARSER_ENVS, ret)
+
+        with t.subTest('flat files are read by ConfigParser'):
+            ret = _load_ini(file_path, 'flat', ini_reader='selective')
+            handler.assert_called_with(
+                file_path=file_path,
+                loader_fn=_load_ini_file_flat,
+                empty_fallback=EmptyConfigParser,
+            )
+            t.assertIs(CONFIG_PARSER_ENVS, ret)
+
+
+class _SelectiveReaderTests(TestCase):
+    def setUp(t):
+        t.file_path = Path('testconfig.ini')
+
+    def read(t, ini_str: str, **kwargs) -> ConfigParser:
+        with patch('builtins.open', mock_open(read_data=ini_str)):
+            return _SelectiveReader(**kwargs)(t.file_path)
+
+    def test___call__(t):
+        with t.subTest('default environment'):
+            ret = t.read(INI_ENV_STR)
+            t.assertEqual(
+                [
+                    'batconf',
+                    'development',
+                    'development.project',
+                    'development.project.database',
+                    'development.pandas',
+                    'development.pandas.display',
+                ],
+                ret.sections(),
+            )
+            t.assertEqual(
+                _envs_index(CONFIG_PARSER_ENVS, 'development'),
+                _envs_index(ret, 'development'),
+            )
+
+        with t.subTest('selected environment'):
+            ret = t.read(INI_ENV_STR, config_env='production')
+            t.assertEqual(
+                ['batconf', 'production', 'production.project',
+                 'production.branch "wired"'],
+                ret.sections(),
+            )
+
+        with t.subTest('all sections'):
+            ret = t.read(INI_ENV_STR, all_sections=True)
+            t.assertEqual(CONFIG_PARSER_ENVS.sections(), ret.sections())
+
+        with t.subTest('values are raw, interpolated by the index'):
+            ret = t.read('[dev]\nratio = 100%\n', config_env='dev')
+            t.assertEqual('100%', ret.get('dev', 'ratio', raw=True))
+
+    def test_defaults_and_interpolation(t):
+        ret = t.read(
+            '[dev]\n'
+            'url = http://%(host)s/\n'
+            '[batconf]\n'
+            'default_env = dev\n'
+            '[DEFAULT]\n'
+            'host = localhost\n'
+        )
+        t.assertEqual(
+            {
+                'DEFAULT.host': 'localhost',
+                'batconf.default_env': 'dev',
+                'batconf.host': 'localhost',
+                'dev.url': 'http://localhost/',
+                'dev.host': 'localhost',
+            },
+            _sections_index(ret, None),
+        )
+
+    def test_errors_in_selected_sections(t):
+        with t.assertRaises(DuplicateSectionError):
+            t.read('[dev]\nk0 = v0\n[prod]\n[dev]\n', config_env='dev')
+
+        with t.subTest('other environments are not parsed'):
+            ret = t.read('[dev]\nk0 = v0\n[prod]\n[prod]\n', config_env='dev')
+            t.assertEqual({'dev.k0': 'v0'}, _sections_index(ret, None))
+
+    @patch(f'{SRC}._load_ini_file', autospec=True)
+    def test_full_read_fallback(t, _load_ini_file: Mock):
+        """Indented section headers are read by ConfigParser"""
+        _load_ini_file.return_value = config = ConfigParser()
+        config.read_string(INI_ENV_STR)
+        ret = t.read('[dev]\nk0 =\n  [value]\n', config_env='production')
+        _load_ini_file.assert_called_once_with(t.file_path)
+        t.assertEqual(
+            ['batconf', 'production', 'production.project',
+             'production.branch "wired"'],
+            ret.sections(),
+        )
+
+
+class _split_sections_Tests(TestCase):
+    def test__split_sections(t):
+        ret = _split_sections(
+            StringIO('# comment\n[sec0]\nk0 = v0\n[sec1]\n[sec0]\nk1 = v1')
+        )
+        t.assertEqual(
+            {
+                '': ['# comment\n'],
+                'sec0': ['[sec0]\n', 'k0 = v0\n', '[sec0]\n', 'k1 = v1\n'],
+                'sec1': ['[sec1]\n'],
+            },
+            ret,
+        )
+
 
 class GlobalsTests(TestCase):
     """test global variables in this test file"""
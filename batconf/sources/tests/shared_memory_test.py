@@ -0,0 +1,191 @@
+from unittest import TestCase
+from unittest.mock import patch, Mock
+
+from multiprocessing.shared_memory import SharedMemory
+
+from ...manager import Configuration
+from ...source import SourceList
+from ...tests.schemas import AppSchema
+from ..shared_memory import (
+    SharedMemorySource,
+    LAYOUT_VERSION,
+    encode,
+    publish,
+    _HEADER,
+    _MAGIC,
+)
+
+
+SRC = 'batconf.sources.shared_memory'
+
+
+class Source:
+    def __init__(self, values: dict):
+        self.values = values
+
+    def get(self, key: str, path: str | None = None):
+        return self.values.get(f'{path}.{key}')
+
+
+class PublishTests(TestCase):
+    def setUp(t):
+        t.cfg = Configuration(
+            SourceList([Source({'app.name': 'app', 'app.client.host': 'db'})]),
+            AppSchema,
+            path='app',
+        )
+
+    def shared_memory(t, shm: SharedMemory) -> SharedMemory:
+        t.addCleanup(shm.unlink)
+        t.addCleanup(shm.close)
+        return shm
+
+    def test_publish(t):
+        shm = t.shared_memory(publish(t.cfg))
+        src = SharedMemorySource(shm.name)
+        t.addCleanup(src.close)
+
+        with t.subTest('every resolved value, schema defaults included'):
+            t.assertEqual(
+                {
+                    'app.client.host': 'db',
+                    'app.client.port': '5432',
+                    'app.name': 'app',
+                },
+                src.get_many(
+                    [
+                        'app.client.host',
+                        'app.client.port',
+                        'app.name',
+                        'app.missing',
+                    ]
+                ),
+            )
+
+    def test_publish_with_name(t):
+        shm = t.shared_memory(publish(t.cfg, name='batconf_publish_test'))
+        t.assertEqual('batconf_publish_test', shm.name)
+
+    def test_encode(t):
+        data = encode({'b': 'é', 'a': 1})
+
+        with t.subTest('the table is at most half full'):
+            t.assertEqual(
+                (_MAGIC, LAYOUT_VERSION, 4), _HEADER.unpack_from(data)
+            )
+            t.assertEqual(
+                (_MAGIC, LAYOUT_VERSION, 1), _HEADER.unpack_from(encode({}))
+            )
+
+        with t.subTest('tagged values follow their keys'):
+            t.assertTrue(data.endswith(b'bs\xc3\xa9am\xe9\x01\x00\x00\x00'))
+
+        with t.subTest('unmarshallable values'):
+            with t.assertRaises(ValueError):
+                encode({'a': object()})
+
+
+class SharedMemorySourceTests(TestCase):
+    def setUp(t):
+        t.shm = publish_values(
+            {
+                'app.name': 'app',
+                'app.client.host': 'db',
+                'app.client.port': 5432,
+                'app.é': 'unicode',
+            }
+        )
+        t.addCleanup(t.shm.unlink)
+        t.addCleanup(t.shm.close)
+
+        t.src = SharedMemorySource(t.shm.name)
+        t.addCleanup(t.src.close)
+
+    def test___init__(t):
+        t.assertEqual(t.shm.name, t.src.name)
+
+        with t.subTest('Python < 3.13 can not opt out of tracking'):
+            attach = Mock(side_effect=[TypeError, SharedMemory(t.shm.name)])
+            with patch(f'{SRC}.SharedMemory', attach):
+                src = SharedMemorySource(t.shm.name)
+            src.close()
+            t.assertEqual(
+                [
+                    ((), {'name': t.shm.name, 'track': False}),
+                    ((), {'name': t.shm.name}),
+                ],
+                attach.call_args_list,
+            )
+
+        with t.subTest('missing'):
+            with t.assertRaises(FileNotFoundError):
+                SharedMemorySource('batconf_missing_segment')
+
+    def test___init___invalid_segment(t):
+        for data in [b'\x00' * 64, b'x', _HEADER.pack(_MAGIC, 0, 0)]:
+            shm = publish_bytes(data)
+            with t.subTest(data=data[:8]):
+                with t.assertRaises(ValueError):
+                    SharedMemorySource(shm.name)
+            shm.close()
+            shm.unlink()
+
+    def test_get(t):
+        t.assertEqual('app', t.src.get('name', 'app'))
+        t.assertEqual('db', t.src.get('host', 'app.client'))
+        t.assertEqual('unicode', t.src.get('é', 'app'))
+
+        with t.subTest('values which are not strings'):
+            t.assertEqual(5432, t.src.get('port', 'app.client'))
+
+        with t.subTest('missing'):
+            for key, path in [('a', None), ('app', None), ('zzz', 'app')]:
+                t.assertIsNone(t.src.get(key, path))
+
+    def test_get_colliding_keys(t):
+        values = {f'key{n}': f'value{n}' for n in range(200)}
+        shm = publish_values(values)
+        t.addCleanup(shm.unlink)
+        t.addCleanup(shm.close)
+        src = SharedMemorySource(shm.name)
+        t.addCleanup(src.close)
+
+        t.assertEqual(values, {k: src.get(k) for k in values})
+        t.assertEqual(
+            [None] * 200, [src.get(f'missing{n}') for n in range(200)]
+        )
+
+    def test_get_many(t):
+        t.assertEqual(
+            {'app.name': 'app', 'app.client.host': 'db'},
+            t.src.get_many(['app.name', 'app.client.host', 'app.missing']),
+        )
+
+    def test_configuration(t):
+        cfg = Configuration(SourceList([t.src]), AppSchema, path='app')
+        t.assertEqual('db', cfg.client.host)
+        t.assertEqual('app', cfg.name)
+
+    def test_close(t):
+        src = SharedMemorySource(t.shm.name)
+        src.get('name', 'app')
+        src.close()
+        t.assertIsNone(src.get('name', 'app'))
+
+    def test___str__(t):
+        t.assertEqual(f'Shared Memory: {t.src!r}', str(t.src))
+
+    def test___repr__(t):
+        t.assertEqual(
+            f'SharedMemorySource(name={t.shm.name})', repr(t.src)
+        )
+
+
+def publish_values(values: dict) -> SharedMemory:
+    return publish_bytes(encode(values))
+
+
+def publish_bytes(data: bytes) -> SharedMemory:
+    shm = SharedMemory(create=True, size=len(data))
+    shm.buf[: len(data)] = data  # type: ignore[index]
+    return shm
@@ -0,0 +1,249 @@
+import marshal
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from os import utime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ...manager import Configuration
+from ...source import SourceList
+from ...tests.schemas import AppSchema, ClientSchema
+from ..directory import DirectorySource
+from ..env import EnvConfig
+from ..ini import IniSource
+from ..snapshot import (
+    SnapshotSource,
+    SNAPSHOT_VERSION,
+    load_snapshot,
+    schema_fingerprint,
+    write_snapshot,
+)
+
+
+SRC = 'batconf.sources.snapshot'
+
+
+class SnapshotTests(TestCase):
+    def setUp(t):
+        tmp_dir = TemporaryDirectory()
+        t.addCleanup(tmp_dir.cleanup)
+        t.tmp_dir = Path(tmp_dir.name)
+
+        t.ini_path = t.tmp_dir / 'config.ini'
+        t.ini_path.write_text('[app]\nname = app\n[app.client]\nhost = db\n')
+        t.source_list = SourceList([IniSource(str(t.ini_path), 'sections')])
+        t.snapshot_path = t.tmp_dir / 'app.snapshot'
+
+    def write(t, source_list: SourceList | None = None) -> None:
+        write_snapshot(
+            t.snapshot_path, source_list or t.source_list, AppSchema, 'app'
+        )
+
+    def snapshot_files(t) -> dict:
+        return marshal.loads(t.snapshot_path.read_bytes())[2]
+
+    def load(t) -> dict:
+        return load_snapshot(t.snapshot_path, AppSchema, 'app')
+
+    def test_write_snapshot(t):
+        t.write()
+
+        version, fingerprint, files, env, values = marshal.loads(
+            t.snapshot_path.read_bytes()
+        )
+        t.assertEqual(SNAPSHOT_VERSION, version)
+        t.assertEqual(schema_fingerprint(AppSchema, 'app'), fingerprint)
+        st = t.ini_path.stat()
+        t.assertEqual(
+            {str(t.ini_path): (st.st_mtime_ns, st.st_size, st.st_ino)}, files
+        )
+        t.assertEqual({}, env)
+        with t.subTest('defaults are left to the Configuration'):
+            t.assertEqual({'app.name': 'app', 'app.client.host': 'db'}, values)
+
+        with t.subTest('no temporary files are left'):
+            t.assertEqual(
+                ['app.snapshot', 'config.ini'],
+                sorted(p.name for p in t.tmp_dir.iterdir()),
+            )
+
+    def test_write_snapshot_reloads_sources(t):
+        """Values loaded before a file changed are not stored with its new
+        signature.
+        """
+        t.assertEqual('app', t.source_list.get('app.name'))
+        t.ini_path.write_text('[app]\nname = changed\n')
+
+        t.write()
+        t.assertEqual({'app.name': 'changed'}, t.load())
+
+    def test_write_snapshot_replace_fails(t):
+        with patch(f'{SRC}.os.replace', side_effect=OSError('replace')):
+            with t.assertRaises(OSError):
+                t.write()
+
+        with t.subTest('the temporary file is removed'):
+            t.assertEqual(
+                ['config.ini'], [p.name for p in t.tmp_dir.iterdir()]
+            )
+
+    def test_write_snapshot_unmarshallable_value(t):
+        with patch.object(
+            t.source_list, 'get_many', return_value={'a': object()}
+        ):
+            with t.assertRaises(ValueError):
+                t.write()
+        t.assertFalse(t.snapshot_path.exists())
+
+    def test_load_snapshot(t):
+        t.write()
+        t.assertEqual({'app.name': 'app', 'app.client.host': 'db'}, t.load())
+
+        with t.subTest('missing'):
+            t.snapshot_path.unlink()
+            with t.assertRaises(FileNotFoundError):
+                t.load()
+
+    def test_load_snapshot_rejected(t):
+        def assert_rejected(message: str) -> None:
+            with t.assertRaises(ValueError) as ctx:
+                t.load()
+            t.assertIn(message, str(ctx.exception))
+
+        with t.subTest('unreadable'):
+            t.snapshot_path.write_bytes(b'not marshal data')
+            assert_rejected('Unreadable snapshot')
+            t.snapshot_path.write_bytes(marshal.dumps(('a', 'b')))
+            assert_rejected('Unreadable snapshot')
+
+        with t.subTest('another format version'):
+            t.snapshot_path.write_bytes(marshal.dumps((0, '', {}, {}, {})))
+            assert_rejected('has version 0')
+
+        with t.subTest('another schema'):
+            write_snapshot(t.snapshot_path, t.source_list, ClientSchema, 'app')
+            assert_rejected('written for another schema')
+            write_snapshot(t.snapshot_path, t.source_list, AppSchema, 'other')
+            assert_rejected('written for another schema')
+
+        with t.subTest('a config file changed'):
+            t.write()
+            utime(t.ini_path, ns=(0, 0))
+            assert_rejected(f'Stale snapshot {t.snapshot_path}: {t.ini_path}')
+
+        with t.subTest('a config file was removed'):
+            t.write()
+            t.ini_path.unlink()
+            assert_rejected('config.ini changed')
+
+        with t.subTest('a missing config file was created'):
+            t.write()
+            t.assertIsNone(t.snapshot_files()[str(t.ini_path)])
+            t.ini_path.write_text('[app]\n')
+            assert_rejected('config.ini changed')
+
+    def test_environment_variables(t):
+        ini_source = IniSource(str(t.ini_path), 'sections')
+        source_list = SourceList([EnvConfig(), ini_source])
+
+        with patch.dict('os.environ', {'APP_NAME': 'from env'}, clear=True):
+            t.write(source_list)
+            t.assertEqual(
+                {'app.name': 'from env', 'app.client.host': 'db'}, t.load()
+            )
+
+            with t.subTest('changed variables make the snapshot stale'):
+                with patch.dict('os.environ', {'APP_NAME': 'changed'}):
+                    with t.assertRaises(ValueError):
+                        t.load()
+
+            with t.subTest('added variables make the snapshot stale'):
+                with patch.dict('os.environ', {'APP_CLIENT_PORT': '1'}):
+                    with t.assertRaises(ValueError) as ctx:
+                        t.load()
+                t.assertIn('$APP_CLIENT_PORT changed', str(ctx.exception))
+
+            with t.subTest('removed variables make the snapshot stale'):
+                with patch.dict('os.environ', {}, clear=True):
+                    with t.assertRaises(ValueError):
+                        t.load()
+
+    def test_directory_source(t):
+        directory = t.tmp_dir / 'conf.d'
+        directory.mkdir()
+        (directory / '00.ini').write_text('[app]\nname = dir\n')
+        source_list = SourceList([DirectorySource(str(directory))])
+        t.write(source_list)
+        t.assertEqual({'app.name': 'dir'}, t.load())
+
+        with t.subTest('fragments are merged again'):
+            (directory / '00.ini').write_text('[app]\nname = changed\n')
+            t.write(source_list)
+            t.assertEqual({'app.name': 'changed'}, t.load())
+
+        with t.subTest('added fragments make the snapshot stale'):
+            (directory / '10.ini').write_text('[app]\nname = new\n')
+            with t.assertRaises(ValueError):
+                t.load()
+
+    def test_schema_fingerprint(t):
+        fingerprint = schema_fingerprint(AppSchema)
+        t.assertEqual(64, len(fingerprint))
+        t.assertEqual(
+            fingerprint, schema_fingerprint(AppSchema, AppSchema.__module__)
+        )
+        t.assertNotEqual(fingerprint, schema_fingerprint(AppSchema, 'app'))
+        t.assertNotEqual(fingerprint, schema_fingerprint(ClientSchema))
+
+
+class SnapshotSourceTests(TestCase):
+    def setUp(t):
+        tmp_dir = TemporaryDirectory()
+        t.addCleanup(tmp_dir.cleanup)
+        t.snapshot_path = Path(tmp_dir.name) / 'app.snapshot'
+        t.snapshot_path.write_bytes(
+            marshal.dumps(
+                (
+                    SNAPSHOT_VERSION,
+                    schema_fingerprint(AppSchema, 'app'),
+                    {},
+                    {},
+                    {'app.name': 'app', 'app.client.host': 'db'},
+                )
+            )
+        )
+        t.src = SnapshotSource(t.snapshot_path, AppSchema, 'app')
+
+    def test___init__(t):
+        t.assertEqual(t.snapshot_path, t.src._file_path)
+
+        with t.subTest('stale snapshots are rejected'):
+            with t.assertRaises(ValueError):
+                SnapshotSource(t.snapshot_path, ClientSchema, 'app')
+
+    def test_get(t):
+        t.assertEqual('app', t.src.get('name', 'app'))
+        t.assertEqual('db', t.src.get('host', 'app.client'))
+        t.assertIsNone(t.src.get('port', 'app.client'))
+
+    def test_get_many(t):
+        t.assertEqual(
+            {'app.client.host': 'db'},
+            t.src.get_many(['app.client.host', 'app.client.port']),
+        )
+
+    def test_configuration(t):
+        cfg = Configuration(SourceList([t.src]), AppSchema, path='app')
+        t.assertEqual('db', cfg.client.host)
+        t.assertEqual('5432', cfg.client.port)
+        t.assertEqual('app', cfg.name)
+
+    def test___str__(t):
+        t.assertEqual(f'Config Snapshot: {t.src!r}', str(t.src))
+
+    def test___repr__(t):
+        t.assertEqual(
+            f'SnapshotSource(file_path={t.snapshot_path})', repr(t.src)
+        )
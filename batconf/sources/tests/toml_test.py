@@ -244,6 +244,27 @@ class TomlSourceTests(TestCase):
         with t.subTest('missing key returns None'):
             t.assertIsNone(ts.get('section0.k10'))
 
+    def test_get_many(t):
+        ts = TomlSource(file_path=t.file_name)
+        t.assertEqual(
+            {'bat.key': 'value', 'bat.remote_host.api_key': 'example_api_key'},
+            ts.get_many(
+                ['bat.key', 'bat.remote_host.api_key', 'bat.dict', 'missing']
+            ),
+        )
+
+    def test_compile(t):
+        ts = TomlSource(file_path=t.file_name)
+        ts.compile(['bat.remote_host.api_key'])
+        t.assertEqual(
+            {'bat.remote_host.api_key': 'bat.remote_host.api_key'},
+            ts._keys._by_path,
+        )
+        t.assertEqual(
+            'example_api_key',
+            ts.get('api_key', path='bat.remote_host'),
+        )
+
     def test_config_env_argument(t):
         ts = TomlSource('./example.config.toml', config_env='alt')
         t.assertEqual(
@@ -268,6 +289,14 @@ class TomlSourceTests(TestCase):
         )
         t.assertIsNone(ts.get('bat.key'))
 
+    def test_paths(t):
+        ts = TomlSource(file_path=t.file_name)
+        t.assertEqual(
+            ['bat.remote_host.api_key', 'bat.remote_host.url'],
+            ts.paths('bat.remote_host'),
+        )
+        t.assertEqual(ts._index.paths(), ts.paths())
+
     def test_keys(t):
         ts = TomlSource(file_path=t.file_name)
         t.assertEqual(ts.keys(), ['bat'])
@@ -15,6 +15,10 @@ class SourcesTypesTests(TestCase):
     def test_protocols(t):
         t.assertTrue(hasattr(types, 'SourceInterfaceP'))
         t.assertTrue(hasattr(types, 'FileSourceP'))
+        t.assertTrue(hasattr(types, 'BatchSourceP'))
+        t.assertTrue(hasattr(types, 'CompilableSourceP'))
+        t.assertTrue(hasattr(types, 'LoadableSourceP'))
+        t.assertIn('LoadableSourceP', types.__all__)
 
     def test_deprecated_names(t):
         """Old Proto-suffixed names emit DeprecationWarning but still resolve."""
@@ -0,0 +1,189 @@
+from unittest import TestCase
+from unittest.mock import patch, Mock
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import sleep
+
+from ...source import SourceList
+from ..watch import FileWatcher, file_signature
+
+
+SRC = 'batconf.sources.watch'
+
+
+class Source:
+    def __init__(self, file_path: str):
+        self._config_file_path = Path(file_path)
+        self.reload = Mock(return_value=True)
+
+
+class FileWatcherTests(TestCase):
+    file_signature: Mock
+    monotonic: Mock
+
+    def setUp(t):
+        patches = ['file_signature', 'monotonic']
+        for target in patches:
+            patcher = patch(f'{SRC}.{target}', autospec=True)
+            setattr(t, target, patcher.start())
+            t.addCleanup(patcher.stop)
+
+        t.file_signature.return_value = (1, 10, 100)
+        t.monotonic.return_value = 0.0
+
+        t.source = Source('config.ini')
+        t.source_list = SourceList([t.source])
+        t.watcher = FileWatcher(t.source_list, interval=1.0, debounce=0.5)
+
+    def poll(t, signature, now: float) -> list:
+        t.file_signature.return_value = signature
+        t.monotonic.return_value = now
+        return t.watcher.check()
+
+    def test___init__(t):
+        watcher = FileWatcher(t.source_list)
+        t.assertIs(t.source_list, watcher.source_list)
+        t.assertEqual(1.0, watcher.interval)
+        t.assertEqual(0.5, watcher.debounce)
+
+    def test_check(t):
+        generation = t.source_list.generation
+
+        with t.subTest('the first poll records the file signature'):
+            t.assertEqual([], t.poll((1, 10, 100), now=0.0))
+            t.file_signature.assert_called_once_with(Path('config.ini'))
+
+        with t.subTest('unchanged files are not reloaded'):
+            t.assertEqual([], t.poll((1, 10, 100), now=1.0))
+
+        with t.subTest('changes are reloaded once stable for debounce'):
+            t.assertEqual([], t.poll((2, 10, 100), now=2.0))
+            t.assertEqual([], t.poll((2, 10, 100), now=2.4))
+            t.source.reload.assert_not_called()
+            t.assertEqual(generation, t.source_list.generation)
+
+            t.assertEqual([t.source], t.poll((2, 10, 100), now=2.5))
+            t.source.reload.assert_called_once_with()
+            t.assertEqual(generation + 1, t.source_list.generation)
+
+        with t.subTest('a file changing again restarts the debounce'):
+            t.source.reload.reset_mock()
+            t.poll((3, 10, 100), now=3.0)
+            t.poll((3, 11, 100), now=3.4)
+            t.poll((3, 11, 100), now=3.5)
+            t.source.reload.assert_not_called()
+            t.poll((3, 11, 100), now=3.9)
+            t.source.reload.assert_called_once_with()
+
+        with t.subTest('changes which are reverted are not reloaded'):
+            t.source.reload.reset_mock()
+            t.poll((4, 11, 100), now=4.0)
+            t.poll((3, 11, 100), now=4.5)
+            t.poll((3, 11, 100), now=5.0)
+            t.source.reload.assert_not_called()
+
+        with t.subTest('replaced files are reloaded'):
+            t.poll((3, 11, 101), now=6.0)
+            t.assertEqual([t.source], t.poll((3, 11, 101), now=7.0))
+
+    def test_check_removed_file(t):
+        t.watcher.debounce = 0
+        t.poll((1, 10, 100), now=0.0)
+
+        with t.assertLogs(SRC, level='WARNING') as log:
+            t.assertEqual([], t.poll(None, now=1.0))
+        t.assertIn('config.ini was removed, keeping its data', log.output[0])
+        t.source.reload.assert_not_called()
+
+        with t.subTest('restored files are reloaded'):
+            t.assertEqual([t.source], t.poll((2, 10, 100), now=2.0))
+
+    def test_check_without_debounce(t):
+        t.watcher.debounce = 0
+        t.poll((1, 10, 100), now=0.0)
+        t.assertEqual([t.source], t.poll((2, 10, 100), now=1.0))
+
+    def test_check_unchanged_data(t):
+        t.source.reload.return_value = False
+        generation = t.source_list.generation
+        t.watcher.debounce = 0
+        t.poll((1, 10, 100), now=0.0)
+
+        t.assertEqual([], t.poll((2, 10, 100), now=1.0))
+        t.source.reload.assert_called_once_with()
+        t.assertEqual(generation, t.source_list.generation)
+
+    def test_check_reload_error(t):
+        t.source.reload.side_effect = ValueError('invalid file')
+        t.watcher.debounce = 0
+        t.poll((1, 10, 100), now=0.0)
+
+        with t.assertLogs(SRC, level='ERROR') as log:
+            t.assertEqual([], t.poll((2, 10, 100), now=1.0))
+        t.assertIn('Failed to reload', log.output[0])
+
+        with t.subTest('not retried until the file changes again'):
+            t.source.reload.reset_mock()
+            t.poll((2, 10, 100), now=2.0)
+            t.source.reload.assert_not_called()
+
+    def test_watched_sources(t):
+        no_file = Source('config.ini')
+        no_file._config_file_path = None  # type: ignore[assignment]
+        not_reloadable = Mock(spec=['get', '_config_file_path'])
+        t.source_list.insert_source(no_file)
+        t.source_list.insert_source(not_reloadable)
+        inserted = Source('inserted.ini')
+        t.source_list.insert_source(inserted)
+
+        t.watcher.check()
+
+        t.assertEqual({t.source, inserted}, set(t.watcher._watched))
+
+    def test_start_stop(t):
+        t.watcher.debounce = 0
+        t.watcher.interval = 0.001
+
+        t.watcher.start()
+        with t.subTest('can only be started once'):
+            with t.assertRaises(RuntimeError):
+                t.watcher.start()
+
+        # start records the signature, the thread sees the change
+        t.file_signature.return_value = (2, 10, 100)
+        for _ in range(1000):
+            if t.source.reload.called:
+                break
+            sleep(0.001)
+        t.watcher.stop()
+
+        t.source.reload.assert_called_once_with()
+        t.assertIsNone(t.watcher._thread)
+
+        with t.subTest('stop is idempotent'):
+            t.watcher.stop()
+
+    def test_context_manager(t):
+        with patch.object(t.watcher, 'start') as start:
+            with patch.object(t.watcher, 'stop') as stop:
+                with t.watcher as watcher:
+                    t.assertIs(t.watcher, watcher)
+                    start.assert_called_once_with()
+                stop.assert_called_once_with()
+
+
+class FileSignatureTests(TestCase):
+    def test_file_signature(t):
+        with TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / 'config.ini'
+            file_path.write_text('[sec]\n')
+            st = file_path.stat()
+
+            t.assertEqual(
+                (st.st_mtime_ns, st.st_size, st.st_ino),
+                file_signature(file_path),
+            )
+
+        with t.subTest('missing files'):
+            t.assertIsNone(file_signature(file_path))
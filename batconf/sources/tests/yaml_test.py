@@ -10,6 +10,7 @@ from unittest.mock import (
 )
 
 from pathlib import Path as _PathClass
+from types import SimpleNamespace
 
 from ..yaml import (
     YamlSource,
@@ -22,11 +23,95 @@ from ..yaml import (
     _missing_file_handlers,
     _missing_config_warning,
     _YAML_IMPORT_ERROR_MSG,
+    _LIBYAML_IMPORT_ERROR_MSG,
+    _load_yaml_file_c,
+    _load_yaml_file_python,
+    _yaml_file_loaders,
+    _EnvironmentLoader,
+    _FullLoadRequired,
+    _build_environment,
+    _build_value,
+    _skip_value,
 )
 
 
 SRC = 'batconf.sources.yaml'
 
+
+# Stand-ins for the pyyaml event classes,
+# so the selective loader can be tested when pyyaml is not installed
+class Event:
+    def __init__(self, value=None, anchor=None):
+        self.value = value
+        self.anchor = anchor
+
+
+EVENT_TYPES = [
+    'StreamStartEvent',
+    'StreamEndEvent',
+    'DocumentStartEvent',
+    'DocumentEndEvent',
+    'MappingStartEvent',
+    'MappingEndEvent',
+    'SequenceStartEvent',
+    'SequenceEndEvent',
+    'ScalarEvent',
+    'AliasEvent',
+]
+events = SimpleNamespace(
+    **{name: type(name, (Event,), {}) for name in EVENT_TYPES}
+)
+
+
+def scalar(value, anchor=None):
+    return events.ScalarEvent(value, anchor)
+
+
+def mapping(*items, anchor=None):
+    return [
+        events.MappingStartEvent(anchor=anchor),
+        *items,
+        events.MappingEndEvent(),
+    ]
+
+
+def sequence(*items, anchor=None):
+    return [
+        events.SequenceStartEvent(anchor=anchor),
+        *items,
+        events.SequenceEndEvent(),
+    ]
+
+
+def flatten(*items):
+    for item in items:
+        if isinstance(item, list):
+            yield from flatten(*item)
+        else:
+            yield item
+
+
+def document(*root):
+    return iter(
+        [
+            events.StreamStartEvent(),
+            events.DocumentStartEvent(),
+            *flatten(*root),
+            events.DocumentEndEvent(),
+            events.StreamEndEvent(),
+        ]
+    )
+
+
+ENVIRONMENTS_EVENTS = [
+    scalar('batconf'),
+    mapping(scalar('default_env'), scalar('dev')),
+    scalar('dev'),
+    mapping(scalar('key'), scalar('dev value')),
+    scalar('prod'),
+    mapping(scalar('key'), scalar('prod value')),
+]
+
 EXAMPLE_CONFIG_YAML = """
 default: example
 
@@ -95,6 +180,8 @@ class YamlSourceTests(TestCase):
             file_path=_PathClass('test.yaml'),
             when_missing='warn',
             empty_fallback=EmptyYamlConfig,
+            yaml_loader='auto',
+            environment=None,
         )
 
     def test__data(t):
@@ -171,6 +258,45 @@ class YamlSourceTests(TestCase):
                 'Config path bat.key.sub does not exist',
             )
 
+    def test_get_many(t):
+        t.assertEqual(
+            {'bat.key': 'value', 'bat.remote_host.api_key': 'example_api_key'},
+            t.ys.get_many(
+                ['bat.key', 'bat.remote_host.api_key', 'bat', 'bat.missing']
+            ),
+        )
+
+    def test_compile(t):
+        t.ys.compile(['bat.remote_host.api_key'])
+        t.assertEqual(
+            {'bat.remote_host.api_key': 'bat.remote_host.api_key'},
+            t.ys._keys._by_path,
+        )
+        t.assertEqual(
+            'example_api_key',
+            t.ys.get('api_key', path='bat.remote_host'),
+        )
+
+    def test_paths(t):
+        with t.subTest('every path in the environment'):
+            t.assertEqual(
+                [
+                    'bat.key',
+                    'bat.remote_host.api_key',
+                    'bat.remote_host.url',
+                ],
+                t.ys.paths(),
+            )
+
+        with t.subTest('paths under a prefix'):
+            t.assertEqual(
+                ['bat.remote_host.api_key', 'bat.remote_host.url'],
+                t.ys.paths('bat.remote_host'),
+            )
+
+        with t.subTest('the index is built once'):
+            t.assertIs(t.ys._index, t.ys._index)
+
     def test_keys(t):
         t.assertEqual(
             EXAMPLE_ENVIRONMENTS_DICT['example'].keys(),
@@ -190,6 +316,33 @@ class YamlSourceTests(TestCase):
             repr(t.ys),
         )
 
+    def test_yaml_loader(t):
+        with t.subTest('passed to _load_yaml'):
+            ys = YamlSource(file_path='test.yaml', yaml_loader='python')
+            _ = ys._raw_data
+            t._load_yaml.assert_called_once_with(
+                file_path=_PathClass('test.yaml'),
+                when_missing='warn',
+                empty_fallback=EmptyYamlConfig,
+                yaml_loader='python',
+                environment=None,
+            )
+
+        with t.subTest('only environments files are loaded selectively'):
+            t._load_yaml.reset_mock()
+            ys = YamlSource(file_path='test.yaml', file_format='sections')
+            _ = ys._raw_data
+            t._load_yaml.assert_called_once_with(
+                file_path=_PathClass('test.yaml'),
+                when_missing='warn',
+                empty_fallback=EmptyYamlConfig,
+                yaml_loader='auto',
+            )
+
+        with t.subTest('invalid yaml_loader'):
+            with t.assertRaises(ValueError):
+                YamlSource(file_path='test.yaml', yaml_loader='fast')
+
     def test_config_env_argument(t):
         ys = YamlSource(file_path='test.yaml', config_env='alt')
         t.assertEqual(ys.get('key', path='bat.module'), 'alt_value')
@@ -397,6 +550,246 @@ class YamlConfigDeprecationTests(TestCase):
         t.assertEqual(yc_no_envs._file_format, 'sections')
 
 
+class EnvironmentLoaderTests(TestCase):
+    def setUp(t):
+        t.loader = _EnvironmentLoader('dev', yaml_loader='python')
+
+    def test___call__(t):
+        pyyaml = MagicMock(spec=['parse', 'BaseLoader'], **vars(events))
+        pyyaml.parse.return_value = document(mapping(ENVIRONMENTS_EVENTS))
+        file_path = _PathClass('config.yaml')
+
+        with patch.dict('sys.modules', {'yaml': pyyaml}), patch(
+            'builtins.open', mock_open(read_data='')
+        ) as m_open:
+            ret = t.loader(file_path)
+
+            with t.subTest('parses the file, with the yaml_loader'):
+                m_open.assert_called_once_with(file_path)
+                pyyaml.parse.assert_called_once_with(
+                    m_open.return_value, Loader=pyyaml.BaseLoader
+                )
+
+            with t.subTest('builds the batconf and selected environment'):
+                t.assertEqual(
+                    {
+                        'batconf': {'default_env': 'dev'},
+                        'dev': {'key': 'dev value'},
+                    },
+                    ret,
+                )
+
+            with t.subTest('unsupported documents are loaded in full'):
+                pyyaml.parse.return_value = document(scalar('not mapping'))
+                full_loader = create_autospec(_load_yaml_file_python)
+                with patch.dict(
+                    f'{SRC}._yaml_file_loaders', python=full_loader
+                ):
+                    ret = t.loader(file_path)
+                full_loader.assert_called_once_with(file_path)
+                t.assertIs(full_loader.return_value, ret)
+
+            with t.subTest('other environments are discarded after'):
+                pyyaml.parse.return_value = document(scalar('not mapping'))
+                full_loader = Mock(return_value=EXAMPLE_ENVIRONMENTS_DICT)
+                with patch.dict(
+                    f'{SRC}._yaml_file_loaders', python=full_loader
+                ):
+                    ret = _EnvironmentLoader('alt', 'python')(file_path)
+                t.assertEqual(
+                    {
+                        'batconf': EXAMPLE_ENVIRONMENTS_DICT['batconf'],
+                        'alt': EXAMPLE_ENVIRONMENTS_DICT['alt'],
+                    },
+                    ret,
+                )
+
+    def test_hash_and_repr(t):
+        """Loaders are keys for the parsed file caches"""
+        t.assertEqual(t.loader, _EnvironmentLoader('dev', 'python'))
+        t.assertEqual(
+            hash(t.loader), hash(_EnvironmentLoader('dev', 'python'))
+        )
+        t.assertNotEqual(t.loader, _EnvironmentLoader('prod', 'python'))
+        t.assertEqual(
+            "_EnvironmentLoader(config_env='dev', yaml_loader='python')",
+            repr(t.loader),
+        )
+
+    def test__load_yaml(t):
+        with patch.dict(
+            f'{SRC}._missing_file_handlers',
+            warn=create_autospec(_missing_file_handlers['warn']),
+        ):
+            _load_yaml(
+                file_path=_PathClass('config.yaml'),
+                when_missing='warn',
+                yaml_loader='python',
+                environment='dev',
+            )
+            _missing_file_handlers['warn'].assert_called_once_with(
+                loader_fn=t.loader,
+                file_path=_PathClass('config.yaml'),
+                empty_fallback=_empty_yaml_config,
+            )
+
+
+class BuildEnvironmentTests(TestCase):
+    def test__build_environment(t):
+        with t.subTest('the selected environment'):
+            t.assertEqual(
+                {
+                    'batconf': {'default_env': 'dev'},
+                    'prod': {'key': 'prod value'},
+                },
+                _build_environment(
+                    events, document(mapping(ENVIRONMENTS_EVENTS)), 'prod'
+                ),
+            )
+
+        with t.subTest('the default environment'):
+            t.assertEqual(
+                {
+                    'batconf': {'default_env': 'dev'},
+                    'dev': {'key': 'dev value'},
+                },
+                _build_environment(
+                    events, document(mapping(ENVIRONMENTS_EVENTS)), None
+                ),
+            )
+
+        with t.subTest('batconf after the default environment'):
+            doc = document(
+                mapping(ENVIRONMENTS_EVENTS[2:], ENVIRONMENTS_EVENTS[:2])
+            )
+            t.assertEqual(
+                {
+                    'batconf': {'default_env': 'dev'},
+                    'dev': {'key': 'dev value'},
+                },
+                _build_environment(events, doc, None),
+            )
+
+        with t.subTest('missing environment'):
+            t.assertEqual(
+                {'batconf': {'default_env': 'dev'}},
+                _build_environment(
+                    events, document(mapping(ENVIRONMENTS_EVENTS)), 'test'
+                ),
+            )
+
+        with t.subTest('missing batconf mapping'):
+            t.assertEqual(
+                {},
+                _build_environment(
+                    events, document(mapping(ENVIRONMENTS_EVENTS[2:])), None
+                ),
+            )
+
+    def test__build_environment_full_load_required(t):
+        for name, doc in {
+            'empty document': iter(
+                [events.StreamStartEvent(), events.StreamEndEvent()]
+            ),
+            'root is not a mapping': document(sequence(scalar('v'))),
+            'anchored root': document(mapping(anchor='root')),
+            'anchored top-level key': document(
+                mapping(scalar('dev', anchor='key'), scalar('v'))
+            ),
+            'complex top-level key': document(
+                mapping(sequence(scalar('k')), scalar('v'))
+            ),
+            'alias to a skipped environment': document(
+                mapping(
+                    scalar('prod'),
+                    mapping(scalar('key'), scalar('v', anchor='value')),
+                    scalar('dev'),
+                    mapping(scalar('key'), events.AliasEvent(anchor='value')),
+                )
+            ),
+            'multiple documents': iter(
+                [
+                    events.StreamStartEvent(),
+                    events.DocumentStartEvent(),
+                    *flatten(mapping()),
+                    events.DocumentEndEvent(),
+                    events.DocumentStartEvent(),
+                ]
+            ),
+        }.items():
+            with t.subTest(name):
+                with t.assertRaises(_FullLoadRequired):
+                    _build_environment(events, doc, 'dev')
+
+    def test__build_value(t):
+        def build(*items):
+            values = flatten(*items)
+            return _build_value(events, next(values), values, anchors)
+
+        anchors: dict = {}
+
+        with t.subTest('scalars are strings'):
+            t.assertEqual('1', build(scalar('1')))
+
+        with t.subTest('nested mappings and sequences'):
+            t.assertEqual(
+                {'k0': ['v0', {'k1': 'v1'}], 'k2': {}},
+                build(
+                    mapping(
+                        scalar('k0'),
+                        sequence(
+                            scalar('v0'), mapping(scalar('k1'), scalar('v1'))
+                        ),
+                        scalar('k2'),
+                        mapping(),
+                    )
+                ),
+            )
+
+        with t.subTest('aliases share the anchored value'):
+            ret = build(
+                sequence(
+                    mapping(scalar('k'), scalar('v'), anchor='m'),
+                    events.AliasEvent(anchor='m'),
+                )
+            )
+            t.assertEqual([{'k': 'v'}, {'k': 'v'}], ret)
+            t.assertIs(ret[0], ret[1])
+            t.assertIs(ret[0], anchors['m'])
+
+        with t.subTest('duplicate keys, the last value wins'):
+            t.assertEqual(
+                {'k': 'v1'},
+                build(
+                    mapping(
+                        scalar('k'), scalar('v0'), scalar('k'), scalar('v1')
+                    )
+                ),
+            )
+
+        with t.subTest('undefined alias'):
+            with t.assertRaises(_FullLoadRequired):
+                build(sequence(events.AliasEvent(anchor='undefined')))
+
+        with t.subTest('complex keys'):
+            with t.assertRaises(_FullLoadRequired):
+                build(mapping(sequence(), scalar('v')))
+
+    def test__skip_value(t):
+        for name, value in {
+            'scalar': [scalar('v')],
+            'alias': [events.AliasEvent(anchor='a')],
+            'nested': mapping(
+                scalar('k'), sequence(scalar('v'), mapping()), scalar('k2')
+            ),
+        }.items():
+            with t.subTest(name):
+                remaining = scalar('next')
+                values = flatten(value, remaining)
+                _skip_value(events, next(values), values)
+                t.assertIs(remaining, next(values))
+
+
 class get_file_pathTests(TestCase):
     Path: Mock
 
@@ -482,8 +875,9 @@ class YamlLoaderFunctionsTests(TestCase):
         pyyaml = MagicMock(spec=['load', 'BaseLoader'])
         pyyaml.load.return_value = EXAMPLE_CONFIG_DICT
         pyyaml_patcher = patch.dict('sys.modules', {'yaml': pyyaml})
-        t.pyyaml = pyyaml_patcher.start()
+        pyyaml_patcher.start()
         t.addCleanup(pyyaml_patcher.stop)
+        t.pyyaml = pyyaml
 
         # Patch out the `with open` statement, so it returns the mock_open obj
         t.m_open = mock_open(read_data=EXAMPLE_CONFIG_YAML)
@@ -516,8 +910,11 @@ class YamlLoaderFunctionsTests(TestCase):
                 )
                 t.assertIs(_missing_file_handlers[opt].return_value, ret)
 
-    @patch(f'{SRC}._load_yaml_file', autospec=True)
-    def test__load_yaml__error(t, _load_yaml_file: Mock):
+    @patch.dict(
+        f'{SRC}._yaml_file_loaders', auto=create_autospec(_load_yaml_file)
+    )
+    def test__load_yaml__error(t):
+        _load_yaml_file = _yaml_file_loaders['auto']
         _load_yaml_file.side_effect = FileNotFoundError
 
         with t.assertRaises(FileNotFoundError):
@@ -544,13 +941,75 @@ class YamlLoaderFunctionsTests(TestCase):
 
             t.assertEqual(err.exception.msg, _YAML_IMPORT_ERROR_MSG)
 
+    def test__load_yaml__yaml_loader(t):
+        for yaml_loader, loader_fn in _yaml_file_loaders.items():
+            with t.subTest(yaml_loader=yaml_loader):
+                with patch.dict(
+                    f'{SRC}._missing_file_handlers',
+                    error=create_autospec(_missing_file_handlers['error']),
+                ):
+                    _load_yaml(
+                        file_path=t.file_path,
+                        when_missing='error',
+                        yaml_loader=yaml_loader,
+                    )
+                    _missing_file_handlers['error'].assert_called_with(
+                        loader_fn=loader_fn,
+                        file_path=t.file_path,
+                        empty_fallback=_empty_yaml_config,
+                    )
+
+    def test__yaml_file_loaders(t):
+        t.assertEqual(
+            {
+                'auto': _load_yaml_file,
+                'c': _load_yaml_file_c,
+                'python': _load_yaml_file_python,
+            },
+            _yaml_file_loaders,
+        )
+
     def test__load_yaml_file(t):
         with t.subTest('file found'):
             ret = _load_yaml_file(file_path=t.file_path)
             t.assertEqual(ret, EXAMPLE_CONFIG_DICT)
             t.open.assert_called_with(t.file_path)
 
+        with t.subTest('pure-Python BaseLoader without libyaml'):
+            t.pyyaml.load.assert_called_with(
+                t.open.return_value, Loader=t.pyyaml.BaseLoader
+            )
+
+        with t.subTest('libyaml CBaseLoader when available'):
+            t.pyyaml.CBaseLoader = Mock()
+            _load_yaml_file(file_path=t.file_path)
+            t.pyyaml.load.assert_called_with(
+                t.open.return_value, Loader=t.pyyaml.CBaseLoader
+            )
+
         with t.subTest('missing file'):
             t.open.side_effect = FileNotFoundError
             with t.assertRaises(FileNotFoundError):
                 _ = _load_yaml_file(file_path=t.file_path)
+
+    def test__load_yaml_file_c(t):
+        with t.subTest('PyYAML built without libyaml'):
+            with t.assertRaises(ImportError) as err:
+                _load_yaml_file_c(file_path=t.file_path)
+            t.assertEqual(err.exception.msg, _LIBYAML_IMPORT_ERROR_MSG)
+
+        with t.subTest('libyaml CBaseLoader'):
+            t.pyyaml.CBaseLoader = Mock()
+            ret = _load_yaml_file_c(file_path=t.file_path)
+            t.assertEqual(ret, EXAMPLE_CONFIG_DICT)
+            t.pyyaml.load.assert_called_with(
+                t.open.return_value, Loader=t.pyyaml.CBaseLoader
+            )
+
+    def test__load_yaml_file_python(t):
+        t.pyyaml.CBaseLoader = Mock()
+        ret = _load_yaml_file_python(file_path=t.file_path)
+        t.assertEqual(ret, EXAMPLE_CONFIG_DICT)
+        t.pyyaml.load.assert_called_with(
+            t.open.return_value, Loader=t.pyyaml.BaseLoader
+        )
@@ -1,15 +1,21 @@
 from functools import cached_property
-from typing import Any
+from typing import Any, Iterable
 from logging import getLogger
 
 from pathlib import Path
 from enum import Enum, auto
 
+from .._utils import single_flight_property
+from ..source import KeyTable, join_path
 from .file import (
     ConfigFileFormats,
     _MissingFileOption,
     missing_file_handlers as _missing_file_handlers,
     file_config_repr,
+    load_file_source,
+    record_file_signature,
+    reload_file_source,
+    FlatIndex,
 )
 from .types import FileSourceP
 from ._compat import make_deprecated_getattr
@@ -59,23 +65,38 @@ class TomlSource(FileSourceP):
         self._file_format = file_format
         self._config_env = config_env
         self._missing_file_option = missing_file_option
+        self._keys = KeyTable(translate=join_path)
 
     def get(self, key: str, path: _OptStr = None) -> _OptStr:
-        parts = path.split('.') + key.split('.') if path else key.split('.')
-        conf: Any = self._data
-        try:
-            for k in parts:
-                conf = conf.get(k)
-        except AttributeError:
-            log.warning(f'Config path {".".join(parts)} does not exist')
-            return None
-        return None if isinstance(conf, dict) else conf
+        return self._get_path(self._keys.get(key, path))
+
+    def get_many(self, paths: Iterable[str]) -> dict[str, str]:
+        found = {}
+        for path in paths:
+            if (value := self._get_path(path)) is not None:
+                found[path] = value
+        return found
+
+    def compile(self, paths: Iterable[str]) -> None:
+        self._keys.compile(paths)
+
+    def _get_path(self, path: str) -> _OptStr:
+        index = self._index
+        if (value := index.values.get(path)) is None:
+            if not index.has_parent(path):
+                log.warning(f'Config path {path} does not exist')
+        return value
+
+    def paths(self, prefix: str | None = None) -> list[str]:
+        """Dotted path of every value, optionally only those under prefix."""
+        return self._index.paths(prefix)
 
     def keys(self) -> list[str]:
         return list(self._data.keys())
 
-    @cached_property
+    @single_flight_property
     def _raw_data(self) -> TomlDictT:
+        record_file_signature(self)
         return _load_toml(
             file_path=self._config_file_path,
             when_missing=self._missing_file_option,
@@ -97,6 +118,10 @@ class TomlSource(FileSourceP):
 
         return self._raw_data
 
+    @cached_property
+    def _index(self) -> FlatIndex:
+        return FlatIndex(self._data)
+
     # TODO: Fix type-hints when the next version of MyPy is released
     @property
     def _config_env(self):  # -> str | None:
@@ -120,6 +145,10 @@ class TomlSource(FileSourceP):
 
     __repr__ = file_config_repr
 
+    load = load_file_source
+
+    reload = reload_file_source
+
 
 EmptyConfigDict: dict[None, None] = dict()
 
@@ -1,4 +1,4 @@
-from typing import Literal, Protocol
+from typing import Iterable, Literal, Protocol
 
 ConfigFileFormats = Literal['flat', 'sections', 'environments']
 FILE_FORMATS: list[ConfigFileFormats] = ['flat', 'sections', 'environments']
@@ -9,6 +9,55 @@ class SourceInterfaceP(Protocol):
     def get(self, key: str, path: str | None) -> str | None: ...
 
 
+class BatchSourceP(SourceInterfaceP, Protocol):
+    """Protocol for sources which can look up a batch of keys in one call.
+
+    ``get_many`` is optional; sources without it are queried one key at a
+    time with ``get``. Each dotted path in ``paths`` is equivalent to the
+    ``get`` call with the path split on its last ``.``, so
+    ``get_many(['project.client.key1'])`` finds the same value as
+    ``get('key1', path='project.client')``.
+    Paths with no value are omitted from the returned dict.
+    """
+
+    def get_many(self, paths: Iterable[str]) -> dict[str, str]: ...
+
+
+class CompilableSourceP(SourceInterfaceP, Protocol):
+    """Protocol for sources which can precompute their native lookup keys.
+
+    ``compile`` is optional. It is passed the fully qualified dotted path of
+    every option in a configuration schema, so the source can translate each
+    one into its native key once, rather than on every lookup.
+    See :meth:`batconf.SourceList.compile`.
+    """
+
+    def compile(self, paths: Iterable[str]) -> None: ...
+
+
+class LoadableSourceP(SourceInterfaceP, Protocol):
+    """Protocol for sources which load their data lazily.
+
+    ``load`` is optional. It reads the source's data now, ex: parses its
+    config file, rather than on the first lookup, and does nothing if the
+    data is already loaded. See :meth:`batconf.Configuration.preload`.
+    """
+
+    def load(self) -> None: ...
+
+
+class ReloadableSourceP(SourceInterfaceP, Protocol):
+    """Protocol for sources which can read their data again.
+
+    ``reload`` is optional. It reads the source's data again, ex: a changed
+    config file, and returns True when the data changed. Call
+    :meth:`batconf.SourceList.invalidate` afterwards, so cached values are
+    discarded. See :class:`batconf.sources.watch.FileWatcher`.
+    """
+
+    def reload(self) -> bool: ...
+
+
 class FileSourceP(SourceInterfaceP, Protocol):
     """Protocol for file-backed configuration sources.
 
@@ -40,10 +89,14 @@ class FileSourceP(SourceInterfaceP, Protocol):
 
 
 __all__ = [
+    'BatchSourceP',
+    'CompilableSourceP',
     'ConfigFileFormats',
     'FILE_FORMATS',
     'FileSourceP',
+    'LoadableSourceP',
     'MissingFileOption',
+    'ReloadableSourceP',
     'SourceInterfaceP',
 ]
 
@@ -0,0 +1,177 @@
+"""Reload file sources when their config files change.
+
+Long-running processes can pick up config file changes without a restart::
+
+    >>> sources = SourceList([EnvSource(), IniSource('config.ini')])
+    >>> watcher = FileWatcher(sources, interval=1.0)
+    >>> watcher.start()
+
+The watcher polls the files with ``stat``, so it works on every platform
+and filesystem, and reloads a file once its modification time, size and
+inode have been stable for ``debounce`` seconds. Parsing happens on the
+watcher thread; lookups keep using the old data until the new data is
+swapped in, then :meth:`SourceList.invalidate` is called so a
+``Configuration(cache=True)`` discards its cached values.
+"""
+
+from logging import getLogger
+from os import stat
+from pathlib import Path
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Any
+
+from ..source import SourceList
+from .types import ReloadableSourceP
+
+
+log = getLogger(__name__)
+
+FileSignatureT = tuple[int, int, int] | None
+
+
+def file_signature(file_path: Path | str) -> FileSignatureT:
+    """``(mtime_ns, size, inode)`` of the file, or None if it is missing."""
+    try:
+        st = stat(file_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class _WatchedFile:
+    def __init__(self, signature: FileSignatureT) -> None:
+        self.signature = signature
+        self.pending = False
+        self.pending_signature: FileSignatureT = None
+        self.changed_at = 0.0
+
+
+class FileWatcher:
+    """Poll the config files of a SourceList, and reload changed sources.
+
+    Every source in the list with a ``reload`` method and a config file is
+    watched, including sources inserted after the watcher is created.
+    A change is first seen by one poll, and the source is reloaded by the
+    first poll at least ``debounce`` seconds later, if the file has not
+    changed again in between; so files which are still being written are
+    not read.
+
+    Parameters
+    ----------
+    source_list : SourceList
+        Sources to watch, invalidated after a source is reloaded.
+    interval : float, default=1.0
+        Seconds between polls.
+    debounce : float, default=0.5
+        Seconds a changed file must be stable for, before it is reloaded.
+
+    Examples
+    --------
+    >>> with FileWatcher(source_list, interval=5.0):
+    ...     serve_forever()
+    """
+
+    def __init__(
+        self,
+        source_list: SourceList,
+        interval: float = 1.0,
+        debounce: float = 0.5,
+    ) -> None:
+        self.source_list = source_list
+        self.interval = interval
+        self.debounce = debounce
+        self._watched: dict[ReloadableSourceP, _WatchedFile] = {}
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Thread | None = None
+
+    def check(self) -> list[ReloadableSourceP]:
+        """Poll every watched file once, and reload the changed sources.
+
+        Called by the watcher thread, or directly without starting it.
+        Errors while reloading a source are logged, and it keeps its old
+        data until the file changes again. Sources whose file is removed
+        also keep their data, until the file is restored.
+
+        Returns
+        -------
+        list
+            Sources whose data changed.
+        """
+        with self._lock:
+            reloaded = self._check(monotonic())
+        if reloaded:
+            self.source_list.invalidate()
+        return reloaded
+
+    def _check(self, now: float) -> list[ReloadableSourceP]:
+        reloaded = []
+        for source, file_path in self._sources():
+            signature = file_signature(file_path)
+            watched = self._watched.get(source)
+            if watched is None:
+                self._watched[source] = _WatchedFile(signature)
+                continue
+            if signature == watched.signature:
+                watched.pending = False
+                continue
+            if not watched.pending or signature != watched.pending_signature:
+                watched.pending = True
+                watched.pending_signature = signature
+                watched.changed_at = now
+            if now - watched.changed_at < self.debounce:
+                continue
+
+            watched.signature = signature
+            watched.pending = False
+            if signature is None:
+                log.warning(f'{file_path} was removed, keeping its data')
+                continue
+            try:
+                changed = source.reload()
+            except Exception:
+                log.exception(f'Failed to reload {source}')
+                continue
+            if changed:
+                log.info(f'Reloaded {source}')
+                reloaded.append(source)
+        return reloaded
+
+    def start(self) -> None:
+        """Poll the files on a daemon thread, every ``interval`` seconds."""
+        if self._thread is not None:
+            raise RuntimeError('FileWatcher is already started')
+        # record the current signatures, later polls detect changes
+        self.check()
+        self._stop.clear()
+        self._thread = Thread(
+            target=self._run, name='batconf-file-watcher', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the watcher thread, and wait for it to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def _sources(self) -> list[tuple[ReloadableSourceP, Path]]:
+        watched: list[tuple[Any, Path]] = []
+        for source in self.source_list._sources:
+            file_path = getattr(source, '_config_file_path', None)
+            if file_path is not None and hasattr(source, 'reload'):
+                watched.append((source, file_path))
+        return watched
+
+    def __enter__(self) -> 'FileWatcher':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
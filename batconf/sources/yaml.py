@@ -1,7 +1,9 @@
 # Postpones evaluation of type hints for compatibility
 from __future__ import annotations
 from functools import cached_property
-from typing import Any
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import Any, Iterable, Iterator, Literal
 
 from logging import getLogger
 
@@ -10,10 +12,16 @@ from pathlib import Path
 from .file import (
     ConfigFileFormats,
     file_config_repr,
+    load_file_source,
+    record_file_signature,
+    reload_file_source,
     missing_file_handlers as _missing_file_handlers,
+    FlatIndex,
+    FileLoaderP,
 )
 from .types import FileSourceP, MissingFileOption as _MissingFileOption
-from ..source import SourceInterface
+from .._utils import single_flight_property
+from ..source import KeyTable, SourceInterface, join_path
 from ._compat import make_deprecated_getattr
 
 
@@ -21,6 +29,8 @@ log = getLogger(__name__)
 
 EmptyYamlConfig: dict[None, None] = dict()
 
+YamlLoaderOption = Literal['auto', 'c', 'python']
+
 
 class YamlSource(FileSourceP):
     """Configuration source backed by a YAML file.
@@ -39,6 +49,11 @@ class YamlSource(FileSourceP):
         ``batconf.default_env`` in the YAML file is used.
     missing_file_option : {'warn', 'ignore', 'error'}, default='warn'
         Behaviour when the specified file is missing.
+    yaml_loader : {'auto', 'c', 'python'}, default='auto'
+        YAML parser. ``'c'`` uses libyaml, which is much faster, and
+        requires PyYAML built with libyaml; ``'python'`` uses the
+        pure-Python parser; ``'auto'`` uses libyaml when it is available.
+        Every value is loaded as a string, whichever parser is used.
 
     Examples
     --------
@@ -51,18 +66,34 @@ class YamlSource(FileSourceP):
         file_format: ConfigFileFormats = 'environments',
         config_env: str | None = None,
         missing_file_option: _MissingFileOption = 'warn',
+        yaml_loader: YamlLoaderOption = 'auto',
     ):
+        if yaml_loader not in _yaml_file_loaders:
+            raise ValueError(f'Invalid yaml_loader: {yaml_loader}')
+        self._yaml_loader = yaml_loader
         self._missing_file_option = missing_file_option
         self._file_format = file_format
         self._config_file_path = Path(file_path)
         self._config_env = config_env
+        self._keys = KeyTable(translate=join_path)
 
-    @cached_property
+    @single_flight_property
     def _raw_data(self) -> dict:
+        record_file_signature(self)
+        if self._file_format != 'environments':
+            return _load_yaml(
+                file_path=self._config_file_path,
+                when_missing=self._missing_file_option,
+                empty_fallback=EmptyYamlConfig,
+                yaml_loader=self._yaml_loader,
+            )
+        # Only the batconf mapping and the selected environment are built
         return _load_yaml(
             file_path=self._config_file_path,
             when_missing=self._missing_file_option,
             empty_fallback=EmptyYamlConfig,
+            yaml_loader=self._yaml_loader,
+            environment=self.__config_env,
         )
 
     @cached_property
@@ -79,6 +110,10 @@ class YamlSource(FileSourceP):
                 ) from err
         return self._raw_data
 
+    @cached_property
+    def _index(self) -> FlatIndex:
+        return FlatIndex(self._data)
+
     # TODO: Fix type-hints when the next version of MyPy is released
     @property
     def _config_env(self):  # -> str | None:
@@ -98,15 +133,28 @@ class YamlSource(FileSourceP):
         self.__config_env = env
 
     def get(self, key: str, path: str | None = None) -> str | None:
-        parts = path.split('.') + key.split('.') if path else key.split('.')
-        conf: Any = self._data
-        try:
-            for k in parts:
-                conf = conf.get(k)
-        except AttributeError:
-            log.warning(f'Config path {".".join(parts)} does not exist')
-            return None
-        return None if isinstance(conf, dict) else conf
+        return self._get_path(self._keys.get(key, path))
+
+    def get_many(self, paths: Iterable[str]) -> dict[str, str]:
+        found = {}
+        for path in paths:
+            if (value := self._get_path(path)) is not None:
+                found[path] = value
+        return found
+
+    def compile(self, paths: Iterable[str]) -> None:
+        self._keys.compile(paths)
+
+    def _get_path(self, path: str) -> str | None:
+        index = self._index
+        if (value := index.values.get(path)) is None:
+            if not index.has_parent(path):
+                log.warning(f'Config path {path} does not exist')
+        return value
+
+    def paths(self, prefix: str | None = None) -> list[str]:
+        """Dotted path of every value, optionally only those under prefix."""
+        return self._index.paths(prefix)
 
     def keys(self):
         return self._data.keys()
@@ -116,6 +164,10 @@ class YamlSource(FileSourceP):
 
     __repr__ = file_config_repr
 
+    load = load_file_source
+
+    reload = reload_file_source
+
 
 class YamlConfig(SourceInterface):
     """
@@ -264,26 +316,254 @@ def get_file_path(
 _empty_yaml_config: dict = {'default': 'none', 'none': {}}
 
 
+class _AllEnvironments(Enum):
+    token = auto()
+
+
+# Load the whole file, rather than one environment
+_ALL_ENVIRONMENTS = _AllEnvironments.token
+
+
 def _load_yaml(
     file_path: Path,
     when_missing: _MissingFileOption,
     empty_fallback: Any = _empty_yaml_config,
+    yaml_loader: YamlLoaderOption = 'auto',
+    environment: str | None | _AllEnvironments = _ALL_ENVIRONMENTS,
 ) -> dict:
+    loader_fn: FileLoaderP
+    if environment is _ALL_ENVIRONMENTS:
+        loader_fn = _yaml_file_loaders[yaml_loader]
+    else:
+        loader_fn = _EnvironmentLoader(environment, yaml_loader)
     return _missing_file_handlers[when_missing](
-        loader_fn=_load_yaml_file,
+        loader_fn=loader_fn,
         file_path=file_path,
         empty_fallback=empty_fallback,
     )
 
 
 def _load_yaml_file(file_path: Path) -> dict:
+    """Parse with libyaml when PyYAML was built with it, else pure-Python."""
+    yaml = _import_yaml()
+    return _read_yaml(yaml, file_path, _loader_class(yaml, 'auto'))
+
+
+def _load_yaml_file_c(file_path: Path) -> dict:
+    yaml = _import_yaml()
+    return _read_yaml(yaml, file_path, _loader_class(yaml, 'c'))
+
+
+def _load_yaml_file_python(file_path: Path) -> dict:
+    yaml = _import_yaml()
+    return _read_yaml(yaml, file_path, _loader_class(yaml, 'python'))
+
+
+def _read_yaml(yaml: Any, file_path: Path, loader: Any) -> dict:
+    # Base loaders construct every scalar as a string
+    with open(file_path) as env_file:
+        return yaml.load(env_file, Loader=loader)
+
+
+def _loader_class(yaml: Any, yaml_loader: YamlLoaderOption) -> Any:
+    if yaml_loader == 'python':
+        return yaml.BaseLoader
+    if yaml_loader == 'c':
+        try:
+            return yaml.CBaseLoader
+        except AttributeError as e:
+            raise ImportError(_LIBYAML_IMPORT_ERROR_MSG) from e
+    return getattr(yaml, 'CBaseLoader', yaml.BaseLoader)
+
+
+def _import_yaml() -> Any:
     try:
         import yaml
     except ImportError as e:
         raise ImportError(_YAML_IMPORT_ERROR_MSG) from e
+    return yaml
+
+
+_yaml_file_loaders: dict[str, FileLoaderP] = {
+    'auto': _load_yaml_file,
+    'c': _load_yaml_file_c,
+    'python': _load_yaml_file_python,
+}
+
+
+# === Environment-selective Yaml Loader === #
 
-    with open(file_path) as env_file:
-        return yaml.load(env_file, Loader=yaml.BaseLoader)
+
+class _FullLoadRequired(Exception):
+    """The document uses YAML features the selective loader skips."""
+
+
+@dataclass(frozen=True)
+class _EnvironmentLoader:
+    """Loads the ``batconf`` mapping, and one environment, from a file.
+
+    The other top-level values are parsed, but never built into Python
+    objects, and are not kept in memory. The result is the same as loading
+    the whole file with a base loader, then discarding the other values.
+    Documents which this loader does not support, ex: with aliases to
+    anchors in another environment, are loaded in full.
+
+    Instances are hashable, and their repr identifies the selection, for the
+    parsed file caches.
+
+    Parameters
+    ----------
+    config_env : str or None
+        Environment to load, ``None`` for ``batconf.default_env``.
+    yaml_loader : {'auto', 'c', 'python'}, default='auto'
+        YAML parser, see :class:`YamlSource`.
+    """
+
+    config_env: str | None
+    yaml_loader: YamlLoaderOption = 'auto'
+
+    def __call__(self, file_path: Path) -> dict:
+        yaml = _import_yaml()
+        loader = _loader_class(yaml, self.yaml_loader)
+        with open(file_path) as env_file:
+            events = yaml.parse(env_file, Loader=loader)
+            try:
+                return _build_environment(yaml, events, self.config_env)
+            except _FullLoadRequired:
+                log.debug(f'Loading every environment from {file_path}')
+
+        data = _yaml_file_loaders[self.yaml_loader](file_path)
+        if isinstance(data, dict):
+            return _select_environment(data, self.config_env)
+        return data
+
+
+def _build_environment(
+    yaml: Any,
+    events: Iterator[Any],
+    config_env: str | None,
+) -> dict:
+    if not (
+        type(next(events)) is yaml.StreamStartEvent
+        and type(next(events)) is yaml.DocumentStartEvent
+    ):
+        raise _FullLoadRequired
+    root = next(events)
+    if type(root) is not yaml.MappingStartEvent or root.anchor is not None:
+        raise _FullLoadRequired
+
+    anchors: dict[str, Any] = {}
+    data: dict[str, Any] = {}
+    while type(event := next(events)) is not yaml.MappingEndEvent:
+        if type(event) is not yaml.ScalarEvent or event.anchor is not None:
+            raise _FullLoadRequired
+        key = event.value
+        if key == 'batconf' or key == config_env or (
+            config_env is None and key == _default_env(data)
+        ):
+            data[key] = _build_value(yaml, next(events), events, anchors)
+        elif config_env is None and _default_env(data) is None:
+            # default_env is not known yet; keep the value until it is
+            data[key] = _build_value(yaml, next(events), events, anchors)
+        else:
+            _skip_value(yaml, next(events), events)
+
+    if not (
+        type(next(events)) is yaml.DocumentEndEvent
+        and type(next(events)) is yaml.StreamEndEvent
+    ):
+        raise _FullLoadRequired
+
+    return _select_environment(data, config_env)
+
+
+def _select_environment(data: dict, config_env: str | None) -> dict:
+    env = _default_env(data) if config_env is None else config_env
+    return {k: v for k, v in data.items() if k in ('batconf', env)}
+
+
+def _default_env(data: dict[str, Any]) -> str | None:
+    batconf = data.get('batconf')
+    if isinstance(batconf, dict):
+        return batconf.get('default_env')
+    return None
+
+
+def _build_value(
+    yaml: Any,
+    event: Any,
+    events: Iterator[Any],
+    anchors: dict[str, Any],
+) -> Any:
+    """Build the value which starts with ``event``, like BaseConstructor.
+
+    Scalars are strings, sequences are lists, and mappings are dicts.
+    """
+    no_key = _FullLoadRequired
+    result: list[Any] = []
+    containers: list[Any] = [result]
+    keys: list[Any] = [no_key]
+
+    while True:
+        event_type = type(event)
+        if event_type is yaml.ScalarEvent:
+            value = event.value
+        elif event_type is yaml.MappingStartEvent:
+            value = {}
+        elif event_type is yaml.SequenceStartEvent:
+            value = []
+        elif event_type is yaml.AliasEvent:
+            if event.anchor not in anchors:
+                raise _FullLoadRequired
+            value = anchors[event.anchor]
+        else:  # the end of a mapping or sequence
+            containers.pop()
+            keys.pop()
+            if len(containers) == 1:
+                return result[0]
+            event = next(events)
+            continue
+
+        if event_type is not yaml.AliasEvent and event.anchor is not None:
+            anchors[event.anchor] = value
+
+        parent = containers[-1]
+        if type(parent) is list:
+            parent.append(value)
+        elif keys[-1] is no_key:
+            if type(value) is not str:
+                raise _FullLoadRequired
+            keys[-1] = value
+        else:
+            parent[keys[-1]] = value
+            keys[-1] = no_key
+
+        if event_type is yaml.MappingStartEvent or (
+            event_type is yaml.SequenceStartEvent
+        ):
+            containers.append(value)
+            keys.append(no_key)
+        elif len(containers) == 1:
+            return result[0]
+        event = next(events)
+
+
+def _skip_value(yaml: Any, event: Any, events: Iterator[Any]) -> None:
+    """Consume the events of the value which starts with ``event``."""
+    depth = 0
+    while True:
+        event_type = type(event)
+        if event_type is yaml.MappingStartEvent or (
+            event_type is yaml.SequenceStartEvent
+        ):
+            depth += 1
+        elif event_type is yaml.MappingEndEvent or (
+            event_type is yaml.SequenceEndEvent
+        ):
+            depth -= 1
+        if depth == 0:
+            return
+        event = next(events)
 
 
 _YAML_IMPORT_ERROR_MSG = (
@@ -291,3 +571,8 @@ _YAML_IMPORT_ERROR_MSG = (
     'Please install it using `pip install pyyaml`.'
     'Or as an optional extra using `pip install batconf[yaml]`.'
 )
+
+_LIBYAML_IMPORT_ERROR_MSG = (
+    'yaml_loader="c" requires PyYAML built with libyaml. '
+    'Use yaml_loader="auto" to fall back to the pure-Python loader.'
+)
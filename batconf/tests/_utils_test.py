@@ -0,0 +1,92 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+import pickle
+
+from copy import deepcopy
+from threading import Event, Thread
+
+from .._utils import single_flight_property
+
+
+class Source:
+    def __init__(self, load: Mock):
+        self._load = load
+
+    @single_flight_property
+    def _data(self):
+        return self._load()
+
+
+class Loaded:
+    @single_flight_property
+    def _data(self):
+        return {'key': 'value'}
+
+
+class SingleFlightPropertyTests(TestCase):
+    def test_concurrent_gets(t):
+        started = Event()
+        release = Event()
+
+        def load():
+            started.set()
+            release.wait(10)
+            return {'key': 'value'}
+
+        load_mock = Mock(side_effect=load)
+        source = Source(load_mock)
+        results = []
+        threads = [
+            Thread(target=lambda: results.append(source._data))
+            for _ in range(8)
+        ]
+        threads[0].start()
+        started.wait(10)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        with t.subTest('one thread loads, the others wait for its value'):
+            load_mock.assert_called_once_with()
+            t.assertEqual(8, len(results))
+            for result in results:
+                t.assertIs(results[0], result)
+
+        with t.subTest('the cached value shadows the descriptor'):
+            t.assertIs(results[0], source.__dict__['_data'])
+
+    def test_lock_is_dropped_once_cached(t):
+        source = Loaded()
+        _ = source._data
+        t.assertEqual({'_data': {'key': 'value'}}, source.__dict__)
+
+        with t.subTest('loaded instances can be copied and pickled'):
+            t.assertEqual(source._data, deepcopy(source)._data)
+            t.assertEqual(
+                source._data, pickle.loads(pickle.dumps(source))._data
+            )
+
+    def test_value_set_while_computing(t):
+        """A value set while computing, ex: by a reload, is kept"""
+        source = Source(Mock())
+
+        def load():
+            source.__dict__['_data'] = 'reloaded'
+            return 'loaded'
+
+        source._load.side_effect = load
+        t.assertEqual('reloaded', source._data)
+
+    def test_errors_are_not_cached(t):
+        load = Mock(side_effect=[OSError, {'key': 'value'}])
+        source = Source(load)
+
+        with t.assertRaises(OSError):
+            _ = source._data
+        t.assertEqual({'key': 'value'}, source._data)
+
+    def test_class_access(t):
+        t.assertIsInstance(Source._data, single_flight_property)
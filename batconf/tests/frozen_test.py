@@ -0,0 +1,96 @@
+from unittest import TestCase
+
+from dataclasses import dataclass
+
+from ..frozen import FrozenConfiguration, frozen_class, freeze
+
+
+@dataclass
+class LeafSchema:
+    key1: str
+    key2: str = 'leaf default'
+
+
+@dataclass
+class RootSchema:
+    leaf: LeafSchema
+    value: str
+
+
+class FrozenConfigurationTests(TestCase):
+    def setUp(t) -> None:
+        t.frozen = freeze(
+            RootSchema,
+            {'value': 'root value', 'leaf.key1': 'leaf value'},
+        )
+
+    def test___getattr__(t) -> None:
+        with t.subTest('values are slot attributes'):
+            t.assertEqual('root value', t.frozen.value)
+            t.assertEqual('leaf value', t.frozen.leaf.key1)
+
+        with t.subTest('missing values raise AttributeError'):
+            with t.assertRaises(AttributeError):
+                t.frozen.leaf.key2
+
+    def test___getitem__(t) -> None:
+        t.assertEqual('leaf value', t.frozen['leaf']['key1'])
+
+    def test___setattr__(t) -> None:
+        with t.assertRaises(AttributeError):
+            t.frozen.value = 'changed'
+        with t.assertRaises(AttributeError):
+            t.frozen.new_attribute = 'value'
+        t.assertEqual('root value', t.frozen.value)
+
+    def test___delattr__(t) -> None:
+        with t.assertRaises(AttributeError):
+            del t.frozen.value
+        t.assertEqual('root value', t.frozen.value)
+
+    def test___repr__(t) -> None:
+        t.assertEqual(
+            "FrozenRootSchema(leaf=FrozenLeafSchema(key1='leaf value'), "
+            "value='root value')",
+            repr(t.frozen),
+        )
+
+
+class FrozenClassTests(TestCase):
+    def test_frozen_class(t) -> None:
+        cls = frozen_class(RootSchema)
+
+        with t.subTest('FrozenConfiguration subclass'):
+            t.assertTrue(issubclass(cls, FrozenConfiguration))
+            t.assertEqual('FrozenRootSchema', cls.__name__)
+
+        with t.subTest('one slot per field, no instance dict'):
+            t.assertEqual(('leaf', 'value'), cls.__slots__)
+            t.assertFalse(hasattr(cls(), '__dict__'))
+
+        with t.subTest('classes are shared for the same type'):
+            t.assertIs(cls, frozen_class(RootSchema))
+            t.assertIsNot(cls, frozen_class(LeafSchema))
+
+
+class FreezeTests(TestCase):
+    def test_freeze(t) -> None:
+        with t.subTest('builds the schema tree'):
+            frozen = freeze(RootSchema, {})
+            t.assertIsInstance(frozen, frozen_class(RootSchema))
+            t.assertIsInstance(frozen.leaf, frozen_class(LeafSchema))
+
+        with t.subTest('paths outside the schema are ignored'):
+            frozen = freeze(RootSchema, {'leaf.other': 'value'})
+            t.assertFalse(hasattr(frozen.leaf, 'other'))
+
+        with t.subTest('deep schemas do not hit the recursion limit'):
+            schema: type = LeafSchema
+            for _ in range(2000):
+                schema = dataclass(
+                    type('Deep', (), {'__annotations__': {'d': schema}})
+                )
+            node = freeze(schema, {f'{"d." * 2000}key1': 'deep value'})
+            for _ in range(2000):
+                node = node.d
+            t.assertEqual('deep value', node.key1)
@@ -1,9 +1,16 @@
 from unittest import TestCase
 from unittest.mock import Mock, patch, sentinel
 
+import pickle
+
+from copy import deepcopy
 from dataclasses import dataclass
+from functools import partial
+from threading import Event, Thread
+from types import SimpleNamespace
 
 from ..lib import ConfigSingleton, insert_source, Configuration
+from ..preload import PreloadTimings
 
 
 SRC = 'batconf.lib'
@@ -21,6 +28,100 @@ class ConfigSingletonTests(TestCase):
     def test___getattr__(t) -> None:
         t.assertEqual('+value1+', t.cs.key1)
 
+    def test_preload(t) -> None:
+        cfg = Mock(spec=Configuration)
+        cfg.preload.return_value = PreloadTimings((), 1, 2, 3, 4)
+        cs = ConfigSingleton(get_config_fn=lambda: cfg)
+
+        with patch(f'{SRC}.perf_counter_ns', side_effect=[10, 25]):
+            timings = cs.preload(freeze_gc=True)
+
+        cfg.preload.assert_called_once_with(True)
+        t.assertEqual(PreloadTimings((), 1, 2, 3, 4, build_ns=15), timings)
+
+        with t.subTest('an already built Configuration is not timed'):
+            t.assertEqual(0, cs.preload().build_ns)
+
+    def test_reload(t) -> None:
+        cfg = t.cs._cfg
+        t.assertEqual(0, t.cs.generation)
+
+        t.assertEqual(1, t.cs.reload())
+
+        with t.subTest('a new Configuration is published'):
+            t.assertEqual(1, t.cs.generation)
+            t.assertIsNot(cfg, t.cs._cfg)
+
+        with t.subTest('the new Configuration is preloaded'):
+            t.cs._cfg.preload.assert_called_once_with()
+
+        with t.subTest('validated before it is published'):
+            validate = Mock()
+            t.assertEqual(2, t.cs.reload(validate=validate))
+            validate.assert_called_once_with(t.cs._cfg)
+
+    def test_reload_errors(t) -> None:
+        cfg = t.cs._cfg
+
+        for name, validate in [
+            ('preload', None),
+            ('validate', Mock(side_effect=TypeError)),
+        ]:
+            with t.subTest(name):
+                new_cfg = get_config()
+                if validate is None:
+                    new_cfg.preload.side_effect = ValueError
+                t.cs._get_cfg = Mock(return_value=new_cfg)
+
+                with t.assertRaises((ValueError, TypeError)):
+                    t.cs.reload(validate=validate)
+
+                # the current Configuration is kept
+                t.assertIs(cfg, t.cs._cfg)
+                t.assertEqual(0, t.cs.generation)
+
+    def test_reload_concurrent(t) -> None:
+        building = Event()
+        release = Event()
+
+        def slow_get_config():
+            building.set()
+            release.wait(10)
+            return get_config()
+
+        get_cfg = t.cs._get_cfg = Mock(side_effect=slow_get_config)
+        first = Thread(target=t.cs.reload)
+        first.start()
+        building.wait(10)
+
+        with t.subTest('a reload called while another builds, builds again'):
+            second = Thread(target=t.cs.reload)
+            second.start()
+            release.set()
+            first.join()
+            second.join()
+            t.assertEqual(2, get_cfg.call_count)
+            t.assertEqual(2, t.cs.generation)
+
+        with t.subTest('a reload which waited for a newer one returns'):
+            # as if another reload started, and published, while waiting
+            with patch.object(t.cs, '_reload_lock') as lock:
+
+                def publish(*args):
+                    t.cs._reloads += 1
+                    t.cs._published = t.cs._reloads
+
+                lock.__enter__.side_effect = publish
+                t.assertEqual(2, t.cs.reload())
+            t.assertEqual(2, get_cfg.call_count)
+
+    def test_changed_since(t) -> None:
+        generation = t.cs.generation
+        t.assertFalse(t.cs.changed_since(generation))
+        t.cs.reload()
+        t.assertTrue(t.cs.changed_since(generation))
+        t.assertFalse(t.cs.changed_since(t.cs.generation))
+
     def test__reset(t) -> None:
         # get a value from the underlying Configuration instance
         value = t.cs.key
@@ -29,6 +130,29 @@ class ConfigSingletonTests(TestCase):
         # So "key" is no longer the same object
         t.assertIsNot(value, t.cs.key)
 
+        with t.subTest('the new Configuration is not preloaded'):
+            # ex: its sources are read on first use, and may fail then
+            cfg = get_config()
+            cfg.preload.side_effect = ValueError
+            t.cs._get_cfg = Mock(return_value=cfg)
+            t.cs._reset()
+            t.assertIs(cfg, t.cs._cfg)
+            cfg.preload.assert_not_called()
+
+    def test_copy_and_pickle(t) -> None:
+        cs = ConfigSingleton(get_config_fn=partial(SimpleNamespace, key='v'))
+        t.assertEqual('v', cs.key)
+
+        for name, clone in [
+            ('deepcopy', deepcopy(cs)),
+            ('pickle', pickle.loads(pickle.dumps(cs))),
+        ]:
+            with t.subTest(name):
+                t.assertEqual('v', clone.key)
+                # with its own lock
+                t.assertIsNot(cs._reload_lock, clone._reload_lock)
+                t.assertEqual(1, clone.reload(preload=False))
+
     def test___str__(t):
         """__str__ provided by the Configuration object"""
         t.assertEqual(str(t.cs), str(t.cs._cfg))
@@ -1,8 +1,15 @@
 from unittest import TestCase
+from unittest.mock import Mock, patch
 
 from dataclasses import dataclass
 
-from ..manager import Configuration, _configuration_repr, SourceList
+from ..manager import (
+    Configuration,
+    _accessor_class,
+    _configuration_repr,
+    _walk,
+    SourceList,
+)
 
 
 SRC = 'batconf.manager'
@@ -118,6 +125,343 @@ class ConfigurationTests(TestCase):
             with t.assertRaises(AttributeError):
                 t.conf.AModule.no_default_arg
 
+    def test_cache(t) -> None:
+        cfg = Configuration(
+            t.source_list, t.GlobalConfig, path='bat', cache=True
+        )
+
+        with t.subTest('disabled by default'):
+            t.assertIsNone(t.conf._cache)
+            t.source_1._data['bat.AModule.s1_unique'] = 'uncached'
+            t.assertEqual(t.conf.AModule.s1_unique, 'uncached')
+
+        with t.subTest('resolved values are cached'):
+            t.assertEqual(cfg.AModule.s2_unique, 's2_a_unique')
+            t.source_2._data['bat.AModule.s2_unique'] = 'changed'
+            t.assertEqual(cfg.AModule.s2_unique, 's2_a_unique')
+
+        with t.subTest('default values are cached'):
+            t.assertEqual(cfg.AModule.default_arg, 'unused default value')
+            t.source_1._data['bat.AModule.default_arg'] = 'from source'
+            t.assertEqual(cfg.AModule.default_arg, 'unused default value')
+
+        with t.subTest('misses are cached'):
+            with t.assertRaises(AttributeError):
+                cfg.AModule.no_default_arg
+            t.source_1._data['bat.AModule.no_default_arg'] = 'found'
+            with t.assertRaises(AttributeError):
+                cfg.AModule.no_default_arg
+
+        with t.subTest('SourceList.invalidate discards cached values'):
+            t.source_list.invalidate()
+            t.assertEqual(cfg.AModule.s2_unique, 'changed')
+            t.assertEqual(cfg.AModule.default_arg, 'from source')
+            t.assertEqual(cfg.AModule.no_default_arg, 'found')
+
+        with t.subTest('insert_source discards cached values'):
+            t.source_list.insert_source(
+                Source({'bat.AModule.s2_unique': 'inserted'})
+            )
+            t.assertEqual(cfg.AModule.s2_unique, 'inserted')
+
+        with t.subTest('source lists without a generation'):
+            source = Source({'bat.AModule.s1_unique': 'cached'})
+            source_list = Mock(spec=['get', 'insert_source'], get=source.get)
+            cfg = Configuration(
+                source_list, t.GlobalConfig, path='bat', cache=True
+            )
+            t.assertEqual(cfg.AModule.s1_unique, 'cached')
+            source._data['bat.AModule.s1_unique'] = 'changed'
+            t.assertEqual(cfg.AModule.s1_unique, 'cached')
+            t.assertEqual(cfg.get('AModule.s1_unique'), 'cached')
+            t.assertIsNone(cfg.get('AModule.missing'))
+
+    def test_accessors(t) -> None:
+        cfg = Configuration(
+            t.source_list, t.GlobalConfig, path='bat', accessors=True
+        )
+
+        with t.subTest('disabled by default'):
+            t.assertIs(Configuration, type(t.conf))
+            t.assertIs(Configuration, type(t.conf.AModule))
+
+        with t.subTest('disabled on the nodes of a Configuration subclass'):
+
+            class MyConfiguration(Configuration):
+                pass
+
+            my_cfg = MyConfiguration(t.source_list, t.GlobalConfig)
+            t.assertIs(MyConfiguration, type(my_cfg))
+            t.assertIs(Configuration, type(my_cfg.AModule))
+            t.assertIs(Configuration, type(my_cfg.AModule.SubModule))
+
+        with t.subTest('generated subclass per schema'):
+            t.assertIsInstance(cfg, Configuration)
+            t.assertIs(_accessor_class(t.GlobalConfig), type(cfg))
+            t.assertIs(
+                _accessor_class(t.conf.AModule._config_class),
+                type(cfg.AModule),
+            )
+            t.assertIs(
+                _accessor_class(t.conf.AModule.SubModule._config_class),
+                type(cfg.AModule.SubModule),
+            )
+
+        with t.subTest('same values as the generic lookup'):
+            t.assertEqual('s1_a_arg_1', cfg.AModule.arg_1)
+            t.assertEqual('s1_a_sub_1', cfg.AModule.SubModule.arg_1)
+            t.assertEqual('unused default value', cfg.AModule.default_arg)
+            t.assertEqual('s2_a_unique', cfg.AModule.s2_unique)
+            t.assertIs(cfg.AModule, cfg['AModule'])
+
+        with t.subTest('missing values raise AttributeError'):
+            with t.assertRaises(AttributeError):
+                cfg.AModule.no_default_arg
+
+        with t.subTest('a miss looks the value up once'):
+            a_module = cfg.AModule
+            with patch.object(
+                t.source_list, 'get', wraps=t.source_list.get
+            ) as get:
+                with t.assertRaises(AttributeError) as ctx:
+                    a_module.no_default_arg
+            get.assert_called_once_with('no_default_arg', path='bat.AModule')
+            t.assertIn('bat.AModule.no_default_arg', str(ctx.exception))
+
+        with t.subTest('other names fall back to the generic lookup'):
+            t.assertEqual('s1_a_unique', cfg.AModule.s1_unique)
+            with t.assertRaises(AttributeError):
+                cfg.AModule.undeclared
+
+        with t.subTest('values are looked up on every read'):
+            t.source_1._data['bat.AModule.arg_1'] = 'changed'
+            t.assertEqual('changed', cfg.AModule.arg_1)
+
+        with t.subTest('with the cache'):
+            cached = Configuration(
+                t.source_list, t.GlobalConfig, path='bat', cache=True,
+                accessors=True,
+            )
+            t.assertEqual('changed', cached.AModule.arg_1)
+            t.source_1._data['bat.AModule.arg_1'] = 'changed again'
+            t.assertEqual('changed', cached.AModule.arg_1)
+
+    def test__accessor_class(t) -> None:
+        cls = _accessor_class(t.GlobalConfig)
+
+        with t.subTest('one property per field'):
+            t.assertIsInstance(cls.__dict__['AModule'], property)
+            t.assertIsInstance(cls.__dict__['b_module'], property)
+
+        with t.subTest('shared for the same type'):
+            t.assertIs(cls, _accessor_class(t.GlobalConfig))
+
+        with t.subTest('Configuration attributes are not replaced'):
+            @dataclass
+            class Clashing:
+                freeze: str = 'field value'
+                key: str = 'key value'
+
+            cls = _accessor_class(Clashing)
+            t.assertNotIn('freeze', cls.__dict__)
+            cfg = Configuration(SourceList([]), Clashing, accessors=True)
+            t.assertEqual('key value', cfg.key)
+            t.assertEqual('field value', cfg['freeze'])
+
+    def test___init__(t) -> None:
+        source_list = Mock(SourceList)
+        cfg = Configuration(source_list, t.GlobalConfig, path='bat')
+
+        with t.subTest('nodes without options compile no source keys'):
+            source_list.compile.assert_not_called()
+
+        with t.subTest('each node compiles its options when it is built'):
+            cfg.AModule
+            source_list.compile.assert_called_once()
+            t.assertEqual(
+                [
+                    'bat.AModule.no_default_arg',
+                    'bat.AModule.default_arg',
+                    'bat.AModule.arg_1',
+                ],
+                list(source_list.compile.call_args.args[0]),
+            )
+
+        with t.subTest('only once'):
+            source_list.compile.reset_mock()
+            cfg.AModule
+            source_list.compile.assert_not_called()
+            cfg.AModule.SubModule
+            t.assertEqual(
+                ['bat.AModule.SubModule.arg_1'],
+                list(source_list.compile.call_args.args[0]),
+            )
+
+    def test__sub_config(t) -> None:
+        with t.subTest('sub-configurations are built on first access'):
+            t.assertEqual({}, t.conf._sub_configs)
+            a_module = t.conf._sub_config('AModule')
+            t.assertIsInstance(a_module, Configuration)
+            t.assertEqual({'AModule': a_module}, t.conf._sub_configs)
+            t.assertEqual({}, a_module._sub_configs)
+
+        with t.subTest('then reused'):
+            t.assertIs(a_module, t.conf._sub_config('AModule'))
+            t.assertIs(a_module, t.conf.AModule)
+
+        with t.subTest('inherit the path, sources and cache setting'):
+            t.assertEqual('bat.AModule', a_module._path)
+            t.assertIs(t.source_list, a_module._config_sources)
+            t.assertIsNone(a_module._cache)
+            cfg = Configuration(
+                t.source_list, t.GlobalConfig, path='bat', cache=True
+            )
+            t.assertIsNotNone(cfg._sub_config('b_module')._cache)
+
+        with t.subTest('unknown names raise KeyError'):
+            with t.assertRaises(KeyError):
+                t.conf._sub_config('s1_unique')
+
+    def test_resolve_all(t) -> None:
+        resolved = {
+            'AModule.default_arg': 'unused default value',
+            'AModule.arg_1': 's1_a_arg_1',
+            'AModule.SubModule.arg_1': 's1_a_sub_1',
+            'b_module.arg_1': 's1_b_arg_1',
+        }
+
+        with t.subTest('values from sources and schema defaults'):
+            t.assertEqual(resolved, t.conf.resolve_all())
+
+        with t.subTest('relative to the configuration node'):
+            t.assertEqual(
+                {'arg_1': 's1_a_sub_1'},
+                t.conf.AModule.SubModule.resolve_all(),
+            )
+
+        with t.subTest('one get_many call per source'):
+            source = Mock(spec=['get', 'get_many'])
+            source.get_many.return_value = {}
+            conf = Configuration(
+                SourceList([t.source_1, source]), t.GlobalConfig, path='bat'
+            )
+            conf.resolve_all()
+            source.get_many.assert_called_once_with(
+                ['bat.AModule.no_default_arg', 'bat.AModule.default_arg']
+            )
+
+        with t.subTest('primes the cache'):
+            cfg = Configuration(
+                t.source_list, t.GlobalConfig, path='bat', cache=True
+            )
+            t.assertEqual(resolved, cfg.resolve_all())
+            t.source_1._data['bat.AModule.arg_1'] = 'changed'
+            t.source_1._data['bat.AModule.no_default_arg'] = 'found'
+            t.assertEqual('s1_a_arg_1', cfg.AModule.arg_1)
+            with t.assertRaises(AttributeError):
+                cfg.AModule.no_default_arg
+
+        with t.subTest('refreshes cached values'):
+            t.assertEqual('changed', cfg.resolve_all()['AModule.arg_1'])
+            t.assertEqual('changed', cfg.AModule.arg_1)
+            t.assertEqual('found', cfg.AModule.no_default_arg)
+
+    def test_freeze(t) -> None:
+        frozen = t.conf.freeze()
+
+        with t.subTest('same attribute and subscript access'):
+            t.assertEqual('s1_a_arg_1', frozen.AModule.arg_1)
+            t.assertEqual('s1_a_sub_1', frozen['AModule']['SubModule'].arg_1)
+            t.assertEqual('unused default value', frozen.AModule.default_arg)
+
+        with t.subTest('missing values raise AttributeError'):
+            with t.assertRaises(AttributeError):
+                frozen.AModule.no_default_arg
+
+        with t.subTest('later changes to the sources are not seen'):
+            t.source_1._data['bat.AModule.arg_1'] = 'changed'
+            t.assertEqual('s1_a_arg_1', frozen.AModule.arg_1)
+            t.assertEqual('changed', t.conf.freeze().AModule.arg_1)
+
+        with t.subTest('relative to the configuration node'):
+            t.assertEqual('s1_b_arg_1', t.conf.b_module.freeze().arg_1)
+
+    def test_preload(t) -> None:
+        timings = t.conf.preload()
+
+        t.assertEqual(2, len(timings.sources))
+        t.assertEqual(4, timings.nodes)
+        t.assertEqual(len(t.conf.resolve_all()), timings.values)
+        with t.subTest('every sub-configuration is built'):
+            t.assertEqual({'AModule', 'b_module'}, set(t.conf._sub_configs))
+            t.assertIn('SubModule', t.conf.AModule._sub_configs)
+
+    def test_materialize(t) -> None:
+        t.source_2._data['bat.AModule.no_default_arg'] = 's2_a_no_default'
+        a_module = t.conf.AModule.materialize()
+
+        with t.subTest('instances of the schema dataclasses'):
+            t.assertIsInstance(a_module, t.conf.AModule._config_class)
+            t.assertEqual('s1_a_arg_1', a_module.arg_1)
+            t.assertEqual('unused default value', a_module.default_arg)
+            t.assertEqual('s1_a_sub_1', a_module.SubModule.arg_1)
+            t.assertEqual('s2_a_no_default', a_module.no_default_arg)
+
+        with t.subTest('missing required values raise TypeError'):
+            del t.source_2._data['bat.AModule.no_default_arg']
+            with t.assertRaises(TypeError):
+                t.conf.materialize()
+
+    def test_get(t) -> None:
+        with t.subTest('option value'):
+            t.assertEqual('s1_a_arg_1', t.conf.AModule.get('arg_1'))
+            t.assertEqual(
+                'unused default value',
+                t.conf.AModule.get('default_arg'),
+            )
+
+        with t.subTest('dotted path'):
+            t.assertEqual('s1_a_sub_1', t.conf.get('AModule.SubModule.arg_1'))
+
+        with t.subTest('sub-configuration'):
+            t.assertIs(t.conf.AModule, t.conf.get('AModule'))
+            t.assertIs(
+                t.conf.AModule.SubModule,
+                t.conf.get('AModule.SubModule'),
+            )
+
+        with t.subTest('missing values return the default'):
+            t.assertIsNone(t.conf.AModule.get('no_default_arg'))
+            t.assertEqual('off', t.conf.get('AModule.no_default_arg', 'off'))
+            t.assertEqual('off', t.conf.get('AModule.arg_1.sub', 'off'))
+            t.assertEqual('off', t.conf.get('DNE.key', 'off'))
+
+    def test_get_misses(t) -> None:
+        a_module = t.conf.AModule
+
+        with t.subTest('misses are remembered'):
+            t.assertIsNone(a_module.get('flag'))
+            t.assertEqual({'flag'}, a_module._misses[1])
+            t.source_1._data['bat.AModule.flag'] = 'on'
+            t.assertIsNone(a_module.get('flag'))
+
+        with t.subTest('hits are not cached'):
+            t.source_1._data['bat.AModule.arg_1'] = 'changed'
+            t.assertEqual('changed', a_module.get('arg_1'))
+
+        with t.subTest('SourceList.invalidate forgets misses'):
+            t.source_list.invalidate()
+            t.assertEqual('on', a_module.get('flag'))
+
+        with t.subTest('with the cache'):
+            cfg = Configuration(
+                t.source_list, t.GlobalConfig, path='bat', cache=True
+            )
+            t.assertEqual('on', cfg.AModule.get('flag'))
+            t.source_1._data['bat.AModule.flag'] = 'off'
+            t.assertEqual('on', cfg.AModule.get('flag'))
+            t.assertEqual((-1, set()), cfg.AModule._misses)
+
     def test___getitem__(t) -> None:
         with t.subTest('sub-config lookup'):
             t.assertIsInstance(t.conf['AModule'], Configuration)
@@ -209,6 +553,38 @@ class ConfigurationTests(TestCase):
             repr_str_list,
         )
 
+    def test__walk(t):
+        with t.subTest('yields every node depth-first, building lazy nodes'):
+            t.assertEqual(
+                [
+                    'bat',
+                    'bat.AModule',
+                    'bat.AModule.SubModule',
+                    'bat.b_module',
+                ],
+                [node._path for node in _walk(t.conf)],
+            )
+            t.assertIs(t.conf.AModule, t.conf._sub_configs['AModule'])
+
+        with t.subTest('deep schemas do not hit the recursion limit'):
+            schema: type = t.GlobalConfig
+            for _ in range(2000):
+                schema = dataclass(
+                    type('Deep', (), {'__annotations__': {'d': schema}})
+                )
+            cfg = Configuration(t.source_list, schema, path='deep')
+            t.assertEqual(2004, len(list(_walk(cfg))))
+
+    def test__plan(t):
+        with t.subTest('compiled from the config_class'):
+            t.assertIs(t.conf._plan.config_class, t.GlobalConfig)
+            t.assertEqual(('AModule', 'b_module'), t.conf._plan.names)
+
+        with t.subTest('shared by every Configuration of the same schema'):
+            other = Configuration(t.source_list, t.GlobalConfig, path='alt')
+            t.assertIs(other._plan, t.conf._plan)
+            t.assertIs(other.AModule._plan, t.conf.AModule._plan)
+
     def test__module(t):
         """the _module attribute is the __module__ of the config_class"""
         t.assertEqual(t.conf._module, t.GlobalConfig.__module__)
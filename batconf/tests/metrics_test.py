@@ -0,0 +1,172 @@
+import gc
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from ..metrics import (
+    BUCKETS,
+    LookupMetrics,
+    LookupStats,
+    render_prometheus,
+)
+
+
+SRC = 'batconf.metrics'
+
+
+class Source:
+    def __init__(self, data: dict[str, str]):
+        self._data = data
+
+    def get(self, key: str, path: str | None = None) -> str | None:
+        return self._data.get(f'{path}.{key}', None)
+
+
+class OtherSource(Source):
+    pass
+
+
+class LookupMetricsTests(TestCase):
+    def setUp(t) -> None:
+        t.source_1 = Source({'p1.key1': 'value1'})
+        t.source_2 = Source({'p1.key2': 'value2'})
+        t.sources = [t.source_1, t.source_2]
+        t.metrics = LookupMetrics()
+
+    def test___init__(t) -> None:
+        with t.subTest('time every lookup by default'):
+            t.assertEqual(1, t.metrics.sample)
+
+        with t.subTest('invalid sample'):
+            with t.assertRaises(ValueError):
+                LookupMetrics(sample=0)
+
+    def test_get(t) -> None:
+        with t.subTest('same results as SourceList.get'):
+            t.assertEqual('value1', t.metrics.get(t.sources, 'key1', 'p1'))
+            t.assertEqual('value2', t.metrics.get(t.sources, 'key2', 'p1'))
+            t.assertIsNone(t.metrics.get(t.sources, 'missing'))
+
+        with t.subTest('hits and misses per source and path'):
+            counts = {
+                (s.source, s.path): (s.hits, s.misses, s.timed)
+                for s in t.metrics.stats()
+            }
+            t.assertEqual(
+                {
+                    ('Source', 'p1.key1'): (1, 0, 1),
+                    ('Source', 'p1.key2'): (0, 1, 1),
+                    ('Source#2', 'p1.key2'): (1, 0, 1),
+                    ('Source', 'missing'): (0, 1, 1),
+                    ('Source#2', 'missing'): (0, 1, 1),
+                },
+                counts,
+            )
+
+    def test_get_sample(t) -> None:
+        metrics = LookupMetrics(sample=3)
+        for _ in range(7):
+            metrics.get(t.sources, 'key1', 'p1')
+
+        (stats,) = metrics.stats()
+        t.assertEqual(7, stats.hits)
+        t.assertEqual(3, stats.timed)
+        t.assertEqual(3, sum(stats.buckets))
+
+    @patch(f'{SRC}.perf_counter_ns', autospec=True)
+    def test_get_latency_buckets(t, perf_counter_ns) -> None:
+        # 2µs, 20ms and 2s lookups
+        perf_counter_ns.side_effect = [0, 2_000, 0, 20_000_000, 0, 2 * 10**9]
+        for _ in range(3):
+            t.metrics.get([t.source_1], 'key1', 'p1')
+
+        (stats,) = t.metrics.stats()
+        t.assertEqual(
+            (0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 1),
+            stats.buckets,
+        )
+        t.assertEqual(2_020_002_000, stats.total_ns)
+
+    def test__label(t) -> None:
+        with t.subTest('class name'):
+            t.assertEqual('Source', t.metrics._label(t.source_1))
+
+        with t.subTest('numbered when the class name is taken'):
+            t.assertEqual('Source#2', t.metrics._label(t.source_2))
+            t.assertEqual('Source#3', t.metrics._label(Source({})))
+            t.assertEqual('OtherSource', t.metrics._label(OtherSource({})))
+
+        with t.subTest('labels are not reused after a source is collected'):
+            source = Source({})
+            t.assertEqual('Source#4', t.metrics._label(source))
+            del source
+            gc.collect()
+            t.assertEqual(
+                {'Source', 'Source#2'}, set(t.metrics._labels.values())
+            )
+            t.assertEqual('Source#5', t.metrics._label(Source({})))
+
+    def test_stats(t) -> None:
+        t.assertEqual([], t.metrics.stats())
+        t.metrics.get([t.source_1], 'key1', 'p1')
+
+        (stats,) = t.metrics.stats()
+        t.assertIsInstance(stats, LookupStats)
+        t.assertEqual(('Source', 'p1.key1'), (stats.source, stats.path))
+
+    def test_reset(t) -> None:
+        t.metrics.get(t.sources, 'key1', 'p1')
+        t.metrics.reset()
+        t.assertEqual([], t.metrics.stats())
+
+
+class RenderPrometheusTests(TestCase):
+    def test_render_prometheus(t) -> None:
+        metrics = LookupMetrics()
+        buckets = (0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 2)
+        stats = LookupStats(
+            source='EnvConfig',
+            path='bat."key"',
+            hits=2,
+            misses=1,
+            buckets=buckets,
+            timed=3,
+            total_ns=1_500_000_000,
+        )
+        labels = 'source="EnvConfig",path="bat.\\"key\\""'
+
+        with patch.object(metrics, 'stats', return_value=[stats]):
+            ret = render_prometheus(metrics, prefix='app')
+
+        t.assertEqual(
+            '\n'.join(
+                [
+                    '# HELP app_lookups_total Configuration lookups,'
+                    ' by source and result.',
+                    '# TYPE app_lookups_total counter',
+                    f'app_lookups_total{{{labels},result="hit"}} 2',
+                    f'app_lookups_total{{{labels},result="miss"}} 1',
+                    '# HELP app_lookup_duration_seconds'
+                    ' Duration of sampled configuration lookups.',
+                    '# TYPE app_lookup_duration_seconds histogram',
+                    *(
+                        f'app_lookup_duration_seconds_bucket{{{labels},'
+                        f'le="{le}"}} {n}'
+                        for le, n in zip(
+                            (*map(repr, BUCKETS), '+Inf'),
+                            (0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3),
+                        )
+                    ),
+                    f'app_lookup_duration_seconds_sum{{{labels}}} 1.5',
+                    f'app_lookup_duration_seconds_count{{{labels}}} 3',
+                ]
+            )
+            + '\n',
+            ret,
+        )
+
+    def test_escapes_label_values(t) -> None:
+        metrics = LookupMetrics()
+        metrics.get([Source({})], 'key', 'back\\slash.new\nline')
+        ret = render_prometheus(metrics)
+        t.assertIn('path="back\\\\slash.new\\nline.key"', ret)
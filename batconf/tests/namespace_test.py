@@ -20,6 +20,8 @@ class BatconfNamespaceTests(TestCase):
         t.assertTrue(hasattr(batconf, 'IniSource'))
         t.assertTrue(hasattr(batconf, 'TomlSource'))
         t.assertTrue(hasattr(batconf, 'YamlSource'))
+        t.assertTrue(hasattr(batconf, 'DirectorySource'))
+        t.assertTrue(hasattr(batconf, 'SnapshotSource'))
 
     def test_all_is_complete(t):
         """Every symbol in __all__ must be importable from batconf."""
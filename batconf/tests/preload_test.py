@@ -0,0 +1,99 @@
+from unittest import TestCase
+from unittest.mock import patch, Mock
+
+from ..manager import Configuration
+from ..preload import PreloadTimings, preload
+from ..source import SourceList
+from .schemas import AppSchema
+
+
+SRC = 'batconf.preload'
+
+
+class Source:
+    def __init__(self, data: dict[str, str]):
+        self._data = data
+
+    def get(self, key: str, path: str | None = None) -> str | None:
+        return self._data.get(f'{path}.{key}', None)
+
+
+class LoadableSource(Source):
+    def __init__(self, data: dict[str, str]):
+        super().__init__(data)
+        self.load = Mock()
+
+
+class PreloadTests(TestCase):
+    def setUp(t):
+        t.loadable = LoadableSource({'app.client.host': 'db'})
+        t.source = Source({'app.name': 'app'})
+        t.cfg = Configuration(
+            SourceList([t.loadable, t.source]), AppSchema, path='app'
+        )
+
+    def test_preload(t):
+        timings = preload(t.cfg)
+
+        with t.subTest('sources which load lazily are loaded'):
+            t.loadable.load.assert_called_once_with()
+            t.assertEqual(
+                [repr(t.loadable), repr(t.source)],
+                [label for label, _ in timings.sources],
+            )
+
+        with t.subTest('every node is built'):
+            t.assertEqual(2, timings.nodes)
+            t.assertIn('client', t.cfg._sub_configs)
+
+        with t.subTest('every option is resolved'):
+            t.assertEqual(3, timings.values)
+
+        t.assertEqual(0, timings.gc_freeze_ns)
+        t.assertEqual(0, timings.build_ns)
+
+    def test_preload_primes_the_cache(t):
+        cfg = Configuration(
+            SourceList([t.loadable, t.source]),
+            AppSchema,
+            path='app',
+            cache=True,
+        )
+        preload(cfg)
+        t.assertEqual('db', cfg.client._cache[1]['host'])
+
+    @patch(f'{SRC}.gc')
+    def test_preload_freeze_gc(t, gc: Mock):
+        preload(t.cfg)
+        gc.freeze.assert_not_called()
+
+        preload(t.cfg, freeze_gc=True)
+        gc.freeze.assert_called_once_with()
+
+        with t.subTest('Python implementations without gc.freeze'):
+            with patch(f'{SRC}.gc', Mock(spec=[])):
+                t.assertEqual(0, preload(t.cfg, freeze_gc=True).gc_freeze_ns)
+
+    def test_preload_other_source_lists(t):
+        """A SourceListP which is not a SourceList is one source."""
+        source_list = LoadableSource({'app.name': 'app'})
+        cfg = Configuration(source_list, AppSchema, path='app')
+
+        timings = preload(cfg)
+
+        source_list.load.assert_called_once_with()
+        t.assertEqual([repr(source_list)], [s for s, _ in timings.sources])
+
+
+class PreloadTimingsTests(TestCase):
+    def test_total_ns(t):
+        timings = PreloadTimings(
+            sources=(('a', 1), ('b', 2)),
+            nodes=1,
+            nodes_ns=10,
+            values=1,
+            values_ns=100,
+            gc_freeze_ns=1000,
+            build_ns=10000,
+        )
+        t.assertEqual(11113, timings.total_ns)
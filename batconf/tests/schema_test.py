@@ -0,0 +1,174 @@
+from unittest import TestCase
+
+from dataclasses import dataclass, field
+
+from ..schema import SchemaPlan, compile_schema, instantiate
+
+
+SRC = 'batconf.schema'
+
+
+@dataclass
+class LeafSchema:
+    key1: str
+    key2: str = 'leaf default'
+
+
+@dataclass
+class BranchSchema:
+    leaf: LeafSchema
+    key: str = 'branch default'
+
+
+@dataclass
+class RootSchema:
+    branch: BranchSchema
+    other: LeafSchema
+    required: str
+    not_a_str: int = 7
+    from_factory: list = field(default_factory=list)
+    value: str = 'root default'
+
+
+class SchemaPlanTests(TestCase):
+    def setUp(t) -> None:
+        t.sp = SchemaPlan(RootSchema)
+
+    def test_names(t) -> None:
+        t.assertEqual(
+            (
+                'branch',
+                'other',
+                'required',
+                'not_a_str',
+                'from_factory',
+                'value',
+            ),
+            t.sp.names,
+        )
+
+    def test_children(t) -> None:
+        t.assertEqual(
+            {'branch': BranchSchema, 'other': LeafSchema},
+            t.sp.children,
+        )
+
+    def test_options(t) -> None:
+        t.assertEqual(
+            ('required', 'not_a_str', 'from_factory', 'value'),
+            t.sp.options,
+        )
+
+    def test_defaults(t) -> None:
+        """Only string defaults are configuration defaults"""
+        t.assertEqual({'value': 'root default'}, t.sp.defaults)
+
+    def test_field_defaults(t) -> None:
+        """Every option's declared default, None when it has none"""
+        t.assertEqual(
+            {
+                'required': None,
+                'not_a_str': 7,
+                'from_factory': None,
+                'value': 'root default',
+            },
+            t.sp.field_defaults,
+        )
+
+    def test_paths(t) -> None:
+        with t.subTest('depth-first, in declaration order'):
+            t.assertEqual(
+                (
+                    'required',
+                    'not_a_str',
+                    'from_factory',
+                    'value',
+                    'branch.key',
+                    'branch.leaf.key1',
+                    'branch.leaf.key2',
+                    'other.key1',
+                    'other.key2',
+                ),
+                t.sp.paths,
+            )
+
+        with t.subTest('deep schemas do not hit the recursion limit'):
+            schema: type = LeafSchema
+            for _ in range(2000):
+                schema = dataclass(
+                    type('Deep', (), {'__annotations__': {'d': schema}})
+                )
+            prefix = 'd.' * 2000
+            t.assertEqual(
+                (f'{prefix}key1', f'{prefix}key2'),
+                SchemaPlan(schema).paths,
+            )
+
+    def test___repr__(t) -> None:
+        t.assertEqual(f'SchemaPlan({RootSchema!r})', repr(t.sp))
+
+
+class CompileSchemaTests(TestCase):
+    def test_compile_schema(t) -> None:
+        plan = compile_schema(RootSchema)
+
+        with t.subTest('returns a SchemaPlan'):
+            t.assertIsInstance(plan, SchemaPlan)
+            t.assertIs(plan.config_class, RootSchema)
+
+        with t.subTest('plans are shared for the same type'):
+            t.assertIs(plan, compile_schema(RootSchema))
+
+        with t.subTest('each type has its own plan'):
+            t.assertIsNot(plan, compile_schema(BranchSchema))
+            t.assertIs(compile_schema(BranchSchema).config_class, BranchSchema)
+
+
+class InstantiateTests(TestCase):
+    def test_instantiate(t) -> None:
+        values = {
+            'branch.leaf.key1': 'value1',
+            'other.key1': 'other value1',
+            'other.key2': 'other value2',
+            'required': 'required value',
+        }
+
+        with t.subTest('builds the schema tree'):
+            t.assertEqual(
+                RootSchema(
+                    branch=BranchSchema(leaf=LeafSchema(key1='value1')),
+                    other=LeafSchema('other value1', 'other value2'),
+                    required='required value',
+                ),
+                instantiate(RootSchema, values),
+            )
+
+        with t.subTest('missing values use the field defaults'):
+            root = instantiate(RootSchema, values)
+            t.assertEqual(7, root.not_a_str)
+            t.assertEqual([], root.from_factory)
+            t.assertEqual('leaf default', root.branch.leaf.key2)
+
+        with t.subTest('missing required values raise TypeError'):
+            with t.assertRaises(TypeError):
+                instantiate(RootSchema, {'required': 'required value'})
+
+        with t.subTest('slots and frozen dataclasses'):
+            @dataclass(slots=True, frozen=True)
+            class SlotsSchema:
+                leaf: LeafSchema
+                key: str
+
+            ret = instantiate(SlotsSchema, {'key': 'v', 'leaf.key1': 'v1'})
+            t.assertEqual(SlotsSchema(LeafSchema('v1'), 'v'), ret)
+
+        with t.subTest('deep schemas do not hit the recursion limit'):
+            schema: type = LeafSchema
+            for _ in range(2000):
+                schema = dataclass(
+                    type('Deep', (), {'__annotations__': {'d': schema}})
+                )
+            node = instantiate(schema, {f'{"d." * 2000}key1': 'deep value'})
+            for _ in range(2000):
+                node = node.d
+            t.assertEqual(LeafSchema('deep value'), node)
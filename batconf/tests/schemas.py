@@ -0,0 +1,15 @@
+"""Config schemas shared by the unit tests."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ClientSchema:
+    host: str
+    port: str = '5432'
+
+
+@dataclass
+class AppSchema:
+    client: ClientSchema
+    name: str
@@ -1,10 +1,19 @@
 from unittest import TestCase
+from unittest.mock import Mock
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from threading import Barrier, Event
 
 from ..source import (
     SourceList,
     SourceInterface,
+    KeyTable,
+    split_path,
+    get_many,
+    compile_keys,
+    load_source,
+    SourceLoadError,
 )
 
 
@@ -19,6 +28,14 @@ class TestSourceInterfaceABC(TestCase):
         cs = Source()
         t.assertEqual(cs.get('key', path='bat.path'), None)
 
+    def test_get_many(t):
+        """The default get_many calls get once for each path"""
+        source = Source({'p1.key1': 'value1', 'p1.sub.key2': 'value2'})
+        t.assertEqual(
+            {'p1.key1': 'value1', 'p1.sub.key2': 'value2'},
+            source.get_many(['p1.key1', 'p1.sub.key2', 'p1.missing']),
+        )
+
 
 class Source(SourceInterface):
     def __init__(self, data):
@@ -51,6 +68,29 @@ class TestSourceList(TestCase):
         with t.subTest('missing attribute returns None'):
             t.assertEqual(sl.get('DNE'), None)
 
+    def test_get_many(t):
+        sl = SourceList([t.source_1, t.source_2, t.source_3])
+
+        with t.subTest('values from every source, in priority order'):
+            t.assertEqual(
+                {'p1.key1': 'value1', 'p2.key2': 'value2'},
+                sl.get_many(['p1.key1', 'p2.key2', 'p3.DNE']),
+            )
+
+        with t.subTest('sources are only asked for missing paths'):
+            source = Mock(wraps=t.source_3)
+            SourceList([t.source_1, source]).get_many(['p1.key1', 'p2.key'])
+            source.get_many.assert_called_once_with(['p2.key'])
+
+        with t.subTest('sources are skipped once every path is found'):
+            source.reset_mock()
+            SourceList([t.source_1, source]).get_many(['p1.key1'])
+            source.get_many.assert_not_called()
+
+        with t.subTest('empty values are skipped, as they are by get'):
+            sl = SourceList([Source({'p1.key1': ''}), t.source_3])
+            t.assertEqual({'p1.key1': 'value3'}, sl.get_many(['p1.key1']))
+
     def test_none_values_in_args(t):
         """Given None values in the initial sources list,
         they will be ignored, and only valid sources used
@@ -85,6 +125,126 @@ class TestSourceList(TestCase):
         t.sl.insert_source(source=source_9, index=9)
         t.assertEqual(t.sl.get('key9', 'p1'), 'value9')
 
+    def test_compile(t):
+        source = Mock(spec=['get', 'compile'])
+        sl = SourceList([source, t.source_1])
+
+        with t.subTest('compiles each source which supports it'):
+            sl.compile(iter(['p1.key1', 'p1.key2']))
+            source.compile.assert_called_once_with(['p1.key1', 'p1.key2'])
+
+        with t.subTest('paths are compiled once'):
+            sl.compile(['p1.key1', 'p2.key1'])
+            source.compile.assert_called_with(['p2.key1'])
+            source.compile.reset_mock()
+            sl.compile(['p1.key1'])
+            source.compile.assert_not_called()
+
+        with t.subTest('inserted sources compile every path'):
+            new_source = Mock(spec=['get', 'compile'])
+            sl.insert_source(new_source)
+            new_source.compile.assert_called_once_with(
+                ['p1.key1', 'p1.key2', 'p2.key1']
+            )
+
+    def test_enable_metrics(t):
+        sl = SourceList([t.source_1, t.source_2])
+
+        with t.subTest('disabled by default'):
+            t.assertIsNone(sl.metrics)
+            t.assertNotIn('get', sl.__dict__)
+
+        with t.subTest('records get lookups'):
+            metrics = sl.enable_metrics(sample=10)
+            t.assertIs(metrics, sl.metrics)
+            t.assertEqual(10, metrics.sample)
+            t.assertEqual('value2', sl.get('key2', 'p2'))
+            t.assertEqual(
+                [('Source', 'p2.key2', 0, 1), ('Source#2', 'p2.key2', 1, 0)],
+                [
+                    (s.source, s.path, s.hits, s.misses)
+                    for s in metrics.stats()
+                ],
+            )
+
+        with t.subTest('sees inserted sources'):
+            sl.insert_source(t.source_0)
+            t.assertEqual('value0', sl.get('key1', 'p1'))
+            t.assertIn('Source#3', {s.source for s in metrics.stats()})
+
+    def test_disable_metrics(t):
+        sl = SourceList([t.source_1])
+        metrics = sl.enable_metrics()
+        sl.disable_metrics()
+
+        t.assertIsNone(sl.metrics)
+        t.assertNotIn('get', sl.__dict__)
+        t.assertEqual('value1', sl.get('key1', 'p1'))
+        t.assertEqual([], metrics.stats())
+
+    def test_generation(t):
+        generation = t.sl.generation
+
+        with t.subTest('insert_source increments the generation'):
+            t.sl.insert_source(t.source_0)
+            t.assertEqual(t.sl.generation, generation + 1)
+
+        with t.subTest('invalidate increments the generation'):
+            t.sl.invalidate()
+            t.assertEqual(t.sl.generation, generation + 2)
+
+    def test_warm(t):
+        loadable = [Mock(spec=['get', 'load']) for _ in range(3)]
+        sl = SourceList([loadable[0], t.source_1, *loadable[1:]])
+
+        sl.warm()
+
+        for source in loadable:
+            source.load.assert_called_once_with()
+
+        with t.subTest('sources load concurrently'):
+            barrier = Barrier(3, timeout=10)
+            for source in loadable:
+                source.load.side_effect = barrier.wait
+            sl.warm()
+            t.assertFalse(barrier.broken)
+
+        with t.subTest('on a given executor, which is not shut down'):
+            executor = ThreadPoolExecutor(1)
+            t.addCleanup(executor.shutdown)
+            for source in loadable:
+                source.load.side_effect = None
+            sl.warm(executor=executor)
+            t.assertEqual(3, executor.submit(lambda: 3).result())
+
+        with t.subTest('without sources which load lazily'):
+            SourceList([t.source_1, t.source_2]).warm()
+
+    def test_warm_errors(t):
+        error = OSError('unreachable')
+        ok, failed, slow = [Mock(spec=['get', 'load']) for _ in range(3)]
+        failed.load.side_effect = error
+        release = Event()
+        t.addCleanup(release.set)
+        slow.load.side_effect = release.wait
+        sl = SourceList([slow, ok, failed])
+
+        with t.assertRaises(SourceLoadError) as ctx:
+            sl.warm(timeout=0.01)
+
+        with t.subTest('every failure, in priority order'):
+            errors = ctx.exception.errors
+            t.assertEqual([slow, failed], [source for source, _ in errors])
+            t.assertIsInstance(errors[0][1], TimeoutError)
+            t.assertIs(error, errors[1][1])
+            ok.load.assert_called_once_with()
+
+        with t.subTest('the message lists them'):
+            t.assertTrue(
+                str(ctx.exception).startswith('2 sources failed to load:\n')
+            )
+            t.assertIn(repr(error), str(ctx.exception))
+
     def test___str__(t):
         ret = str(SourceList([t.source_1, t.source_2]))
         t.assertEqual(
@@ -95,3 +255,93 @@ class TestSourceList(TestCase):
     def test___repr__(t):
         ret = repr(SourceList([t.source_1, t.source_2]))
         t.assertEqual(ret, f'SourceList(sources=[{t.source_1}, {t.source_2}])')
+
+
+class KeyTableTests(TestCase):
+    def setUp(t):
+        t.translate = Mock(side_effect=lambda key, path: f'{path}/{key}')
+        t.kt = KeyTable(translate=t.translate)
+
+    def test_compile(t):
+        t.kt.compile(['p1.sub.key1', 'key2'])
+        t.assertEqual(
+            {('key1', 'p1.sub'): 'p1.sub/key1', ('key2', None): 'None/key2'},
+            t.kt._by_key,
+        )
+        t.assertEqual(
+            {'p1.sub.key1': 'p1.sub/key1', 'key2': 'None/key2'},
+            t.kt._by_path,
+        )
+
+    def test_get(t):
+        t.kt.compile(['p1.key1'])
+        t.translate.reset_mock()
+
+        with t.subTest('compiled keys are not translated again'):
+            t.assertEqual('p1/key1', t.kt.get('key1', 'p1'))
+            t.translate.assert_not_called()
+
+        with t.subTest('other keys are translated'):
+            t.assertEqual('p1/key2', t.kt.get('key2', 'p1'))
+            t.translate.assert_called_once_with('key2', 'p1')
+
+    def test_get_path(t):
+        t.kt.compile(['p1.key1'])
+        t.translate.reset_mock()
+
+        with t.subTest('compiled paths are not translated again'):
+            t.assertEqual('p1/key1', t.kt.get_path('p1.key1'))
+            t.translate.assert_not_called()
+
+        with t.subTest('other paths are translated'):
+            t.assertEqual('p1/key2', t.kt.get_path('p1.key2'))
+            t.translate.assert_called_once_with('key2', 'p1')
+
+
+class SplitPathTests(TestCase):
+    def test_split_path(t):
+        with t.subTest('dotted path'):
+            t.assertEqual(('key1', 'p1.sub'), split_path('p1.sub.key1'))
+
+        with t.subTest('single key'):
+            t.assertEqual(('key1', None), split_path('key1'))
+
+
+class GetManyTests(TestCase):
+    def test_get_many(t):
+        with t.subTest('uses the source get_many method'):
+            source = Mock(spec=['get', 'get_many'])
+            ret = get_many(source, ['p1.key1'])
+            source.get_many.assert_called_once_with(['p1.key1'])
+            source.get.assert_not_called()
+            t.assertIs(source.get_many.return_value, ret)
+
+        with t.subTest('falls back to get for each path'):
+            source = Mock(spec=['get'])
+            data = {('key1', 'p1'): 'value1'}
+            source.get.side_effect = lambda key, path: data.get((key, path))
+            ret = get_many(source, ['p1.key1', 'p1.DNE', 'DNE'])
+            t.assertEqual({'p1.key1': 'value1'}, ret)
+            t.assertEqual(3, source.get.call_count)
+
+
+class CompileKeysTests(TestCase):
+    def test_compile_keys(t):
+        with t.subTest('calls the source compile method'):
+            source = Mock(spec=['get', 'compile'])
+            compile_keys(source, ['p1.key1'])
+            source.compile.assert_called_once_with(['p1.key1'])
+
+        with t.subTest('sources without a compile method are skipped'):
+            compile_keys(Source({}), ['p1.key1'])
+
+
+class LoadSourceTests(TestCase):
+    def test_load_source(t):
+        with t.subTest('calls the source load method'):
+            source = Mock(spec=['get', 'load'])
+            load_source(source)
+            source.load.assert_called_once_with()
+
+        with t.subTest('sources without a load method are skipped'):
+            load_source(Source({}))
@@ -13,6 +13,9 @@ class BatconfTypesTests(TestCase):
         t.assertTrue(hasattr(types, 'FieldP'))
         t.assertTrue(hasattr(types, 'SourceInterfaceP'))
         t.assertTrue(hasattr(types, 'SourceListP'))
+        t.assertTrue(hasattr(types, 'BatchSourceP'))
+        t.assertTrue(hasattr(types, 'CompilableSourceP'))
+        t.assertTrue(hasattr(types, 'LoadableSourceP'))
 
     def test_deprecated_names(t):
         """Old Protocol/Proto-suffixed names emit DeprecationWarning but still resolve."""
@@ -13,10 +13,14 @@ Examples
 from typing import Protocol, Type, runtime_checkable
 
 from .sources.types import (
+    BatchSourceP,
+    CompilableSourceP,
     ConfigFileFormats,
     FILE_FORMATS,
     FileSourceP,
+    LoadableSourceP,
     MissingFileOption,
+    ReloadableSourceP,
     SourceInterfaceP,
 )
 
@@ -39,12 +43,16 @@ class ConfigP(Protocol):
 
 
 __all__ = [
+    'BatchSourceP',
+    'CompilableSourceP',
     'ConfigP',
     'ConfigFileFormats',
     'FieldP',
     'FILE_FORMATS',
     'FileSourceP',
+    'LoadableSourceP',
     'MissingFileOption',
+    'ReloadableSourceP',
     'SourceInterfaceP',
     'SourceListP',
 ]
@@ -0,0 +1,24 @@
+"""Timing helpers shared by the benchmark scripts."""
+
+from timeit import Timer
+from typing import Callable
+
+
+def time_call(fn: Callable[[], object], number: int = 100_000) -> float:
+    """Best time of five runs, in nanoseconds per call."""
+    return min(Timer(fn).repeat(repeat=5, number=number)) / number * 1e9
+
+
+def compare(
+    label: str,
+    baseline: Callable[[], object],
+    candidate: Callable[[], object],
+    number: int = 100_000,
+) -> None:
+    """Time two callables doing the same work, and print the speedup."""
+    base_ns = time_call(baseline, number)
+    cand_ns = time_call(candidate, number)
+    print(
+        f'{label:<32} {base_ns:9.1f} ns -> {cand_ns:9.1f} ns'
+        f'  ({base_ns / cand_ns:4.1f}x)'
+    )
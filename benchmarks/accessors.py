@@ -0,0 +1,51 @@
+"""Attribute reads: generic ``__getattr__`` lookup vs generated accessors.
+
+Run from the repository root, with batconf installed::
+
+    python benchmarks/accessors.py
+"""
+
+from dataclasses import dataclass
+
+from batconf import Configuration, Namespace, NamespaceSource, SourceList
+
+from _timing import compare
+
+
+@dataclass
+class ClientConfig:
+    host: str
+    port: str = '8080'
+
+
+@dataclass
+class ServiceConfig:
+    client: ClientConfig
+    name: str
+
+
+def main() -> None:
+    args = Namespace()
+    setattr(args, 'bench.name', 'service')
+    setattr(args, 'bench.client.host', 'localhost')
+    sources = SourceList([NamespaceSource(args)])
+
+    generic = Configuration(sources, ServiceConfig, path='bench')
+    fast = Configuration(sources, ServiceConfig, path='bench', accessors=True)
+
+    print('Configuration(accessors=False) -> Configuration(accessors=True)')
+    compare('value from a source', lambda: generic.name, lambda: fast.name)
+    compare(
+        'sub-configuration value',
+        lambda: generic.client.host,
+        lambda: fast.client.host,
+    )
+    compare(
+        'schema default',
+        lambda: generic.client.port,
+        lambda: fast.client.port,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""conf.d directories: one source per file vs a DirectorySource.
+
+Lookups in a SourceList probe each file source in turn, until one has the
+value; the DirectorySource probes its merged index once. Also compares
+parsing the files serially and in a thread pool; with the GIL the pool is
+slower, so it is only used by default on free-threaded builds.
+
+Run from the repository root, with batconf and pyyaml installed::
+
+    python benchmarks/directory_source.py
+"""
+
+import logging
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from batconf import DirectorySource, SourceList
+from batconf.sources.directory import fragment_sources
+from batconf.sources.file import parsed_files
+
+from _timing import compare
+
+
+def write_fragments(directory: Path, n_files: int) -> None:
+    """Each file has a section of 100 options, in YAML and INI formats."""
+    for n in range(n_files):
+        if n % 2:
+            lines = [f'team{n}:'] + [f'  key{k}: v{k}' for k in range(100)]
+            (directory / f'{n:02}.yaml').write_text('\n'.join(lines))
+        else:
+            lines = [f'[team{n}]'] + [f'key{k} = v{k}' for k in range(100)]
+            (directory / f'{n:02}.ini').write_text('\n'.join(lines))
+
+
+def main() -> None:
+    # each file source warns about the paths it does not have
+    logging.disable(logging.WARNING)
+    with TemporaryDirectory() as tmp_dir:
+        directory = Path(tmp_dir)
+        for n_files in (2, 8, 32):
+            write_fragments(directory, n_files)
+            directory_source = DirectorySource(str(directory))
+            source_list = SourceList(
+                [
+                    fragment_sources[f.suffix](str(f), 'sections')
+                    for f in reversed(directory_source.fragments)
+                ]
+            )
+            # found in the lowest priority file
+            assert source_list.get('key0', 'team0') == 'v0'
+            assert directory_source.get('key0', 'team0') == 'v0'
+
+            print(f'{n_files} files')
+            compare(
+                '  lookup: SourceList -> merged',
+                lambda: source_list.get('key0', 'team0'),
+                lambda: directory_source.get('key0', 'team0'),
+            )
+
+            def load(max_workers: int | None) -> None:
+                parsed_files.clear()
+                DirectorySource(str(directory), max_workers=max_workers).get(
+                    'key0', 'team0'
+                )
+
+            compare(
+                '  load: serial -> thread pool',
+                lambda: load(1),
+                lambda: load(8),
+                number=20,
+            )
+
+
+if __name__ == '__main__':
+    main()
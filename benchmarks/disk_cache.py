@@ -0,0 +1,46 @@
+"""Cold start file loads: parsing the file vs reading the disk cache.
+
+Every new process parses its configuration files; with the disk cache
+enabled it loads the parsed data from the cache instead.
+
+Run from the repository root, with batconf and pyyaml installed::
+
+    python benchmarks/disk_cache.py
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from batconf.sources.disk_cache import DiskCache
+from batconf.sources.yaml import _load_yaml_file
+
+from _timing import compare
+
+
+def write_config(file_path: Path, n_sections: int) -> None:
+    """An environments file with ``n_sections`` sections of 10 options."""
+    lines = ['batconf:', '  default_env: dev', 'dev:']
+    for s in range(n_sections):
+        lines.append(f'  section{s}:')
+        lines += [f'    key{k}: value {s}.{k}' for k in range(10)]
+    file_path.write_text('\n'.join(lines) + '\n')
+
+
+def main() -> None:
+    print('parse the YAML file -> load from the disk cache')
+    with TemporaryDirectory() as tmp_dir:
+        cache = DiskCache(directory=Path(tmp_dir) / 'cache')
+        for n_sections in (10, 100, 1000):
+            file_path = Path(tmp_dir) / f'config{n_sections}.yaml'
+            write_config(file_path, n_sections)
+            cache.load(_load_yaml_file, file_path)
+            compare(
+                f'{n_sections * 10} options',
+                lambda: _load_yaml_file(file_path),
+                lambda: cache.load(_load_yaml_file, file_path),
+                number=20,
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""File source lookups: nested dict walk vs the flattened path index.
+
+The cost of walking nested mappings grows with the depth of the value,
+lookups in the index do not.
+
+Run from the repository root, with batconf installed::
+
+    python benchmarks/file_index.py
+"""
+
+from batconf import YamlSource
+
+from _timing import compare
+
+
+def nested_get(data: dict, key: str, path: str | None = None):
+    """Lookup equivalent to YamlSource.get before the index was added."""
+    parts = (*path.split('.'), *key.split('.')) if path else key.split('.')
+    conf = data
+    try:
+        for part in parts:
+            conf = conf[part]
+    except (KeyError, TypeError):
+        return None
+    return conf
+
+
+def nested_data(depth: int) -> tuple[dict, str]:
+    """A value nested ``depth`` mappings deep, and the path of its section."""
+    data: dict = {'key': 'value'}
+    for n in reversed(range(depth)):
+        data = {f'section{n}': data}
+    return data, '.'.join(f'section{n}' for n in range(depth))
+
+
+def main() -> None:
+    print('nested dict walk -> YamlSource.get (flattened index)')
+    for depth in (1, 4, 16, 64):
+        data, path = nested_data(depth)
+        source = YamlSource('bench.yaml', file_format='sections')
+        source.__dict__['_raw_data'] = data
+        source.compile([f'{path}.key'])
+        compare(
+            f'value at depth {depth}',
+            lambda: nested_get(data, 'key', path),
+            lambda: source.get('key', path),
+        )
+
+
+if __name__ == '__main__':
+    main()
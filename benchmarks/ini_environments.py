@@ -0,0 +1,51 @@
+"""INI environments files: ConfigParser vs the selective reader.
+
+Times reading the file and building the index of the selected environment.
+
+Run from the repository root, with batconf installed::
+
+    python benchmarks/ini_environments.py
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from batconf.sources.ini import (
+    _envs_index,
+    _load_ini_file,
+    _SelectiveReader,
+)
+
+from _timing import compare
+
+
+def write_config(file_path: Path, n_envs: int) -> None:
+    """``n_envs`` environments, each with 50 sections of 10 options."""
+    lines = ['[batconf]', 'default_env = env0']
+    for e in range(n_envs):
+        for s in range(50):
+            lines.append(f'[env{e}.section{s}]')
+            lines += [f'key{k} = value {e}.{s}.{k}' for k in range(10)]
+    file_path.write_text('\n'.join(lines) + '\n')
+
+
+def main() -> None:
+    print('ConfigParser -> selective reader')
+    with TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / 'config.ini'
+        for n_envs in (1, 5, 30):
+            write_config(file_path, n_envs)
+            reader = _SelectiveReader()
+
+            def full() -> dict[str, str]:
+                return _envs_index(_load_ini_file(file_path), 'env0')
+
+            def selective() -> dict[str, str]:
+                return _envs_index(reader(file_path), 'env0')
+
+            assert full() == selective()
+            compare(f'{n_envs} envs', full, selective, number=10)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""INI interpolation: the cost of each mode, and of interpolating lookups.
+
+Building the index applies interpolation once, when the file is loaded.
+``ConfigParser.get`` interpolates the value on every call.
+
+Run from the repository root, with batconf installed::
+
+    python benchmarks/ini_interpolation.py
+"""
+
+from configparser import ConfigParser
+
+from batconf.sources.ini import IniSource, _envs_index
+
+from _timing import compare
+
+
+def config_parser(interpolated: bool) -> ConfigParser:
+    """One environment with 50 sections of 10 options."""
+    url = 'http://%(host)s/' if interpolated else 'http://localhost/'
+    parser = ConfigParser()
+    parser.read_dict(
+        {
+            'DEFAULT': {'host': 'localhost'},
+            'dev': {},
+            **{
+                f'dev.section{s}': {f'key{k}': url for k in range(10)}
+                for s in range(50)
+            },
+        }
+    )
+    return parser
+
+
+def main() -> None:
+    print("build the index: interpolation='basic' -> other modes")
+    for interpolated in (False, True):
+        parser = config_parser(interpolated)
+        for mode in ('none', 'extended'):
+            compare(
+                f'{mode}, {"with" if interpolated else "no"} %(host)s',
+                lambda: _envs_index(parser, 'dev', 'basic'),
+                lambda: _envs_index(parser, 'dev', mode),
+                number=100,
+            )
+
+    print('lookups: ConfigParser.get -> IniSource.get')
+    for mode in ('none', 'basic', 'extended'):
+        parser = config_parser(interpolated=mode == 'basic')
+        source = IniSource('bench.ini', config_env='dev', interpolation=mode)
+        source.__dict__['_raw_data'] = parser
+        compare(
+            f'interpolation={mode!r}',
+            lambda: parser.get('dev.section0', 'key0'),
+            lambda: source.get('key0', 'section0'),
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Pre-fork workers: parsing the config files vs attaching shared memory.
+
+Times a worker's cold start, up to resolving every option, and measures
+the memory it allocates and keeps for the configuration data. The parsed
+file cache is cleared before each run, as it is in a freshly started
+worker; a forked worker would instead hold its own copy-on-write pages of
+the parent's parsed data, which reference counting soon copies.
+
+Run from the repository root, with batconf installed::
+
+    python benchmarks/shared_memory.py
+"""
+
+import tracemalloc
+
+from dataclasses import make_dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable
+
+from batconf import Configuration, IniSource, SourceList
+from batconf.sources.file import parsed_files
+from batconf.sources.shared_memory import SharedMemorySource, publish
+
+from _timing import compare
+
+
+def make_schema(n_sections: int) -> Any:
+    """A schema with ``n_sections`` sections of 10 options."""
+    section = make_dataclass('Section', [f'key{k}' for k in range(10)])
+    return make_dataclass(
+        'Schema', [(f'section{s}', section) for s in range(n_sections)]
+    )
+
+
+def write_config(file_path: Path, n_sections: int) -> None:
+    lines = []
+    for s in range(n_sections):
+        lines.append(f'[bench.section{s}]')
+        lines += [f'key{k} = value {s}.{k}' for k in range(10)]
+    file_path.write_text('\n'.join(lines) + '\n')
+
+
+def retained_bytes(start: Callable[[], Any]) -> int:
+    """Memory still allocated while the result of start is alive."""
+    tracemalloc.start()
+    result = start()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    print('parse config file -> attach shared memory')
+    with TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / 'config.ini'
+        for n_sections in (10, 100, 1000):
+            schema = make_schema(n_sections)
+            write_config(file_path, n_sections)
+
+            def parse() -> Any:
+                parsed_files.clear()
+                source = IniSource(str(file_path), 'sections')
+                cfg = Configuration(SourceList([source]), schema, 'bench')
+                cfg.resolve_all()
+                return source
+
+            source_list = SourceList([IniSource(str(file_path), 'sections')])
+            shm = publish(Configuration(source_list, schema, 'bench'))
+
+            def attach() -> Any:
+                source = SharedMemorySource(shm.name)
+                cfg = Configuration(SourceList([source]), schema, 'bench')
+                cfg.resolve_all()
+                return source
+
+            compare(f'{n_sections * 10} options', parse, attach, number=10)
+            print(
+                f'{"  retained bytes":<32}'
+                f' {retained_bytes(parse):9} -> {retained_bytes(attach):9}'
+                f'  (segment {shm.size} bytes, shared)'
+            )
+            shm.close()
+            shm.unlink()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Start-up: parsing the config files vs loading a compiled snapshot.
+
+Times what a new process does before its first lookup: read the config
+files, build the Configuration and resolve every option. The parsed file
+cache is cleared before each run, as it is empty in a new process.
+
+Run from the repository root, with batconf and pyyaml installed::
+
+    python benchmarks/snapshot_startup.py
+"""
+
+from dataclasses import make_dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from batconf import Configuration, IniSource, SourceList, YamlSource
+from batconf.sources.file import parsed_files
+from batconf.sources.snapshot import SnapshotSource, write_snapshot
+
+from _timing import compare
+
+
+def make_schema(n_sections: int) -> Any:
+    """A schema with ``n_sections`` sections of 10 options."""
+    section = make_dataclass('Section', [f'key{k}' for k in range(10)])
+    return make_dataclass(
+        'Schema', [(f'section{s}', section) for s in range(n_sections)]
+    )
+
+
+def write_configs(directory: Path, n_sections: int) -> None:
+    """Half the sections in an INI file, half in a YAML file."""
+    ini, yaml = [], ['bench:']
+    for s in range(n_sections):
+        if s % 2:
+            yaml.append(f'  section{s}:')
+            yaml += [f'    key{k}: value {s}.{k}' for k in range(10)]
+        else:
+            ini.append(f'[bench.section{s}]')
+            ini += [f'key{k} = value {s}.{k}' for k in range(10)]
+    (directory / 'config.ini').write_text('\n'.join(ini) + '\n')
+    (directory / 'config.yaml').write_text('\n'.join(yaml) + '\n')
+
+
+def main() -> None:
+    print('parse config files -> load snapshot')
+    with TemporaryDirectory() as tmp_dir:
+        directory = Path(tmp_dir)
+        snapshot_path = directory / 'bench.snapshot'
+        for n_sections in (10, 100, 1000):
+            schema = make_schema(n_sections)
+            write_configs(directory, n_sections)
+
+            def parse() -> dict[str, str]:
+                parsed_files.clear()
+                source_list = SourceList(
+                    [
+                        IniSource(str(directory / 'config.ini'), 'sections'),
+                        YamlSource(
+                            str(directory / 'config.yaml'), 'sections'
+                        ),
+                    ]
+                )
+                cfg = Configuration(source_list, schema, path='bench')
+                return cfg.resolve_all()
+
+            def snapshot() -> dict[str, str]:
+                source = SnapshotSource(snapshot_path, schema, 'bench')
+                cfg = Configuration(SourceList([source]), schema, 'bench')
+                return cfg.resolve_all()
+
+            parsed_files.clear()
+            write_snapshot(
+                snapshot_path,
+                SourceList(
+                    [
+                        IniSource(str(directory / 'config.ini'), 'sections'),
+                        YamlSource(
+                            str(directory / 'config.yaml'), 'sections'
+                        ),
+                    ]
+                ),
+                schema,
+                'bench',
+            )
+            assert parse() == snapshot()
+            compare(f'{n_sections * 10} options', parse, snapshot, number=10)
+
+
+if __name__ == '__main__':
+    main()
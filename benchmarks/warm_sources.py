@@ -0,0 +1,60 @@
+"""Loading the sources of a SourceList one at a time vs SourceList.warm.
+
+Each source stands for a config file on a slow network filesystem: loading
+it waits 20 ms for the file, then parses it. Loading them one at a time, as
+the first lookups do, takes the sum of their load times; warming them in a
+thread pool takes about the longest.
+
+Run from the repository root, with batconf installed::
+
+    python benchmarks/warm_sources.py
+"""
+
+import logging
+import time
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from batconf import IniSource, SourceList
+from batconf.source import load_source
+from batconf.sources.file import parsed_files
+
+from _timing import compare
+
+
+class NetworkIniSource(IniSource):
+    def load(self) -> None:
+        time.sleep(0.02)  # fetching the file
+        super().load()
+
+
+def main() -> None:
+    # each file source warns about the paths it does not have
+    logging.disable(logging.WARNING)
+    with TemporaryDirectory() as tmp_dir:
+        paths = []
+        for n in range(4):
+            path = Path(tmp_dir) / f'{n}.ini'
+            lines = [f'[team{n}]'] + [f'key{k} = v{k}' for k in range(1000)]
+            path.write_text('\n'.join(lines))
+            paths.append(str(path))
+
+        def source_list() -> SourceList:
+            parsed_files.clear()
+            return SourceList([NetworkIniSource(p, 'sections') for p in paths])
+
+        def serial() -> None:
+            for source in source_list()._sources:
+                load_source(source)
+
+        compare(
+            '4 sources: serial -> warm',
+            serial,
+            lambda: source_list().warm(),
+            number=5,
+        )
+
+
+if __name__ == '__main__':
+    main()
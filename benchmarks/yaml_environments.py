@@ -0,0 +1,63 @@
+"""Environments files: loading every environment vs only the selected one.
+
+Also reports the memory retained by the loaded data.
+
+Run from the repository root, with batconf and pyyaml installed::
+
+    python benchmarks/yaml_environments.py
+"""
+
+import tracemalloc
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from batconf.sources.yaml import _EnvironmentLoader, _yaml_file_loaders
+
+from _timing import compare
+
+
+def write_config(file_path: Path, n_envs: int) -> None:
+    """``n_envs`` environments, each with 50 sections of 10 options."""
+    lines = ['batconf:', '  default_env: env0']
+    for e in range(n_envs):
+        lines.append(f'env{e}:')
+        for s in range(50):
+            lines.append(f'  section{s}:')
+            lines += [f'    key{k}: value {e}.{s}.{k}' for k in range(10)]
+    file_path.write_text('\n'.join(lines) + '\n')
+
+
+def retained_kib(load) -> float:
+    tracemalloc.start()
+    data = load()  # noqa: F841, kept alive while measuring
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / 1024
+
+
+def main() -> None:
+    print('load every environment -> load the selected environment')
+    with TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / 'config.yaml'
+        write_config(file_path, n_envs=30)
+        for yaml_loader in ('python', 'c'):
+            full = _yaml_file_loaders[yaml_loader]
+            selective = _EnvironmentLoader('env0', yaml_loader)
+            assert selective(file_path)['env0'] == full(file_path)['env0']
+
+            compare(
+                f'yaml_loader={yaml_loader!r}, 30 envs',
+                lambda: full(file_path),
+                lambda: selective(file_path),
+                number=3,
+            )
+            print(
+                f'{"  retained memory":<32} '
+                f'{retained_kib(lambda: full(file_path)):9.0f} KiB -> '
+                f'{retained_kib(lambda: selective(file_path)):6.0f} KiB'
+            )
+
+
+if __name__ == '__main__':
+    main()
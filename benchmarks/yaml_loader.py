@@ -0,0 +1,50 @@
+"""YAML parse throughput: the pure-Python parser vs libyaml.
+
+Both parsers are checked to load identical, all-string, data before they
+are timed.
+
+Run from the repository root, with batconf and pyyaml (built with libyaml)
+installed::
+
+    python benchmarks/yaml_loader.py
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from batconf.sources.yaml import _load_yaml_file_c, _load_yaml_file_python
+
+from _timing import compare
+
+
+def write_config(file_path: Path, n_sections: int) -> None:
+    """An environments file with ``n_sections`` sections of 10 options."""
+    lines = ['batconf:', '  default_env: dev', 'dev:']
+    for s in range(n_sections):
+        lines.append(f'  section{s}:')
+        lines += [f'    key{k}: {s * 10 + k}' for k in range(10)]
+    file_path.write_text('\n'.join(lines) + '\n')
+
+
+def main() -> None:
+    print('yaml_loader="python" -> yaml_loader="c"')
+    with TemporaryDirectory() as tmp_dir:
+        for n_sections in (10, 100, 1000):
+            file_path = Path(tmp_dir) / f'config{n_sections}.yaml'
+            write_config(file_path, n_sections)
+
+            parsed = _load_yaml_file_python(file_path)
+            assert parsed == _load_yaml_file_c(file_path), 'parity'
+            assert parsed['dev']['section0']['key1'] == '1', 'all strings'
+
+            size_kib = file_path.stat().st_size / 1024
+            compare(
+                f'{n_sections * 10} options ({size_kib:.0f} KiB)',
+                lambda: _load_yaml_file_python(file_path),
+                lambda: _load_yaml_file_c(file_path),
+                number=10,
+            )
+
+
+if __name__ == '__main__':
+    main()
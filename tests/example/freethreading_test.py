@@ -1,7 +1,14 @@
 from unittest import TestCase
+from unittest.mock import patch
 
 from os import environ
 from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Event
+from time import sleep
+
+from batconf import ConfigSingleton
+from batconf.sources import ini
+from batconf.sources.file import parsed_files
 
 from project.conf import get_config
 from project.submodule.client import MyClient
@@ -55,3 +62,62 @@ class ThreadSafetyTests(TestCase):
             for future in futures:
                 ret = future.result()
                 print(ret)
+
+    def test_cold_source_is_parsed_once(t):
+        """Threads which look up values from a source which has not loaded
+        its file yet wait for one of them to parse it.
+        """
+        load_ini = ini._load_ini
+
+        def slow_load_ini(**kwargs):
+            # widen the race, also on builds with a GIL
+            sleep(0.01)
+            return load_ini(**kwargs)
+
+        patcher = patch.object(ini, '_load_ini', side_effect=slow_load_ini)
+        load = patcher.start()
+        t.addCleanup(patcher.stop)
+
+        n_threads = 20
+        for _ in range(20):
+            # a new source, and no parsed file to share
+            cfg = get_config()
+            parsed_files.clear()
+            load.reset_mock()
+            barrier = Barrier(n_threads, timeout=10)
+
+            def worker() -> str:
+                # every thread hits the cold source at once
+                barrier.wait()
+                return cfg.clients.clientA.key1
+
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                futures = [executor.submit(worker) for _ in range(n_threads)]
+                values = {future.result() for future in futures}
+
+            t.assertEqual({'config.ini: clientA.key1'}, values)
+            t.assertEqual(1, load.call_count)
+
+    def test_reload_while_reading(t):
+        """Readers see the old or the new Configuration during a reload."""
+        cfg = ConfigSingleton(get_config)
+        stop = Event()
+
+        def reader() -> None:
+            generation = 0
+            while not stop.is_set():
+                t.assertEqual(
+                    cfg.clients.clientA.key1, 'config.ini: clientA.key1'
+                )
+                # generations only move forward
+                t.assertGreaterEqual(cfg.generation, generation)
+                generation = cfg.generation
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(reader) for _ in range(8)]
+            generations = [cfg.reload() for _ in range(20)]
+            stop.set()
+            for future in futures:
+                future.result()
+
+        t.assertEqual(list(range(1, 21)), generations)
@@ -221,6 +221,34 @@ class FreeFormConfigTreeTests(TestCase):
         # the schema may provide default values
         t.assertEqual(cfg.opt3, 'opt3 default')
 
+    @patch.dict(
+        'batconf.sources.env.os.environ',
+        {'CONFIGURATION_TEST_L1A_VALUE': 'ENVIRONMENT l1a value'},
+    )
+    def test_resolve_all(t) -> None:
+        config_file_name = path.join(t.this_dir, 'data', 'envs.config.ini')
+        cfg = Configuration(
+            source_list=SourceList(
+                [EnvConfig(), IniConfig(file_path=config_file_name)]
+            ),
+            config_class=RootConfigSchema,
+        )
+
+        resolved = cfg.resolve_all()
+
+        t.assertEqual(resolved['l1a.value'], 'ENVIRONMENT l1a value')
+        t.assertEqual(resolved['subsection.doc'], 'config test subsection')
+        t.assertEqual(resolved['value'], 'root config value')
+        # options with no value are omitted
+        t.assertNotIn('nodefault', resolved)
+        # every value matches attribute access
+        for dotted_path, value in resolved.items():
+            with t.subTest(dotted_path):
+                node = cfg
+                for name in dotted_path.split('.'):
+                    node = getattr(node, name)
+                t.assertEqual(value, node)
+
     @patch.dict(
         'batconf.sources.env.os.environ',
         {
@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+from os import path
+from shutil import copy
+from tempfile import TemporaryDirectory
+
+from batconf import DirectorySource, SourceList
+from batconf.sources.directory import fragment_sources
+
+_TOML_INSTALLED = True
+try:
+    import tomllib  # type: ignore[import-not-found]  # noqa: F401
+except ImportError:
+    try:
+        import toml  # noqa: F401
+    except ImportError:
+        _TOML_INSTALLED = False
+
+_PYYAML_INSTALLED = True
+try:
+    import yaml  # noqa: F401
+except ImportError:
+    _PYYAML_INSTALLED = False
+
+
+_DATA_DIR = path.join(path.dirname(path.realpath(__file__)), 'data')
+
+_EXTENSIONS = [
+    ext
+    for ext, installed in [
+        ('ini', True),
+        ('toml', _TOML_INSTALLED),
+        ('yaml', _PYYAML_INSTALLED),
+    ]
+    if installed
+]
+
+
+class DirectorySourceIntegrationTests(TestCase):
+    def setUp(t):
+        tmp_dir = TemporaryDirectory()
+        t.addCleanup(tmp_dir.cleanup)
+        t.directory = tmp_dir.name
+
+        # one fragment of each installed format, ex: 00-sections.ini
+        t.fragments = []
+        for n, ext in enumerate(_EXTENSIONS):
+            fragment = path.join(t.directory, f'{n:02}-sections.{ext}')
+            copy(path.join(_DATA_DIR, f'sections.config.{ext}'), fragment)
+            t.fragments.append(fragment)
+
+    def test_same_values_as_a_source_list(t):
+        """One probe finds the value a SourceList of every file finds."""
+        src = DirectorySource(t.directory)
+        source_list = SourceList(
+            [
+                fragment_sources[path.splitext(f)[1]](
+                    file_path=f, file_format='sections'
+                )
+                for f in reversed(t.fragments)
+            ]
+        )
+
+        t.assertTrue(src.paths())
+        for p in src.paths():
+            with t.subTest(p):
+                section, _, key = p.rpartition('.')
+                t.assertEqual(source_list.get(key, section), src.get(p))
+
+    def test_origin(t):
+        src = DirectorySource(t.directory)
+        t.assertEqual(t.fragments[-1], str(src.origin('sec0.sub0.value0')))
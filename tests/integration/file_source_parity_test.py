@@ -1,4 +1,7 @@
+import pickle
+
 from unittest import TestCase
+from copy import deepcopy
 from os import path
 
 from batconf import IniSource, TomlSource, YamlSource
@@ -137,6 +140,13 @@ class FileSourceValueParityTests(TestCase):
                 t.assertEqual(src.get('root'), 'is a valid key')
                 t.assertIsNone(src.get('missing_key'))
 
+    def test_loaded_sources_copy_and_pickle(t):
+        for src in t.env_sources:
+            with t.subTest(source=type(src).__name__):
+                t.assertEqual('our testing environment', src.get('doc'))
+                for clone in (deepcopy(src), pickle.loads(pickle.dumps(src))):
+                    t.assertEqual(src.get('doc'), clone.get('doc'))
+
     def test_path_past_terminal_string_returns_None(t):
         """Traversing past a leaf string value returns None, not an error.
 
@@ -165,3 +175,35 @@ class FileSourceValueParityTests(TestCase):
                             cm.records[0].getMessage(),
                             f'Config path {path}.{key} does not exist',
                         )
+
+
+class IniReaderParityTests(TestCase):
+    """The selective INI reader returns the same values as ConfigParser."""
+
+    def test_ini_readers_parity(t):
+        for file_format in FILE_FORMATS:
+            file_path = _file_path(IniSource, file_format)
+            full, selective = (
+                IniSource(file_path, file_format, ini_reader=ini_reader)
+                for ini_reader in ('configparser', 'selective')
+            )
+            with t.subTest(file_format=file_format):
+                t.assertEqual(full.paths(), selective.paths())
+                t.assertEqual(
+                    full.get_many(full.paths()),
+                    selective.get_many(full.paths()),
+                )
+                t.assertEqual(full._config_env, selective._config_env)
+
+    def test_selected_environment(t):
+        file_path = _file_path(IniSource, 'environments')
+        for config_env in ('test', 'production'):
+            full, selective = (
+                IniSource(file_path, config_env=config_env, ini_reader=r)
+                for r in ('configparser', 'selective')
+            )
+            with t.subTest(config_env=config_env):
+                t.assertEqual(
+                    full.get_many(full.paths()),
+                    selective.get_many(full.paths()),
+                )
@@ -3,13 +3,19 @@ import warnings
 from unittest import TestCase
 from unittest.mock import patch, Mock
 
+from configparser import (
+    InterpolationMissingOptionError,
+    InterpolationSyntaxError,
+)
 from os import path
+from tempfile import TemporaryDirectory
 
 import warnings as _warnings_module
 with _warnings_module.catch_warnings():
     _warnings_module.simplefilter('ignore', DeprecationWarning)
     from batconf.sources.ini import IniConfig
-from batconf.sources.ini import IniSource
+from batconf.sources.ini import IniSource, ConfigParser
+from batconf.sources.file import parsed_files
 from batconf.types import FILE_FORMATS
 
 
@@ -191,6 +197,153 @@ class IniSourceIntegrationTests(TestCase):
         # root is a valid key, in spite of the default section name
         t.assertEqual('is a valid key', ins.get('root'))
 
+    def test_sources_share_the_parsed_file(t):
+        t.config_file_path = path.join(t.this_dir, 'data/envs.config.ini')
+        test_env = IniSource(file_path=t.config_file_path)
+        production = IniSource(
+            file_path=t.config_file_path, config_env='production'
+        )
+
+        t.assertIs(test_env._data, production._data)
+        # the file is only parsed once, each source selects its environment
+        t.assertEqual('our testing environment', test_env.get('doc'))
+        t.assertNotEqual(test_env.get('doc'), production.get('doc'))
+
+    def test_changed_file_is_parsed_again(t):
+        with TemporaryDirectory() as tmp_dir:
+            file_path = path.join(tmp_dir, 'config.ini')
+            with open(file_path, 'w') as f:
+                f.write('[sec]\nkey = first\n')
+            first = IniSource(file_path=file_path, file_format='sections')
+            t.assertEqual('first', first.get('sec.key'))
+
+            with open(file_path, 'w') as f:
+                f.write('[sec]\nkey = changed\n')
+            changed = IniSource(file_path=file_path, file_format='sections')
+            t.assertEqual('changed', changed.get('sec.key'))
+            # sources which already loaded the file keep their data
+            t.assertEqual('first', first.get('sec.key'))
+
+    def test_interpolation(t):
+        with TemporaryDirectory() as tmp_dir:
+            file_path = path.join(tmp_dir, 'config.ini')
+            with open(file_path, 'w') as f:
+                f.write(
+                    '[batconf]\ndefault_env = dev\n'
+                    '[DEFAULT]\nhost = localhost\n'
+                    '[dev]\nurl = http://%(host)s/\nport = 80\n'
+                    '[dev.client]\naddress = ${dev:url}:${dev:port}\n'
+                )
+            cases = {
+                'none': ('http://%(host)s/', '${dev:url}:${dev:port}'),
+                'basic': ('http://localhost/', '${dev:url}:${dev:port}'),
+                'extended': ('http://%(host)s/', 'http://%(host)s/:80'),
+            }
+            for interpolation, (url, address) in cases.items():
+                for ini_reader in ('configparser', 'selective'):
+                    with t.subTest(interpolation, ini_reader=ini_reader):
+                        ins = IniSource(
+                            file_path=file_path,
+                            ini_reader=ini_reader,
+                            interpolation=interpolation,
+                        )
+                        t.assertEqual(url, ins.get('url'))
+                        t.assertEqual(address, ins.get('client.address'))
+
+    def test_interpolation_errors(t):
+        """An option which fails to interpolate is an error only when it
+        is looked up, ex: a logging config in the same file.
+        """
+        with TemporaryDirectory() as tmp_dir:
+            sections_path = path.join(tmp_dir, 'sections.ini')
+            with open(sections_path, 'w') as f:
+                f.write(
+                    '[DEFAULT]\ndkey = dval\n'
+                    '[dev.app]\nkey1 = value1\n'
+                    '[formatter_generic]\n'
+                    'format = %(asctime)s %(message)s\n'
+                )
+            envs_path = path.join(tmp_dir, 'envs.ini')
+            with open(envs_path, 'w') as f:
+                f.write('[dev]\nkey1 = value1\nbad = 100%\n')
+
+            for ini_reader in ('configparser', 'selective'):
+                with t.subTest('sections', ini_reader=ini_reader):
+                    ins = IniSource(
+                        file_path=sections_path,
+                        file_format='sections',
+                        ini_reader=ini_reader,
+                    )
+                    t.assertEqual('value1', ins.get('key1', 'dev.app'))
+                    t.assertEqual('dval', ins.get('dkey', 'dev.app'))
+                    with t.assertRaises(InterpolationMissingOptionError):
+                        ins.get('format', 'formatter_generic')
+
+                with t.subTest('environments', ini_reader=ini_reader):
+                    ins = IniSource(
+                        file_path=envs_path,
+                        config_env='dev',
+                        ini_reader=ini_reader,
+                    )
+                    t.assertEqual('value1', ins.get('key1'))
+                    with t.assertRaises(InterpolationSyntaxError):
+                        ins.get('bad')
+
+    def test_sections_default(t):
+        """The DEFAULT section is looked up like any other section."""
+        with TemporaryDirectory() as tmp_dir:
+            file_path = path.join(tmp_dir, 'config.ini')
+            with open(file_path, 'w') as f:
+                f.write('[DEFAULT]\ndkey = dval\n[sec]\nkey = v\n')
+            ins = IniSource(file_path=file_path, file_format='sections')
+            t.assertEqual('dval', ins.get('dkey', 'DEFAULT'))
+            t.assertEqual('dval', ins.get('dkey', 'sec'))
+            t.assertIsNone(ins.get('dkey'))
+
+    def test_disk_cache(t):
+        t.addCleanup(parsed_files.disable_disk_cache)
+        t.addCleanup(parsed_files.clear)
+        parsed_files.clear()
+
+        with TemporaryDirectory() as tmp_dir:
+            disk_cache = parsed_files.enable_disk_cache(tmp_dir)
+            t.config_file_path = path.join(t.this_dir, 'data/envs.config.ini')
+            ins = IniSource(file_path=t.config_file_path)
+            t.assertEqual('our testing environment', ins.get('doc'))
+
+            # a new process only has the disk cache
+            parsed_files.clear()
+            with patch.object(
+                ConfigParser, 'read', side_effect=AssertionError('parsed')
+            ):
+                cached = IniSource(file_path=t.config_file_path)
+                t.assertEqual(ins._index.values, cached._index.values)
+            disk_cache.clear()
+
+    def test_disk_cache_raw_percent_values(t):
+        """Values which basic interpolation rejects, ex: a bare %, are
+        restored from the disk cache by other processes.
+        """
+        t.addCleanup(parsed_files.disable_disk_cache)
+        t.addCleanup(parsed_files.clear)
+
+        with TemporaryDirectory() as tmp_dir:
+            file_path = path.join(tmp_dir, 'config.ini')
+            with open(file_path, 'w') as f:
+                f.write('[prod]\n[prod.app]\nkey1 = 100%\n')
+
+            for process in ('first', 'second'):
+                with t.subTest(process):
+                    # each process has its own cache instance
+                    parsed_files.clear()
+                    parsed_files.enable_disk_cache(path.join(tmp_dir, 'c'))
+                    ins = IniSource(
+                        file_path=file_path,
+                        config_env='prod',
+                        interpolation='none',
+                    )
+                    t.assertEqual('100%', ins.get('key1', 'app'))
+
 
 class IniSourceMissingFileTests(TestCase):
     """Test configurable behavior when the specified config file is missing."""
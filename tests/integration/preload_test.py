@@ -0,0 +1,71 @@
+import multiprocessing
+
+from unittest import TestCase, skipUnless
+
+from dataclasses import dataclass
+from os import path
+
+from batconf import ConfigSingleton, Configuration, IniSource, SourceList
+
+
+_DATA_DIR = path.join(path.dirname(path.realpath(__file__)), 'data')
+_FORK = 'fork' in multiprocessing.get_all_start_methods()
+
+
+@dataclass
+class Sub0:
+    value0: str
+
+
+@dataclass
+class Sec0Schema:
+    sub0: Sub0
+
+
+def get_config() -> Configuration:
+    file_path = path.join(_DATA_DIR, 'sections.config.ini')
+    return Configuration(
+        SourceList([IniSource(file_path, 'sections')]),
+        Sec0Schema,
+        path='sec0',
+    )
+
+
+def report_state(cfg: ConfigSingleton, conn) -> None:
+    (source,) = cfg._config_sources._sources
+    conn.send(
+        [
+            '_index' in source.__dict__,
+            'sub0' in cfg._sub_configs,
+            cfg.sub0.value0,
+        ]
+    )
+    conn.close()
+
+
+class PreloadIntegrationTests(TestCase):
+    def test_preload(t):
+        cfg = ConfigSingleton(get_config)
+        timings = cfg.preload()
+
+        t.assertEqual(1, len(timings.sources))
+        t.assertEqual(2, timings.nodes)
+        t.assertEqual(1, timings.values)
+        t.assertGreater(timings.total_ns, 0)
+
+    @skipUnless(_FORK, 'requires the fork start method')
+    def test_forked_workers_inherit_the_preloaded_configuration(t):
+        cfg = ConfigSingleton(get_config)
+        cfg.preload()
+
+        context = multiprocessing.get_context('fork')
+        parent_conn, child_conn = context.Pipe()
+        worker = context.Process(target=report_state, args=(cfg, child_conn))
+        worker.start()
+        state = parent_conn.recv()
+        worker.join()
+
+        t.assertEqual(
+            [True, True, 'sections.config.ini :: sec0.sub0 :: value0'],
+            state,
+        )
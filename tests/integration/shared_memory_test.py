@@ -0,0 +1,74 @@
+import multiprocessing
+
+from unittest import TestCase, skipUnless
+
+from dataclasses import dataclass
+from os import path
+
+from batconf import Configuration, IniSource, SourceList
+from batconf.sources.shared_memory import SharedMemorySource, publish
+
+
+_DATA_DIR = path.join(path.dirname(path.realpath(__file__)), 'data')
+_FORK = 'fork' in multiprocessing.get_all_start_methods()
+
+
+@dataclass
+class Sub0:
+    value0: str
+    schema_default: str = 'from the schema'
+
+
+@dataclass
+class Sec0Schema:
+    sub0: Sub0
+
+
+def read_value(name: str, conn) -> None:
+    source = SharedMemorySource(name)
+    cfg = Configuration(SourceList([source]), Sec0Schema, path='sec0')
+    conn.send([cfg.sub0.value0, cfg.sub0.schema_default])
+    source.close()
+    conn.close()
+
+
+class SharedMemoryIntegrationTests(TestCase):
+    def setUp(t):
+        file_path = path.join(_DATA_DIR, 'sections.config.ini')
+        t.cfg = Configuration(
+            SourceList([IniSource(file_path, 'sections')]),
+            Sec0Schema,
+            path='sec0',
+        )
+        t.shm = publish(t.cfg)
+        t.addCleanup(t.shm.unlink)
+        t.addCleanup(t.shm.close)
+
+    @skipUnless(_FORK, 'requires the fork start method')
+    def test_forked_workers(t):
+        """Workers read the values the parent published."""
+        context = multiprocessing.get_context('fork')
+        for _ in range(2):
+            parent_conn, child_conn = context.Pipe()
+            worker = context.Process(
+                target=read_value, args=(t.shm.name, child_conn)
+            )
+            worker.start()
+            values = parent_conn.recv()
+            worker.join()
+
+            t.assertEqual(0, worker.exitcode)
+            t.assertEqual(
+                [
+                    'sections.config.ini :: sec0.sub0 :: value0',
+                    'from the schema',
+                ],
+                values,
+            )
+
+        with t.subTest('the segment outlives the workers'):
+            source = SharedMemorySource(t.shm.name)
+            t.addCleanup(source.close)
+            t.assertEqual(
+                t.cfg.sub0.value0, source.get('value0', 'sec0.sub0')
+            )
@@ -0,0 +1,95 @@
+from unittest import TestCase
+
+from dataclasses import dataclass
+from os import path, utime
+from shutil import copy
+from tempfile import TemporaryDirectory
+
+from batconf import Configuration, SnapshotSource, SourceList
+from batconf.sources.directory import fragment_sources
+from batconf.sources.snapshot import write_snapshot
+
+_TOML_INSTALLED = True
+try:
+    import tomllib  # type: ignore[import-not-found]  # noqa: F401
+except ImportError:
+    try:
+        import toml  # noqa: F401
+    except ImportError:
+        _TOML_INSTALLED = False
+
+_PYYAML_INSTALLED = True
+try:
+    import yaml  # noqa: F401
+except ImportError:
+    _PYYAML_INSTALLED = False
+
+
+_DATA_DIR = path.join(path.dirname(path.realpath(__file__)), 'data')
+
+_EXTENSIONS = [
+    ext
+    for ext, installed in [
+        ('ini', True),
+        ('toml', _TOML_INSTALLED),
+        ('yaml', _PYYAML_INSTALLED),
+    ]
+    if installed
+]
+
+
+@dataclass
+class Sub0:
+    value0: str
+    schema_default: str = 'from the schema'
+
+
+@dataclass
+class Sec0Schema:
+    sub0: Sub0
+
+
+class SnapshotIntegrationTests(TestCase):
+    def setUp(t):
+        tmp_dir = TemporaryDirectory()
+        t.addCleanup(tmp_dir.cleanup)
+        t.directory = tmp_dir.name
+        t.snapshot_path = path.join(t.directory, 'config.snapshot')
+
+    def source_list(t, ext: str) -> SourceList:
+        file_path = path.join(t.directory, f'sections.config.{ext}')
+        copy(path.join(_DATA_DIR, f'sections.config.{ext}'), file_path)
+        return SourceList(
+            [fragment_sources[f'.{ext}'](file_path, 'sections')]
+        )
+
+    def configuration(t, source_list: SourceList) -> Configuration:
+        return Configuration(source_list, Sec0Schema, path='sec0')
+
+    def test_same_values_as_the_file_sources(t):
+        for ext in _EXTENSIONS:
+            with t.subTest(ext):
+                source_list = t.source_list(ext)
+                write_snapshot(
+                    t.snapshot_path, source_list, Sec0Schema, 'sec0'
+                )
+                snapshot = SnapshotSource(t.snapshot_path, Sec0Schema, 'sec0')
+
+                t.assertEqual(
+                    t.configuration(source_list).resolve_all(),
+                    t.configuration(SourceList([snapshot])).resolve_all(),
+                )
+                cfg = t.configuration(SourceList([snapshot]))
+                t.assertEqual(
+                    f'sections.config.{ext} :: sec0.sub0 :: value0',
+                    cfg.sub0.value0,
+                )
+                t.assertEqual('from the schema', cfg.sub0.schema_default)
+
+    def test_stale_snapshot(t):
+        source_list = t.source_list('ini')
+        write_snapshot(t.snapshot_path, source_list, Sec0Schema, 'sec0')
+        utime(path.join(t.directory, 'sections.config.ini'), ns=(0, 0))
+
+        with t.assertRaises(ValueError):
+            SnapshotSource(t.snapshot_path, Sec0Schema, 'sec0')
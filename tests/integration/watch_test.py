@@ -0,0 +1,109 @@
+from unittest import TestCase
+
+from dataclasses import dataclass
+from os import path, remove, replace
+from tempfile import TemporaryDirectory
+
+from batconf.manager import Configuration, SourceList
+from batconf.sources.file import parsed_files
+from batconf.sources.ini import IniSource
+from batconf.sources.toml import TomlSource
+from batconf.sources.watch import FileWatcher
+
+
+_TOML_INSTALLED = True
+try:
+    import tomllib  # type: ignore[import-not-found]  # noqa: F401
+except ImportError:
+    try:
+        import toml  # noqa: F401
+    except ImportError:
+        _TOML_INSTALLED = False
+
+
+@dataclass
+class ClientConfig:
+    host: str
+    port: str = '80'
+
+
+def write(file_path: str, text: str) -> None:
+    with open(file_path, 'w') as f:
+        f.write(text)
+
+
+class FileWatcherIntegrationTests(TestCase):
+    def setUp(t):
+        tmp_dir = TemporaryDirectory()
+        t.addCleanup(tmp_dir.cleanup)
+        t.tmp_dir = tmp_dir.name
+
+    def test_cached_configuration_sees_reloaded_files(t):
+        file_path = path.join(t.tmp_dir, 'config.ini')
+        write(file_path, '[client]\nhost = first\n')
+        source_list = SourceList(
+            [IniSource(file_path=file_path, file_format='sections')]
+        )
+        cfg = Configuration(
+            source_list, ClientConfig, path='client', cache=True
+        )
+        watcher = FileWatcher(source_list, debounce=0)
+        watcher.check()
+        t.assertEqual('first', cfg.host)
+
+        # a new inode, as written by editors and deployment tools
+        write(f'{file_path}.new', '[client]\nhost = second\nport = 8080\n')
+        t.assertEqual('first', cfg.host)
+        replace(f'{file_path}.new', file_path)
+
+        t.assertEqual(1, len(watcher.check()))
+        t.assertEqual('second', cfg.host)
+        t.assertEqual('8080', cfg.port)
+
+    def test_invalid_files_keep_the_old_data(t):
+        file_path = path.join(t.tmp_dir, 'config.ini')
+        write(file_path, '[batconf]\ndefault_env = dev\n[dev]\nkey = v0\n')
+        source = IniSource(file_path=file_path)
+        watcher = FileWatcher(SourceList([source]), debounce=0)
+        watcher.check()
+        t.assertEqual('v0', source.get('key'))
+
+        write(file_path, '[batconf]\ndefault_env = dev\nnot an option\n')
+        with t.assertLogs('batconf.sources.watch', level='ERROR'):
+            t.assertEqual([], watcher.check())
+        t.assertEqual('v0', source.get('key'))
+
+    def test_removed_files_keep_the_old_data(t):
+        file_path = path.join(t.tmp_dir, 'config.ini')
+        write(file_path, '[batconf]\ndefault_env = dev\n[dev]\nkey = v0\n')
+        source = IniSource(file_path=file_path)
+        watcher = FileWatcher(SourceList([source]), debounce=0)
+        watcher.check()
+        t.assertEqual('v0', source.get('key'))
+
+        remove(file_path)
+        with t.assertLogs('batconf.sources.watch', level='WARNING'):
+            t.assertEqual([], watcher.check())
+        t.assertEqual('v0', source.get('key'))
+
+    def test_reload_file_sources(t):
+        sources = [('ini', IniSource, '[sec]\nkey = {}\n')]
+        if _TOML_INSTALLED:
+            sources.append(('toml', TomlSource, '[sec]\nkey = "{}"\n'))
+
+        for ext, source_class, template in sources:
+            with t.subTest(source_class.__name__):
+                file_path = path.join(t.tmp_dir, f'config.{ext}')
+                write(file_path, template.format('v0'))
+                source = source_class(
+                    file_path=file_path, file_format='sections'
+                )
+                t.assertEqual('v0', source.get('sec.key'))
+                t.assertFalse(source.reload())
+                # unchanged files are not read again
+                parsed_files.clear()
+                t.assertFalse(source.reload())
+
+                write(file_path, template.format('v1 changed'))
+                t.assertTrue(source.reload())
+                t.assertEqual('v1 changed', source.get('sec.key'))
@@ -3,7 +3,17 @@ from unittest.mock import patch, Mock
 
 from os import path
 
-from batconf.sources.yaml import YamlSource
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+
+from batconf.sources.yaml import (
+    YamlSource,
+    _load_yaml_file,
+    _load_yaml_file_c,
+    _load_yaml_file_python,
+    _EnvironmentLoader,
+)
 from batconf.types import FILE_FORMATS
 
 
@@ -13,6 +23,8 @@ try:
 except ImportError:
     _PYYAML_INSTALLED = False
 
+_LIBYAML_INSTALLED = _PYYAML_INSTALLED and hasattr(yaml, 'CBaseLoader')
+
 
 @skipIf(not _PYYAML_INSTALLED, 'optional pyyaml module not installed')
 class YamlSourceIntegrationTests(TestCase):
@@ -55,6 +67,106 @@ class YamlSourceIntegrationTests(TestCase):
         ys = YamlSource(file_path=t.config_file_path, config_env='production')
         t.assertEqual('Options for the production environment', ys.get('doc'))
 
+    def test_yaml_loader(t):
+        """Every YAML parser loads the same data, with all-string values"""
+        for file_name in (
+            'config.yaml',
+            'envs.config.yaml',
+            'sections.config.yaml',
+            'flat.config.yaml',
+        ):
+            with t.subTest(file_name):
+                file_path = path.join(t.this_dir, 'data', file_name)
+                python = _load_yaml_file_python(Path(file_path))
+                t.assertEqual(python, _load_yaml_file(Path(file_path)))
+                if _LIBYAML_INSTALLED:
+                    t.assertEqual(python, _load_yaml_file_c(Path(file_path)))
+
+        with t.subTest('selected per source'):
+            t.config_file_path = path.join(t.this_dir, 'data/flat.config.yaml')
+            ys = YamlSource(
+                file_path=t.config_file_path,
+                file_format='flat',
+                yaml_loader='python',
+            )
+            t.assertEqual('0', ys.get('int'))
+
+
+@skipIf(not _PYYAML_INSTALLED, 'optional pyyaml module not installed')
+class EnvironmentLoaderIntegrationTests(TestCase):
+    """Selective loading gives the same result as loading every environment,
+    then discarding the others.
+    """
+
+    DOCUMENTS = {
+        'batconf first': """
+            batconf:
+                default_env: dev
+            dev:
+                key: dev value
+                list: [1, {k: v}]
+            prod:
+                key: prod value
+        """,
+        'batconf last': """
+            dev: {key: dev value}
+            prod: {key: prod value}
+            batconf: {default_env: dev}
+        """,
+        'anchors within an environment': """
+            batconf: {default_env: dev}
+            dev:
+                base: &base {host: localhost, port: 8080}
+                client: *base
+        """,
+        'aliases to another environment': """
+            batconf: {default_env: dev}
+            prod: &prod {key: prod value}
+            dev:
+                <<: *prod
+                other: *prod
+        """,
+        'explicit tags and multi-line scalars': """
+            batconf: {default_env: dev}
+            dev:
+                int: !!int 1
+                text: |
+                    line 0
+                    line 1
+        """,
+    }
+
+    def test_matches_full_load(t):
+        with TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / 'config.yaml'
+            for name, document in t.DOCUMENTS.items():
+                file_path.write_text(dedent(document))
+                full = _load_yaml_file_python(file_path)
+                for env in ('dev', 'prod', None):
+                    for yaml_loader in ('auto', 'python'):
+                        with t.subTest(name, env=env, loader=yaml_loader):
+                            selected = env or full['batconf']['default_env']
+                            t.assertEqual(
+                                {
+                                    k: v
+                                    for k, v in full.items()
+                                    if k in ('batconf', selected)
+                                },
+                                _EnvironmentLoader(env, yaml_loader)(
+                                    file_path
+                                ),
+                            )
+
+    def test_yaml_source(t):
+        t.config_file_path = path.join(t.this_dir, 'data/envs.config.yaml')
+        ys = YamlSource(file_path=t.config_file_path, config_env='production')
+
+        t.assertEqual(['batconf', 'production'], list(ys._raw_data))
+        t.assertEqual('Options for the production environment', ys.get('doc'))
+
+    def setUp(t):
+        t.this_dir = path.dirname(path.realpath(__file__))
+
 
 @skipIf(not _PYYAML_INSTALLED, 'optional pyyaml module not installed')
 class YamlSourceMissingFileTests(TestCase):